@@ -0,0 +1,46 @@
+"""
+ASGI entry point for the Golden Raspberry Awards application.
+
+This script initializes environment variables and exposes the Flask application
+as an ASGI application, loading the dataset and warming up the caches in the background.
+Serve it with `uvicorn asgi:app`, or run this script to start uvicorn with default
+settings. The Flask server started by index.py stays available.
+"""
+from os import environ
+
+# Configure environment variables for the application
+environ["DATABASE_URL"] = "sqlite:///:memory:"  # Using in-memory SQLite database
+environ["INITIAL_DATASET_PATH"] = "Movielist.csv"  # Path to the CSV dataset file
+environ["CSV_DELIMITER"] = ";"  # Delimiter used in the CSV file
+environ["DATASETS"] = ""  # Named datasets served besides the main one, as "name=path,name=path"
+environ["DATASET_MEMORY_BUDGET_MB"] = "512"  # Memory for loaded named datasets, with their indexes and cached responses, before the least recently used is evicted
+environ["ADMISSION_MAX_CONCURRENT"] = "8"  # Award requests computing at the same time
+environ["ADMISSION_MAX_QUEUE"] = "64"  # Award requests waiting for a slot before new ones get 503
+environ["ADMISSION_QUEUE_TIMEOUT_MS"] = "1000"  # Maximum wait for a slot before a request gets 503
+environ["ADMISSION_RETRY_AFTER"] = "1"  # Seconds sent in the Retry-After header of the 503 responses
+environ["SERVING_THREADS"] = "8"  # Threads running the Flask application; above one the database moves to a WAL file with a connection per thread
+environ["INGESTION_SPOOL_DIR"] = ""  # Directory uploaded datasets are spooled to; empty uses the system temporary directory
+environ["INGESTION_MAX_MB"] = "512"  # Largest accepted upload, larger ones get 413; 0 accepts any size
+environ["ADMIN_TOKEN"] = ""  # Token for the profiling and ingestion endpoints, sent in X-Admin-Token; empty disables them
+
+# Import application components after setting environment variables
+# to ensure they use the correct configuration
+from src.api import app as flask_app  # Flask application
+from src.asgi import create_asgi_app  # ASGI wrapper of the Flask application
+from src.service.admission import awards_admission  # Bounded concurrency for the award computations
+
+# The dataset load starts on the ASGI lifespan startup, /health/ready answers 503 until it and the warm-up end.
+# Award requests admitted or queued get threads of their own, so overload is answered with 503;
+# with the database in a WAL file, the consecutive awards query is awaited on an aiosqlite engine
+app = create_asgi_app(
+    flask_app,
+    threads=int(environ["SERVING_THREADS"]),
+    admission=awards_admission.max_concurrent + awards_admission.max_queue,
+)
+
+if __name__ == "__main__":
+    # Execute only when run directly (not when imported)
+    import uvicorn
+
+    # Start uvicorn on the default host and a port apart from the Flask server (host='127.0.0.1', port=8000)
+    uvicorn.run(app, host="127.0.0.1", port=8000)
@@ -0,0 +1,113 @@
+"""
+Shared helpers for the Golden Raspberry Awards benchmarks.
+
+Benchmarks are plain scripts run from the repository root, for example
+`python -m benchmark.read_model --rows 1000000`. This module configures the
+environment the same way index.py does and generates synthetic datasets.
+"""
+from os import environ
+import random
+import time
+import tracemalloc
+
+
+def setup_app(database_url="sqlite:///:memory:"):
+    """
+    Configure the environment and return the Flask application and database.
+
+    Args:
+        database_url (str): SQLAlchemy URL of the database used by the benchmark
+
+    Returns:
+        tuple: The Flask application and the SQLAlchemy instance
+    """
+    environ.setdefault("DATABASE_URL", database_url)
+    environ.setdefault("INITIAL_DATASET_PATH", "Movielist.csv")
+    environ.setdefault("CSV_DELIMITER", ";")
+
+    # Import after configuring the environment, as index.py does
+    from src.api import app, db
+    return app, db
+
+
+def synthetic_rows(rows, producers=None, studios=500, seed=42):
+    """
+    Generate synthetic award rows.
+
+    Args:
+        rows (int): Number of rows to generate
+        producers (int): Number of distinct producers (defaults to rows // 10)
+        studios (int): Number of distinct studios
+        seed (int): Random seed, so runs are comparable
+
+    Returns:
+        list: List of dictionaries with the award columns
+    """
+    rng = random.Random(seed)
+    producers = producers or max(1, rows // 10)
+    return [{
+        "year": rng.randint(1900, 2024),
+        "title": f"Film {i}",
+        "studios": f"Studio {rng.randrange(studios)}",
+        "producers": f"Producer {rng.randrange(producers)}",
+        "winner": rng.random() < 0.2,
+    } for i in range(rows)]
+
+
+def insert_rows(db, model, rows, batch_size=50000):
+    """
+    Bulk insert synthetic rows with Core executemany, bypassing the ORM unit of work.
+
+    Args:
+        db: SQLAlchemy instance
+        model: ORM class whose table receives the rows
+        rows (list): Rows produced by synthetic_rows
+        batch_size (int): Number of rows per executemany call
+    """
+    for start in range(0, len(rows), batch_size):
+        db.session.execute(model.__table__.insert(), rows[start:start + batch_size])
+    db.session.commit()
+
+
+def measure(fn, *args, **kwargs):
+    """
+    Run a function once, measuring wall time and peak traced memory.
+
+    Args:
+        fn (callable): Function to measure
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        tuple: The function result, elapsed seconds and peak bytes allocated
+    """
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        result = fn(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def timeit(fn, repeat=5, number=1):
+    """
+    Return the best wall time per call over several repetitions.
+
+    Args:
+        fn (callable): Function without arguments to time
+        repeat (int): Number of repetitions
+        number (int): Calls per repetition
+
+    Returns:
+        float: Best seconds per call
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
@@ -0,0 +1,106 @@
+"""
+Benchmark: request throughput of the thread pool server by number of serving threads.
+
+Serves the application from a WAL file database (as index.py does with
+SERVING_THREADS above one) and drives it with concurrent clients over a mix
+of award endpoints, once per thread count. The --io-ms option adds a blocking
+wait to every request, standing in for I/O such as a remote database or a
+downstream service: with it, throughput scales with the thread count, while
+without it the requests are CPU-bound and the GIL keeps throughput flat.
+
+Usage:
+    python -m benchmark.concurrency --rows 50000 --threads 1,2,4,8,16 --io-ms 20
+"""
+from benchmark.common import setup_app, synthetic_rows, insert_rows
+from os import environ
+from threading import Thread
+from urllib.request import urlopen
+import argparse
+import time
+
+# Endpoints requested in turn by every client
+MIX = (
+    "/awards/longest-fastest-consecutive-awards",
+    "/awards/longest-fastest-consecutive-awards?from=1950&to=2000",
+    "/awards/producers?q=producer%201&limit=10",
+    "/awards/stats?group_by=studios&top=10",
+)
+
+
+def run_clients(port, clients, requests):
+    """
+    Send requests from concurrent clients, each cycling through the endpoint mix.
+
+    Args:
+        port (int): Port of the server
+        clients (int): Number of concurrent clients
+        requests (int): Requests sent by each client
+
+    Returns:
+        tuple: Elapsed seconds and number of failed requests
+    """
+    failures = []
+
+    def client(offset):
+        for i in range(requests):
+            try:
+                with urlopen(f"http://127.0.0.1:{port}{MIX[(offset + i) % len(MIX)]}") as response:
+                    response.read()
+            except Exception:
+                failures.append(1)
+
+    threads = [Thread(target=client, args=(offset,)) for offset in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started, len(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000, help="Number of rows in the synthetic dataset")
+    parser.add_argument("--threads", default="1,2,4,8,16", help="Comma-separated serving thread counts")
+    parser.add_argument("--clients", type=int, default=32, help="Number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=50, help="Requests sent by each client")
+    parser.add_argument("--io-ms", type=float, default=20.0, help="Blocking wait added to every request, in milliseconds")
+    args = parser.parse_args()
+    counts = [int(count) for count in args.threads.split(",")]
+
+    # One pooled connection per serving thread, and no admission limit below the thread count
+    environ["SERVING_THREADS"] = str(max(counts))
+    environ["ADMISSION_MAX_CONCURRENT"] = str(max(counts))
+    environ["ADMISSION_MAX_QUEUE"] = str(args.clients)
+    app, db = setup_app()
+    from src.core.awards import AwardsCore
+    from src.model.awards import Awards
+    from src.service.serving import ThreadPoolWSGIServer
+
+    if args.io_ms:
+        @app.before_request
+        def simulated_io():
+            time.sleep(args.io_ms / 1000)
+
+    with app.app_context():
+        db.create_all()
+        insert_rows(db, Awards, synthetic_rows(args.rows))
+        AwardsCore().warm_up()
+
+    print(f"rows={args.rows} clients={args.clients} requests={args.clients * args.requests} io={args.io_ms}ms")
+    for threads in counts:
+        server = ThreadPoolWSGIServer("127.0.0.1", 0, app, threads)
+        serving = Thread(target=server.serve_forever)
+        serving.start()
+        try:
+            elapsed, failures = run_clients(server.port, args.clients, args.requests)
+        finally:
+            server.shutdown()
+            server.server_close()
+            serving.join()
+        total = args.clients * args.requests
+        print(f"threads={threads:>3}: {elapsed:8.3f}s  {total / elapsed:10,.0f} req/s  failures {failures}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: bytes per row of a loaded dataset at several sizes.
+
+Writes synthetic datasets of increasing size and runs `cli.py memory-report`
+on each in a fresh process, so every measurement starts from an empty heap.
+B/row covers the database pages and the in-memory structures; the traced
+column also includes the interpreter and imported modules, so its growth
+between sizes, not its absolute value, is what the rows cost.
+
+Usage:
+    python -m benchmark.memory --sizes 1000 10000 100000
+"""
+from benchmark.common import synthetic_rows
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+
+def write_dataset(path, rows):
+    """
+    Write synthetic rows as a dataset CSV file.
+
+    Args:
+        path (str): Destination path
+        rows (list): Rows produced by synthetic_rows
+    """
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, delimiter=";", lineterminator="\n")
+        writer.writerow(["year", "title", "studios", "producers", "winner"])
+        for row in rows:
+            writer.writerow([row["year"], row["title"], row["studios"], row["producers"], "yes" if row["winner"] else ""])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Dataset sizes in rows")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'database':>12} {'structures':>12} {'sqlite heap':>12} {'traced':>12} {'B/row':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            path = os.path.join(directory, f"dataset-{size}.csv")
+            write_dataset(path, synthetic_rows(size))
+            output = subprocess.run([sys.executable, "cli.py", "memory-report", "--dataset", path], capture_output=True, text=True, check=True).stdout
+            report = json.loads(output)
+
+            database = report["database"]["bytes"] if report["database"] else 0
+            structures = sum(report["structures"].values())
+            sqlite = report["sqlite"]["memory_used"] if report["sqlite"] else 0
+            traced = report["tracemalloc"]["current"]
+            print(f"{size:>10} {database:>12,} {structures:>12,} {sqlite:>12,} {traced:>12,} {report['bytes_per_row']:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
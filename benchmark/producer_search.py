@@ -0,0 +1,47 @@
+"""
+Benchmark: producer prefix search and history lookups.
+
+Builds the producer index over a synthetic snapshot with many distinct
+producers and reports the build time and per-lookup latency of prefix
+searches and history reads.
+
+Usage:
+    python -m benchmark.producer_search --producers 100000
+"""
+from benchmark.common import synthetic_rows, timeit
+from src.core.producers import ProducerIndex
+from src.core.snapshot import AwardsSnapshot
+from src.model.awards import AwardRecord
+import argparse
+import random
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--producers", type=int, default=100_000, help="Number of distinct producers")
+    parser.add_argument("--rows", type=int, default=300_000, help="Number of rows in the synthetic dataset")
+    parser.add_argument("--lookups", type=int, default=10_000, help="Number of lookups timed per query type")
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.rows, producers=args.producers)
+    snapshot = AwardsSnapshot.from_records(AwardRecord(i, row["year"], row["title"], row["studios"], row["producers"], row["winner"]) for i, row in enumerate(rows, start=1))
+
+    started = time.perf_counter()
+    index = ProducerIndex(snapshot)
+    print(f"producers={len(index)} rows={args.rows} build={time.perf_counter() - started:.3f}s")
+
+    rng = random.Random(1)
+    names = [rng.choice(index.names) for _ in range(args.lookups)]
+    queries = (
+        ("prefix (12 chars)", lambda: [index.search(name[:12], limit=20) for name in names]),
+        ("prefix (full name)", lambda: [index.search(name) for name in names]),
+        ("history", lambda: [index.history(name) for name in names]),
+    )
+    for label, run in queries:
+        seconds = timeit(run, repeat=3)
+        print(f"{label:>20}: {seconds / args.lookups * 1e6:8.2f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: per-request Python overhead of the consecutive awards statement.
+
+Runs the consecutive awards query over a small synthetic dataset, so the
+database work is small and the Python overhead dominates, in three ways:
+rebuilding the statement on every call, as the model did before the query
+registry (which also ran the shortest and longest intervals as two
+statements); rebuilding it without SQLAlchemy's compiled cache, so every call
+also compiles; and executing the prebuilt statement from the query registry.
+Also reports the time to build the statement alone and the registry's compile
+and execute timings.
+
+Usage:
+    python -m benchmark.query_registry --rows 200 --calls 2000
+"""
+from benchmark.common import setup_app, synthetic_rows, insert_rows
+import argparse
+import time
+
+
+def per_call(fn, calls):
+    """Return the mean microseconds per call of fn."""
+    fn()  # Warm the compiled cache
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200, help="Number of rows in the synthetic dataset")
+    parser.add_argument("--calls", type=int, default=2000, help="Executions of each variant")
+    args = parser.parse_args()
+
+    app, db = setup_app()
+    from src.model.awards import Awards, award_queries, READ_OPTIONS
+    from src.service.metrics import metrics
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        insert_rows(db, Awards, synthetic_rows(args.rows))
+
+        def rebuilt():
+            return db.session.execute(Awards.consecutive_awards_statement(), execution_options=READ_OPTIONS).all()
+
+        def uncached():
+            return db.session.execute(Awards.consecutive_awards_statement(), execution_options={**READ_OPTIONS, "compiled_cache": None}).all()
+
+        def registry():
+            return award_queries.execute(db.session, "consecutive-awards", **READ_OPTIONS)
+
+        assert rebuilt() == uncached() == registry(), "The variants return different rows"
+
+        print(f"rows={args.rows} calls={args.calls}")
+        print(f"{'build only':>12}: {per_call(Awards.consecutive_awards_statement, args.calls):9.1f} us/call")
+        print(f"{'uncached':>12}: {per_call(uncached, args.calls):9.1f} us/call")
+        print(f"{'rebuilt':>12}: {per_call(rebuilt, args.calls):9.1f} us/call")
+        metrics.reset()
+        print(f"{'registry':>12}: {per_call(registry, args.calls):9.1f} us/call")
+
+        timings = metrics.snapshot()["timings"]
+        compile_, execute = timings["query.consecutive-awards.compile"], timings["query.consecutive-awards.execute"]
+        print(f"registry compile {compile_['mean'] * 1e6:9.1f} us  execute {execute['mean'] * 1e6:9.1f} us  "
+              f"cache hits {metrics.counter('query.consecutive-awards.cache_hit')}/{compile_['count']}")
+
+
+if __name__ == "__main__":
+    main()
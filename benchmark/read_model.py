@@ -0,0 +1,42 @@
+"""
+Benchmark: AwardRecord read model versus full ORM loading.
+
+Loads every row of a synthetic dataset once as Awards ORM instances and once as
+AwardRecord tuples through a column-only select, reporting throughput and peak
+traced memory for each.
+
+Usage:
+    python -m benchmark.read_model --rows 1000000
+"""
+from benchmark.common import setup_app, synthetic_rows, insert_rows, measure
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows in the synthetic dataset")
+    args = parser.parse_args()
+
+    app, db = setup_app()
+    from src.model.awards import Awards
+
+    with app.app_context():
+        db.create_all()
+        insert_rows(db, Awards, synthetic_rows(args.rows))
+
+        def load_orm():
+            rows = db.session.scalars(db.select(Awards).order_by(Awards.id)).all()
+            db.session.expunge_all()  # Drop the identity map between runs
+            return len(rows)
+
+        def load_records():
+            return len(Awards.get_records())
+
+        print(f"rows={args.rows}")
+        for name, fn in (("orm", load_orm), ("records", load_records)):
+            count, elapsed, peak = measure(fn)
+            print(f"{name:>8}: {elapsed:8.3f}s  {count / elapsed:12,.0f} rows/s  peak {peak / 2**20:8.1f} MiB  {peak / count:6.0f} B/row")
+
+
+if __name__ == "__main__":
+    main()
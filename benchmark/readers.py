@@ -0,0 +1,47 @@
+"""
+Benchmark: dataset loading from each supported input format.
+
+Writes one synthetic dataset as plain CSV, gzip, bz2 and xz compressed CSV
+and in the binary columnar format, then times reading every row and building
+an in-memory snapshot from each file.
+
+Usage:
+    python -m benchmark.readers --rows 1000000
+"""
+from benchmark.common import synthetic_rows, timeit
+from src.core.snapshot import AwardsSnapshot
+from src.service.readers import read_rows, write_columnar, write_csv
+import argparse
+import os
+import tempfile
+
+FORMATS = ("csv", "gzip", "bz2", "xz", "columnar")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows in the synthetic dataset")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per measurement, the best is reported")
+    args = parser.parse_args()
+
+    rows = [(row["year"], row["title"], row["studios"], row["producers"], row["winner"]) for row in synthetic_rows(args.rows)]
+
+    print(f"rows={args.rows}")
+    print(f"{'format':>10} {'size':>12} {'read rows':>12} {'snapshot':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        baseline = None
+        for file_format in FORMATS:
+            path = os.path.join(directory, f"dataset.{file_format}")
+            if file_format == "columnar":
+                write_columnar(rows, path)
+            else:
+                write_csv(rows, path, compression=None if file_format == "csv" else file_format)
+
+            read = timeit(lambda: sum(1 for _ in read_rows(path)), repeat=args.repeat)
+            snapshot = timeit(lambda: AwardsSnapshot.from_file(path), repeat=args.repeat)
+            baseline = baseline or snapshot
+            print(f"{file_format:>10} {os.path.getsize(path):>12,} {read:>11.3f}s {snapshot:>11.3f}s  ({baseline / snapshot:.1f}x vs csv)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Benchmark: thread pool WSGI serving versus ASGI serving under slow clients and slow queries.
+
+Starts the Flask application on the thread pool server and, through the ASGI
+adapter, on uvicorn, each in its own process over the same synthetic dataset and
+with the same number of threads, once per workload. A probe client sends fast
+requests meanwhile and measures their latency.
+
+In the slow-clients workload, many concurrent slow clients download the award
+listing, reading the body a chunk at a time. Every slow download holds a WSGI
+thread until its last byte is read, so the probes queue behind them once the
+connections outnumber the threads; on ASGI the thread is released once the body
+is handed to the event loop, and a slow download only holds a suspended coroutine.
+
+In the slow-queries workload, many concurrent clients request the consecutive
+awards answer, whose query is slowed down by a fixed delay, while the server
+invalidates the cached answer as often. Requests waiting on the query hold a WSGI
+thread each, so the liveness probes queue behind them; on ASGI the query is
+awaited on the aiosqlite engine, which needs more than one thread so the database
+is a file, and the probes keep their latency.
+
+Usage:
+    python -m benchmark.serving_modes --rows 20000 --connections 64 --threads 8 --client-delay-ms 20 --query-delay-ms 200
+"""
+from benchmark.common import synthetic_rows
+from src.service.readers import write_csv
+from os import environ
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Endpoints requested in turn by the clients
+MIX = (
+    "/awards/longest-fastest-consecutive-awards",
+    "/awards/longest-fastest-consecutive-awards?from=1950&to=2000",
+    "/awards/producers?q=producer%201&limit=10",
+    "/awards/stats?group_by=studios&top=10",
+)
+
+MODES = ("wsgi", "asgi")
+WORKLOADS = ("slow-clients", "slow-queries")
+
+
+def slow_down_queries(delay):
+    """
+    Delay the consecutive awards query, synchronous and async, and invalidate its cached answer as often.
+
+    Args:
+        delay (float): Seconds added to each query, and between invalidations
+    """
+    from src.model.awards import Awards
+    from src.service.version import data_version
+
+    query, query_async = Awards.get_longest_fastest_consecutive_awards, Awards.get_longest_fastest_consecutive_awards_async
+
+    def slow_query():
+        time.sleep(delay)  # Holds the thread, as a slow statement on the synchronous driver does
+        return query()
+
+    async def slow_query_async(session):
+        await asyncio.sleep(delay)  # Holds no thread, as a slow statement on aiosqlite
+        return await query_async(session)
+
+    def invalidate():
+        while True:
+            time.sleep(delay)
+            data_version.bump()
+
+    Awards.get_longest_fastest_consecutive_awards = slow_query
+    Awards.get_longest_fastest_consecutive_awards_async = slow_query_async
+    threading.Thread(target=invalidate, name="invalidate", daemon=True).start()
+
+
+def serve(mode, port, threads, query_delay=0.0):
+    """
+    Serve the application in one mode until the process is terminated.
+
+    Args:
+        mode (str): "wsgi" for the Flask application on the thread pool server, "asgi" for uvicorn
+        port (int): Port to listen on
+        threads (int): Threads running the Flask application
+        query_delay (float): Seconds added to each consecutive awards query, 0 to leave them alone
+    """
+    environ["DATABASE_URL"] = "sqlite:///:memory:"
+    environ["SERVING_THREADS"] = str(threads)
+    environ["ADMISSION_MAX_CONCURRENT"] = str(threads)
+    environ["ADMISSION_MAX_QUEUE"] = "100000"
+    environ["ADMISSION_QUEUE_TIMEOUT_MS"] = "600000"  # Queued requests wait rather than get 503, as they do for a WSGI thread
+    from src.api import app
+
+    if query_delay:
+        slow_down_queries(query_delay)
+
+    if mode == "wsgi":
+        from src.core.startup import start
+        from src.service.serving import ThreadPoolWSGIServer
+        from werkzeug.serving import WSGIRequestHandler
+
+        WSGIRequestHandler.log_request = lambda *args, **kwargs: None  # Keep the request log out of the measurement
+        start(app)
+        ThreadPoolWSGIServer("127.0.0.1", port, app, threads).serve_forever()
+    else:
+        import uvicorn
+        from src.asgi import create_asgi_app
+
+        uvicorn.run(create_asgi_app(app, threads), host="127.0.0.1", port=port, log_level="warning", backlog=4096)
+
+
+def free_port():
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def request(port, path, delay=0.0, chunk=65536):
+    """
+    Send one request and read the whole response, optionally as a slow client.
+
+    Args:
+        port (int): Port of the server
+        path (str): Request path and query
+        delay (float): Seconds waited after reading each chunk of the response
+        chunk (int): Bytes read at a time, also the size of the client receive buffer
+
+    Returns:
+        float: Latency in seconds, from connecting to the end of the response
+    """
+    started = time.perf_counter()
+    sock = socket.socket()
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, chunk)  # A small window, so the server must wait for the reader
+    sock.setblocking(False)
+    await asyncio.get_running_loop().sock_connect(sock, ("127.0.0.1", port))
+    reader, writer = await asyncio.open_connection(sock=sock, limit=chunk)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n".encode("latin-1"))
+        await writer.drain()
+        head = await reader.read(chunk)
+        if not head.startswith((b"HTTP/1.1 200", b"HTTP/1.0 200")):
+            raise RuntimeError(head[:100])
+        while await reader.read(chunk):
+            if delay:
+                await asyncio.sleep(delay)
+    finally:
+        writer.close()
+    return time.perf_counter() - started
+
+
+async def load(port, connections, requests, delay, path="/awards/", probes=MIX, interval=0.0):
+    """
+    Run concurrent slow requests, with a probe sending fast requests meanwhile.
+
+    Args:
+        port (int): Port of the server
+        connections (int): Concurrent slow client connections
+        requests (int): Requests made by each slow client
+        delay (float): Seconds slow clients wait after reading each chunk
+        path (str): Path requested by the slow clients, the award listing by default
+        probes (tuple): Paths requested in turn by the probe
+        interval (float): Seconds the probe waits between requests, so it takes less CPU from the server
+
+    Returns:
+        tuple: Elapsed seconds, slow request latencies, probe latencies and the number of failed requests
+    """
+    downloads, latencies = [], []
+    failures = 0
+    done = asyncio.Event()
+
+    async def slow_client():
+        nonlocal failures
+        for _ in range(requests):
+            try:
+                downloads.append(await request(port, path, delay))
+            except Exception:
+                failures += 1
+
+    async def probe():
+        nonlocal failures
+        i = 0
+        while not done.is_set():
+            try:
+                latencies.append(await request(port, probes[i % len(probes)]))
+            except Exception:
+                failures += 1
+            i += 1
+            if interval:
+                await asyncio.sleep(interval)
+
+    started = time.perf_counter()
+    prober = asyncio.ensure_future(probe())
+    await asyncio.gather(*(slow_client() for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await prober
+    return elapsed, sorted(downloads), sorted(latencies), failures
+
+
+def percentile(latencies, fraction):
+    """Return a percentile of sorted latencies in milliseconds."""
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000 if latencies else float("nan")
+
+
+def wait_ready(port, process, timeout=300):
+    """Wait until the server reports ready, failing if its process exits."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("The server exited before serving")
+        try:
+            asyncio.run(request(port, "/health/ready"))
+            return
+        except Exception:
+            time.sleep(0.2)
+    raise RuntimeError("The server did not start in time")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000, help="Number of rows in the synthetic dataset")
+    parser.add_argument("--connections", type=int, default=64, help="Concurrent slow client connections")
+    parser.add_argument("--requests", type=int, default=2, help="Requests made by each slow client")
+    parser.add_argument("--threads", type=int, default=8, help="Threads running the Flask application in both modes")
+    parser.add_argument("--client-delay-ms", type=float, default=20.0, help="Delay of the slow clients after reading each 64 KiB of the response")
+    parser.add_argument("--query-delay-ms", type=float, default=200.0, help="Delay added to the consecutive awards query, and between invalidations of its cached answer")
+    parser.add_argument("--probe-interval-ms", type=float, default=0.0, help="Pause of the probe between requests")
+    parser.add_argument("--workload", choices=WORKLOADS, action="append", help="Workload to run, repeatable; every workload by default")
+    parser.add_argument("--serve", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.threads, args.query_delay_ms / 1000)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dataset.csv")
+        write_csv(((row["year"], row["title"], row["studios"], row["producers"], row["winner"]) for row in synthetic_rows(args.rows)), path)
+
+        print(f"rows={args.rows} connections={args.connections} requests={args.connections * args.requests} "
+              f"threads={args.threads} client-delay={args.client_delay_ms}ms query-delay={args.query_delay_ms}ms")
+        for workload in args.workload or WORKLOADS:
+            print(workload)
+            if workload == "slow-clients":
+                query_delay, workload_args = 0, ("/awards/", MIX)
+                delay = args.client_delay_ms / 1000
+            else:
+                query_delay, workload_args = args.query_delay_ms, ("/awards/longest-fastest-consecutive-awards", ("/health/live",))
+                delay = 0.0
+            for mode in MODES:
+                port = free_port()
+                command = [sys.executable, "-m", "benchmark.serving_modes", "--serve", mode, "--port", str(port),
+                           "--threads", str(args.threads), "--query-delay-ms", str(query_delay)]
+                process = subprocess.Popen(command, env={**environ, "INITIAL_DATASET_PATH": path, "CSV_DELIMITER": ";"}, stdout=subprocess.DEVNULL)
+                try:
+                    wait_ready(port, process)
+                    elapsed, slow, probes, failures = asyncio.run(load(port, args.connections, args.requests, delay, *workload_args, args.probe_interval_ms / 1000))
+                finally:
+                    process.terminate()
+                    process.wait()
+                print(f"{mode:>5}: {elapsed:8.3f}s  requests {len(slow) / elapsed:6,.1f}/s p50 {percentile(slow, 0.5):8.1f}ms  "
+                      f"probes {len(probes):5} p50 {percentile(probes, 0.5):8.1f}ms p99 {percentile(probes, 0.99):8.1f}ms  failures {failures}")
+
+
+if __name__ == "__main__":
+    main()
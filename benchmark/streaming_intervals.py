@@ -0,0 +1,58 @@
+"""
+Benchmark: streaming consecutive awards from a file versus loading it into the database.
+
+Writes a synthetic dataset sorted by year and a shuffled copy, then answers the
+longest and fastest consecutive awards for each file twice: streamed straight
+from the file as `python cli.py intervals` does, and through the database path
+index.py takes (create the schema, load_dataset, run the SQL query). Reports
+throughput and peak traced memory for each. The SQL query's correlated
+subquery grows quadratically with the rows, so the default size is small.
+
+Usage:
+    python -m benchmark.streaming_intervals --rows 20000
+"""
+from benchmark.common import setup_app, synthetic_rows, measure
+from src.core.streaming import stream_consecutive_awards
+from src.service.readers import write_csv
+from os import environ
+import argparse
+import os
+import random
+import tempfile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000, help="Number of rows in the synthetic dataset")
+    args = parser.parse_args()
+
+    app, db = setup_app()
+    from src.model.awards import Awards
+
+    rows = sorted(((row["year"], row["title"], row["studios"], row["producers"], row["winner"]) for row in synthetic_rows(args.rows)), key=lambda row: row[0])
+
+    with tempfile.TemporaryDirectory() as directory, app.app_context():
+        files = {"sorted": os.path.join(directory, "sorted.csv"), "shuffled": os.path.join(directory, "shuffled.csv")}
+        write_csv(rows, files["sorted"])
+        random.Random(42).shuffle(rows)
+        write_csv(rows, files["shuffled"])
+        del rows
+
+        def database(path):
+            environ["INITIAL_DATASET_PATH"] = path
+            db.drop_all()
+            Awards.load_dataset()  # Creates the schema, as index.py does
+            return Awards.get_longest_fastest_consecutive_awards()
+
+        print(f"rows={args.rows}")
+        for name, path in files.items():
+            streamed, elapsed, peak = measure(stream_consecutive_awards, path)
+            print(f"{name:>8} stream:   {elapsed:8.3f}s  {args.rows / elapsed:12,.0f} rows/s  peak {peak / 2**20:8.1f} MiB")
+
+            answer, elapsed, peak = measure(database, path)
+            print(f"{name:>8} database: {elapsed:8.3f}s  {args.rows / elapsed:12,.0f} rows/s  peak {peak / 2**20:8.1f} MiB")
+            assert streamed[0] == answer, "The streamed answer differs from the database answer"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Command-line entry point for the Golden Raspberry Awards application.
+
+Each subcommand runs one task without starting the web server:
+
+    python cli.py memory-report --dataset Movielist.csv
+    python cli.py convert Movielist.csv movielist.grac --to columnar
+    python cli.py intervals Movielist.csv
+"""
+from contextlib import redirect_stdout
+from os import environ
+import argparse
+import json
+import sys
+
+
+def memory_report(args):
+    """
+    Load a dataset the same way index.py does and print its memory report as JSON.
+
+    Args:
+        args (Namespace): Parsed command-line arguments
+    """
+    import tracemalloc
+    tracemalloc.start()  # Trace from before the application is imported, so the report covers the whole load
+
+    # Configure environment variables as index.py does
+    environ["DATABASE_URL"] = args.database_url
+    environ["INITIAL_DATASET_PATH"] = args.dataset
+    environ.setdefault("CSV_DELIMITER", ";")
+
+    from src.api import app, db
+    from src.core.awards import AwardsCore
+    from src.core.memory import memory_report
+    from src.model.awards import Awards
+
+    with app.app_context():
+        # Keep stdout for the JSON report
+        with redirect_stdout(sys.stderr):
+            db.create_all()
+            Awards.load_dataset()
+            AwardsCore().warm_up()
+        json.dump(memory_report(), sys.stdout, indent=2)
+        print()
+
+
+def convert(args):
+    """
+    Convert a dataset file between the supported formats.
+
+    Args:
+        args (Namespace): Parsed command-line arguments
+    """
+    from src.service.readers import read_rows, write_columnar, write_csv
+
+    rows = read_rows(args.source)
+    if args.to == "columnar":
+        count = write_columnar(rows, args.destination)
+    else:
+        count = write_csv(rows, args.destination, compression=None if args.to == "csv" else args.to)
+    print(f"Wrote {count} rows to {args.destination} ({args.to})")
+
+
+def intervals(args):
+    """
+    Print the longest and fastest consecutive awards of a dataset file as JSON, without a database.
+
+    The output is the body /awards/longest-fastest-consecutive-awards answers for the same file.
+
+    Args:
+        args (Namespace): Parsed command-line arguments
+    """
+    import time
+    from src.core.streaming import stream_consecutive_awards
+
+    started = time.perf_counter()
+    result, rows = stream_consecutive_awards(args.dataset, delimiter=args.delimiter)
+    elapsed = time.perf_counter() - started
+
+    json.dump(result, sys.stdout, indent=args.indent)
+    print()
+    if args.stats:
+        print(f"Read {rows} rows in {elapsed:.3f}s ({rows / elapsed if elapsed else 0:,.0f} rows/s)", file=sys.stderr)
+
+
+def main(argv=None):
+    """
+    Parse the command line and run the requested subcommand.
+
+    Args:
+        argv (list): Command-line arguments, sys.argv[1:] if None
+    """
+    parser = argparse.ArgumentParser(description="Golden Raspberry Awards command-line tools")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    memory = subcommands.add_parser("memory-report", help="Load a dataset and print the memory used by the loaded data")
+    memory.add_argument("--dataset", default="Movielist.csv", help="Path of the dataset file")
+    memory.add_argument("--database-url", default="sqlite:///:memory:", help="SQLAlchemy URL of the database")
+    memory.set_defaults(run=memory_report)
+
+    conversion = subcommands.add_parser("convert", help="Convert a dataset file, in any supported format, to another format")
+    conversion.add_argument("source", help="Path of the dataset file to read, format detected automatically")
+    conversion.add_argument("destination", help="Path of the dataset file to write")
+    conversion.add_argument("--to", choices=("columnar", "csv", "gzip", "bz2", "xz"), default="columnar", help="Format of the written file")
+    conversion.set_defaults(run=convert)
+
+    streaming = subcommands.add_parser("intervals", help="Print the longest and fastest consecutive awards of a dataset file, without a database")
+    streaming.add_argument("dataset", help="Path of the dataset file, format detected automatically")
+    streaming.add_argument("--delimiter", help="CSV delimiter, CSV_DELIMITER or ';' by default")
+    streaming.add_argument("--indent", type=int, help="Indentation of the JSON output, compact by default")
+    streaming.add_argument("--stats", action="store_true", help="Print the rows read and the throughput to stderr")
+    streaming.set_defaults(run=intervals)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
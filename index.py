@@ -1,8 +1,8 @@
 """
 Main entry point for the Golden Raspberry Awards application.
 
-This script initializes environment variables, sets up the database, loads the initial dataset,
-and starts the Flask web server.
+This script initializes environment variables and starts the Flask web server, while the database
+is set up, the initial dataset loaded and the caches warmed up in the background.
 """
 from os import environ
 
@@ -10,22 +10,30 @@ from os import environ
 environ["DATABASE_URL"] = "sqlite:///:memory:"  # Using in-memory SQLite database
 environ["INITIAL_DATASET_PATH"] = "Movielist.csv"  # Path to the CSV dataset file
 environ["CSV_DELIMITER"] = ";"  # Delimiter used in the CSV file
+environ["DATASETS"] = ""  # Named datasets served besides the main one, as "name=path,name=path"
+environ["DATASET_MEMORY_BUDGET_MB"] = "512"  # Memory for loaded named datasets, with their indexes and cached responses, before the least recently used is evicted
+environ["ADMISSION_MAX_CONCURRENT"] = "8"  # Award requests computing at the same time
+environ["ADMISSION_MAX_QUEUE"] = "64"  # Award requests waiting for a slot before new ones get 503
+environ["ADMISSION_QUEUE_TIMEOUT_MS"] = "1000"  # Maximum wait for a slot before a request gets 503
+environ["ADMISSION_RETRY_AFTER"] = "1"  # Seconds sent in the Retry-After header of the 503 responses
+environ["SERVING_THREADS"] = "8"  # Threads serving requests; above one the database moves to a WAL file with a connection per thread
+environ["INGESTION_SPOOL_DIR"] = ""  # Directory uploaded datasets are spooled to; empty uses the system temporary directory
+environ["INGESTION_MAX_MB"] = "512"  # Largest accepted upload, larger ones get 413; 0 accepts any size
+environ["ADMIN_TOKEN"] = ""  # Token for the profiling and ingestion endpoints, sent in X-Admin-Token; empty disables them
 
 # Import application components after setting environment variables
 # to ensure they use the correct configuration
-from src.api import app, db  # Flask application and database instances
-from src.model.awards import Awards  # Awards model
+from src.api import app  # Flask application instance
+from src.core.startup import start_in_background  # Dataset load and warm-up while the server listens
+from src.service.admission import awards_admission  # Admission control of the awards endpoints, whose requests get server threads of their own
+from src.service.serving import serve  # Single-threaded or thread pool server
 
 if __name__ == "__main__":
     # Execute only when run directly (not when imported)
 
-    # Making sure to use current app context
-    with app.app_context():
-        # Initialize database schema
-        db.create_all()
+    # Create the schema, load the initial data and warm up the caches in the background,
+    # so /health/live answers during the load and /health/ready answers 503 until the warm-up ends
+    start_in_background(app)
 
-        # Load initial data from the CSV file into the database
-        Awards.load_dataset()
-
-    # Start the Flask development server with default settings (host='127.0.0.1', port=5000)
-    app.run()
+    # Start serving on the default host and port (host='127.0.0.1', port=5000)
+    serve(app, threads=int(environ["SERVING_THREADS"]), admission=awards_admission.max_concurrent + awards_admission.max_queue)
@@ -7,20 +7,36 @@ initializes Flask-RESTX for API documentation, and enables CORS for cross-origin
 from flask import Flask
 from flask_restx import Api  # Extension for building RESTful APIs with Swagger documentation
 
+from src.core.ingestion import ingestion_manager  # Background ingestion of uploaded datasets
 from src.service.db import db  # SQLAlchemy database instance
+from src.service.profiling import request_profiler  # On-demand cProfile of the next requests
+from src.service.serving import configure_engine, database_settings, shared_connection_lock  # Database setup for threaded serving
 
 from src.resource.awards import awards_ns  # API namespace for award-related endpoints
+from src.resource.admin import admin_ns  # API namespace for operational endpoints
+from src.resource.health import health_ns  # API namespace for liveness and readiness
+from src.resource.ingestion import ingestions_ns  # API namespace for dataset uploads
 
 from os import environ
 
 # Create and configure the Flask application
 app = Flask(__name__)
-app.config["SQLALCHEMY_DATABASE_URI"] = environ["DATABASE_URL"]  # Configure SQLAlchemy with database URL from environment variables
+# Configure SQLAlchemy with database URL from environment variables, moved to a file when serving from several threads
+app.config["SQLALCHEMY_DATABASE_URI"], app.config["SQLALCHEMY_ENGINE_OPTIONS"] = database_settings(environ["DATABASE_URL"], int(environ.get("SERVING_THREADS", "1")))
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False  # Disable modification tracking to improve performance
 db.init_app(app)  # Initialize the SQLAlchemy instance
+with app.app_context():
+    configure_engine(db.engine)  # WAL mode for file databases, so reads never wait on each other
+# Serialize requests with background writers on an in-memory database; the health endpoints answer during a load
+shared_connection_lock.init_app(app, db.session, exempt=("/health/",))
+request_profiler.init_app(app)  # Install the request hooks, idle until profiling is requested
+ingestion_manager.init_app(app)  # The ingestion worker writes through this application's database
 
 # Create a Flask-RESTX API instance with documentation metadata
 api = Api(app, version="1.0", title="Golden Raspberry Awards", description="Documentação para consulta da API do Golden Raspberry Awards")
 
 # Register API namespaces
 api.add_namespace(awards_ns)  # Add the awards namespace to the API
+api.add_namespace(admin_ns)  # Add the admin namespace to the API
+api.add_namespace(health_ns)  # Add the health namespace to the API
+api.add_namespace(ingestions_ns)  # Add the ingestions namespace to the API
@@ -0,0 +1,148 @@
+"""
+ASGI application module for the Golden Raspberry Awards application.
+
+This module serves the Flask application from an ASGI server such as uvicorn.
+A Starlette application starts the dataset load and warm-up in the background
+on the lifespan startup, so the server listens meanwhile, and mounts the Flask
+application through a2wsgi's WSGI adapter, so routing, argument parsing,
+admission control and the admin token checks are the ones of the Flask
+resources.
+
+The adapter runs each request on a fixed pool of threads and hands the
+response to the event loop through a bounded queue. A thread is released as
+soon as the body is queued, so a slow client only holds a suspended coroutine
+while its download is sent.
+
+On a file database, the consecutive awards answer over the main database is
+served by the event loop instead: under the awards admission control, a request
+whose answer is not cached awaits the query on an aiosqlite engine, and the
+answer is sent from the response cache shared with the Flask resource, so a slow
+query holds no thread. Windowed, per-studio and named dataset requests still go
+to the Flask resource.
+"""
+from src.core.async_awards import AsyncAwardsCore  # Consecutive awards query over the async engine
+from src.core.startup import start_in_background  # Dataset load and warm-up while the server listens
+from src.resource.awards import DATASET_ARGUMENT, DATASET_HEADER  # How a request names a dataset
+from src.service.admission import Rejected, awards_admission  # Bounded concurrency for the award computations
+from src.service.serving import is_memory_database  # In-memory databases are not shared with another engine
+
+from a2wsgi import WSGIMiddleware
+from contextlib import asynccontextmanager
+from starlette.applications import Starlette
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+from urllib.parse import parse_qs
+from werkzeug.datastructures import Accept
+from werkzeug.http import parse_accept_header
+import asyncio
+import traceback  # For detailed error tracking
+
+# Path of the consecutive awards endpoint, answered from the async engine
+LONGEST_FASTEST_PATH = "/awards/longest-fastest-consecutive-awards"
+
+
+def answers_main_database(scope):
+    """
+    Tell whether a consecutive awards request asks for the cached answer over the main database.
+
+    Windowed and per-studio answers come from the in-memory interval index, and named
+    datasets from their own snapshot, so neither runs the query.
+
+    Args:
+        scope (dict): ASGI connection scope of the request
+
+    Returns:
+        bool: True for a GET without a window, another dimension or a named dataset
+    """
+    if scope["method"] != "GET":
+        return False
+    if any(name.decode("latin-1").lower() == DATASET_HEADER.lower() for name, _ in scope["headers"]):
+        return False
+    args = parse_qs(scope["query_string"].decode("latin-1"), keep_blank_values=True)
+    if "from" in args or "to" in args or DATASET_ARGUMENT in args:
+        return False
+    return args.get("dimension", ["producers"]) == ["producers"]
+
+
+class LongestFastestEndpoint:
+    """
+    ASGI endpoint answering the consecutive awards requests over the main database from the async engine.
+
+    The response is the Flask resource's: the same cached body, compressed as the
+    client's Accept-Encoding allows. Other requests, and requests whose query
+    fails, are answered by the Flask resource.
+    """
+
+    def __init__(self, core, fallback):
+        """
+        Args:
+            core (AsyncAwardsCore): Computes the answer over the async engine
+            fallback (ASGIApp): The mounted Flask application
+        """
+        self.core = core
+        self.fallback = fallback
+
+    async def __call__(self, scope, receive, send):
+        if not answers_main_database(scope):
+            await self.fallback(scope, receive, send)
+            return
+
+        # A queued request waits on a worker thread for at most the admission queue timeout
+        try:
+            await asyncio.to_thread(awards_admission.acquire)
+        except Rejected as e:
+            body, headers = awards_admission.rejection(e.reason)
+            await Response(body, status_code=503, media_type="application/json", headers=headers)(scope, receive, send)
+            return
+        try:
+            cached = await self.core.longest_fastest_consecutive_awards()
+        except Exception as e:
+            print(f"Error: {e}")
+            print(traceback.format_exc())  # Print detailed stack trace for debugging
+            cached = None
+        finally:
+            awards_admission.release()
+
+        if cached is None:
+            # The Flask resource computes the answer again and reports the failure
+            await self.fallback(scope, receive, send)
+            return
+        encoding, body = cached.negotiate(parse_accept_header(Headers(scope=scope).get("accept-encoding"), Accept))
+        headers = {"Vary": "Accept-Encoding"}  # Caches in between must key the body on the request encoding
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        await Response(body, media_type=cached.mimetype, headers=headers)(scope, receive, send)
+
+
+def create_asgi_app(app, threads=1, admission=0, database_url=None):
+    """
+    Wrap the Flask application in an ASGI application.
+
+    Args:
+        app (Flask): The Flask application
+        threads (int): Threads running the Flask application, as SERVING_THREADS for the WSGI server
+        admission (int): Extra threads for the award requests admitted or queued by the admission control,
+            so overload is answered with 503 instead of waiting for a thread
+        database_url (str): Database of the async engine, the Flask application's if None;
+            an in-memory database disables the async engine
+
+    Returns:
+        Starlette: ASGI application loading the dataset after startup and serving every Flask endpoint
+    """
+    flask = WSGIMiddleware(app, workers=threads + admission)
+    url = database_url or app.config["SQLALCHEMY_DATABASE_URI"]
+    core = None if is_memory_database(url) else AsyncAwardsCore(url)
+
+    @asynccontextmanager
+    async def lifespan(_):
+        # The server listens as soon as the lifespan startup completes, the health endpoints answer during the load
+        start_in_background(app)
+        yield
+        if core is not None:
+            await core.dispose()
+
+    routes = [Mount("", app=flask)]
+    if core is not None:
+        routes.insert(0, Route(LONGEST_FASTEST_PATH, endpoint=LongestFastestEndpoint(core, flask)))
+    return Starlette(routes=routes, lifespan=lifespan)
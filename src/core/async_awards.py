@@ -0,0 +1,60 @@
+"""
+Async awards module for the Golden Raspberry Awards application.
+
+This module runs the consecutive awards query of the main database over
+SQLAlchemy's async engine, for the ASGI serving mode. The answer is stored in
+the response cache the Flask resource answers from, under the same name and
+data version, so a request missing the cache awaits the query instead of
+holding a thread, and either serving path finds the answer the other computed.
+"""
+from src.core.awards import longest_fastest_flight  # Shared with the synchronous computation of the same answer
+from src.model.awards import Awards  # Awards model
+from src.service.async_db import create_async_database  # Async engine over aiosqlite
+from src.service.cache import response_cache  # Computed answers with their encoded bodies
+from src.service.version import data_version  # Identifies the data a computation was run against
+
+# Name of the consecutive awards answer in the response cache, as filled by AwardsCore
+LONGEST_FASTEST = "longest-fastest-consecutive-awards"
+
+
+class AsyncAwardsCore:
+    """
+    Computes the consecutive awards answer of the main database over the async engine.
+    """
+
+    def __init__(self, url):
+        """
+        Create the async engine of a database.
+
+        Args:
+            url (str): SQLAlchemy URL of a file SQLite database, synchronous or async
+        """
+        self.engine, self.sessions = create_async_database(url)
+
+    async def longest_fastest_consecutive_awards(self):
+        """
+        Return the cached consecutive awards answer, awaiting the query once per data version.
+
+        Concurrent calls over the same data version, including the synchronous ones of
+        AwardsCore, are coalesced into one query.
+
+        Returns:
+            CachedResponse: The answer and its encoded bodies
+        """
+        version = data_version.value
+        cached = response_cache.get(LONGEST_FASTEST, version)
+        if cached is not None:
+            return cached
+
+        async def fill():
+            async with self.sessions() as session:
+                answer = await Awards.get_longest_fastest_consecutive_awards_async(session)
+            return response_cache.put(LONGEST_FASTEST, version, answer)
+
+        return await longest_fastest_flight.do_async((LONGEST_FASTEST, version), fill)
+
+    async def dispose(self):
+        """
+        Close the connections of the async engine.
+        """
+        await self.engine.dispose()
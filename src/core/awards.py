@@ -5,21 +5,41 @@ This module provides the business logic layer between the API resources
 and the data models, handling award-related operations and data processing.
 """
 from src.model.awards import Awards  # Import the Awards data model
+from src.core.datasets import current_data  # The main dataset, stored in the database
+from src.core.intervals import current_interval_index  # In-memory index of consecutive win intervals
+from src.core.producers import current_producer_index  # In-memory index of producer names
+from src.core.rollups import rollup_store  # Nomination and win counts kept up to date on writes
+from src.core.snapshot import current_snapshot  # In-memory copy of the awards table
+from src.service.cache import CachedResponse, response_cache  # Computed answers with their encoded bodies
+from src.service.coalesce import SingleFlight  # Shares one in-flight computation between concurrent requests
+from src.service.metrics import metrics  # Process-wide metrics registry
+from src.service.version import data_version  # Identifies the data a computation was run against
+
+import csv
+import io
+import time
+
+# Concurrent requests for the same answer over the same data wait on a single query
+longest_fastest_flight = SingleFlight("awards.longest_fastest")
+responses_flight = SingleFlight("awards.responses")
 
 
 class AwardsCore:
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, dataset=None, **kwargs):
         """
         Initialize the AwardsCore instance.
         
         Args:
             *args: Variable length argument list (not used currently).
+            dataset (Dataset): Named dataset to answer from, the main database if None.
             **kwargs: Arbitrary keyword arguments (not used currently).
         
-        The constructor sets up the reference to the Awards model.
+        The constructor sets up the reference to the Awards model and to the data being queried.
         """
         self.model = Awards  # Reference to the Awards data model for database operations
+        self.dataset = dataset  # Named in-memory dataset, None for the main database
+        self.data = dataset or current_data  # In-memory structures of the data being queried
 
     def get_longest_fastest_consecutive_awards(self):
         """
@@ -27,6 +47,9 @@ class AwardsCore:
         
         This method delegates to the model layer to fetch data about producers who have
         won multiple awards and the intervals between their consecutive wins.
+        The answer is cached per data version and concurrent calls over the
+        same data version are coalesced into one query. Named datasets answer
+        from their in-memory interval index instead.
         
         Returns:
             tuple: A tuple containing:
@@ -35,8 +58,246 @@ class AwardsCore:
                     - "max": List of producers with the longest intervals between wins
                 - int: HTTP status code (200 for success)
         """
-        # Call the model method to retrieve the data
-        response = self.model.get_longest_fastest_consecutive_awards()
-
         # Return the response data with a 200 OK status code
-        return response, 200
+        return self._longest_fastest_consecutive_awards().data, 200
+
+    def get_longest_fastest_consecutive_awards_between(self, year_from=None, year_to=None, dimension="producers"):
+        """
+        Get the longest and fastest intervals between consecutive awards inside a window of years.
+
+        Only pairs of consecutive wins that both fall inside the window are considered.
+        The answer comes from the in-memory interval index instead of the SQL query,
+        and can be grouped by producers or by studios.
+
+        Args:
+            year_from (int): First year of the window, unbounded if None
+            year_to (int): Last year of the window, unbounded if None
+            dimension (str): Column wins are grouped by, "producers" or "studios"
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: A dictionary with "min" and "max" lists, as in get_longest_fastest_consecutive_awards
+                - int: HTTP status code (200 for success)
+        """
+        return self.data.interval_index(dimension).query(year_from, year_to), 200
+
+    def search_producers(self, prefix, limit=None):
+        """
+        Search producers by the start of their name, ignoring case.
+
+        Producers listed together in one movie ("A, B and C") are indexed separately.
+
+        Args:
+            prefix (str): Start of the producer name
+            limit (int): Maximum number of producers returned, unlimited if None
+
+        Returns:
+            tuple: A tuple containing:
+                - list: Producers with their nomination and win counts, sorted by name
+                - int: HTTP status code (200 for success)
+        """
+        return self.data.producer_index().search(prefix, limit), 200
+
+    def get_producer_history(self, name):
+        """
+        Get every nomination of a producer.
+
+        Args:
+            name (str): Producer name, matched ignoring case
+
+        Returns:
+            tuple: A tuple containing:
+                - list: Award dictionaries ordered by year, empty when the producer is unknown
+                - int: HTTP status code (200 for success, 404 for an unknown producer)
+        """
+        history = self.data.producer_index().history(name)
+        return history, 200 if history else 404
+
+    def get_stats(self, group_by="year", order="nominations", top=None):
+        """
+        Get nomination and win counts per year, studio or producer.
+
+        The counts are served from rollups maintained on writes, so no aggregation
+        over the awards table runs here.
+
+        Args:
+            group_by (str): "year", "studios" or "producers"
+            order (str): "nominations" or "wins", the entries are sorted by, highest first
+            top (int): Maximum number of entries, every entry if None
+
+        Returns:
+            tuple: A tuple containing:
+                - list: Dictionaries with the group value and its nomination and win counts
+                - int: HTTP status code (200 for success)
+        """
+        return self.data.rollups().top(group_by, order, top), 200
+
+    def get_longest_fastest_consecutive_awards_encoded(self):
+        """
+        Get the same answer as get_longest_fastest_consecutive_awards, already encoded as JSON.
+
+        Returns:
+            tuple: A tuple containing:
+                - CachedResponse: The answer with its body, uncompressed and compressed
+                - int: HTTP status code (200 for success)
+        """
+        return self._longest_fastest_consecutive_awards(), 200
+
+    def _longest_fastest_consecutive_awards(self):
+        """
+        Return the cached consecutive awards answer, computing it once per data version.
+
+        Named datasets are read-only, so their answer is computed from the interval index once per load.
+
+        Returns:
+            CachedResponse: The answer and its encoded body
+        """
+        if self.dataset is not None:
+            return self.dataset.cached("longest-fastest-consecutive-awards", lambda snapshot: CachedResponse(None, self.dataset.interval_index().query()))
+
+        # Call the model method to retrieve the data, and encode it once for every waiting request
+        return self._cached("longest-fastest-consecutive-awards", self.model.get_longest_fastest_consecutive_awards, flight=longest_fastest_flight)
+
+    def _cached(self, name, compute, flight=None, mimetype=None):
+        """
+        Return a cached answer over the main database, computing it once per data version.
+
+        Args:
+            name (str): Name of the answer in the response cache
+            compute (callable): Function returning the JSON-serializable answer, or the encoded body if mimetype is given
+            flight (SingleFlight): Coalesces concurrent computations, responses_flight if None
+            mimetype (str): Media type of bodies that are not JSON
+
+        Returns:
+            CachedResponse: The answer and its encoded bodies
+        """
+        version = data_version.value
+        cached = response_cache.get(name, version)
+        if cached is not None:
+            return cached
+
+        def fill():
+            if mimetype is not None:
+                return response_cache.put(name, version, None, body=compute(), mimetype=mimetype)
+            return response_cache.put(name, version, compute())
+
+        return (flight or responses_flight).do((name, version), fill)
+
+    def warm_up(self):
+        """
+        Precompute the common answers so the first requests run at steady-state latency.
+
+        Building the snapshot reads every row, faulting in the table pages; computing the
+        consecutive awards answer compiles its query and fills the response cache.
+
+        Returns:
+            dict: Duration in seconds of each warm-up step
+        """
+        timings = {}
+        steps = (
+            ("snapshot", current_snapshot),
+            ("interval-index", current_interval_index),
+            ("producer-index", current_producer_index),
+            ("rollups", rollup_store.get),
+            ("longest-fastest-consecutive-awards", self._longest_fastest_consecutive_awards),
+        )
+        for step, warm in steps:
+            started = time.perf_counter()
+            warm()
+            timings[step] = time.perf_counter() - started
+            metrics.observe(f"warmup.{step}", timings[step])
+        return timings
+
+    def list_awards(self):
+        """
+        List every award row.
+
+        Rows are loaded through the column-only AwardRecord read model,
+        so no ORM instances are built for the listing. Named datasets
+        are listed from their snapshot.
+
+        Returns:
+            tuple: A tuple containing:
+                - list: List of award dictionaries ordered by id
+                - int: HTTP status code (200 for success)
+        """
+        return [record.to_dict() for record in self._records()], 200
+
+    def export_awards(self, delimiter=";"):
+        """
+        Export every award row as CSV text in the same layout as the input dataset.
+
+        Rows are streamed through the AwardRecord read model, one CSV line at a time.
+
+        Args:
+            delimiter (str): Delimiter used between columns
+
+        Yields:
+            str: The header line followed by one line per award
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\n")
+
+        writer.writerow(["year", "title", "studios", "producers", "winner"])
+        for record in self._records():
+            writer.writerow([record.year, record.title, record.studios, record.producers, "yes" if record.winner else ""])
+
+            # Flush the buffered line to the caller and reuse the buffer
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        yield buffer.getvalue()
+
+    def list_awards_encoded(self):
+        """
+        Get the same listing as list_awards, already encoded as JSON.
+
+        The listing is encoded and compressed once per data version, or once per load for named datasets.
+
+        Returns:
+            tuple: A tuple containing:
+                - CachedResponse: The listing with its body, uncompressed and compressed
+                - int: HTTP status code (200 for success)
+        """
+        def compute():
+            return self.list_awards()[0]
+
+        if self.dataset is not None:
+            return self.dataset.cached("awards", lambda snapshot: CachedResponse(None, compute())), 200
+        return self._cached("awards", compute), 200
+
+    def export_awards_encoded(self, delimiter=";"):
+        """
+        Get the same CSV as export_awards, as one body.
+
+        The CSV is encoded and compressed once per data version and delimiter,
+        or once per load for named datasets.
+
+        Args:
+            delimiter (str): Delimiter used between columns
+
+        Returns:
+            tuple: A tuple containing:
+                - CachedResponse: The CSV body, uncompressed and compressed
+                - int: HTTP status code (200 for success)
+        """
+        name = f"export:{delimiter}"
+
+        def compute():
+            return "".join(self.export_awards(delimiter)).encode("utf-8")
+
+        if self.dataset is not None:
+            return self.dataset.cached(name, lambda snapshot: CachedResponse(None, None, body=compute(), mimetype="text/csv")), 200
+        return self._cached(name, compute, mimetype="text/csv"), 200
+
+    def _records(self):
+        """
+        Iterate over the rows of the data being queried.
+
+        Returns:
+            iterable: AwardRecord rows ordered by id
+        """
+        if self.dataset is not None:
+            return self.dataset.snapshot().records()
+        return self.model.iter_records()
@@ -0,0 +1,269 @@
+"""
+Named datasets module for the Golden Raspberry Awards application.
+
+This module hosts several named datasets in one process besides the main
+database. Each named dataset is read straight from its file into an in-memory
+snapshot on first use, and the least recently used datasets are evicted when
+the configured memory budget is exceeded.
+"""
+from src.core.intervals import build_interval_indexes, current_interval_index
+from src.core.producers import ProducerIndex, current_producer_index
+from src.core.rollups import Rollups, rollup_store
+from src.core.snapshot import AwardsSnapshot, current_snapshot
+from src.service.coalesce import SingleFlight
+from src.service.metrics import metrics
+from src.service.sizing import deep_sizeof
+
+from collections import OrderedDict
+from os import environ
+from threading import Lock
+import time
+
+
+def parse_datasets(value):
+    """
+    Parse the DATASETS environment variable.
+
+    Args:
+        value (str): Comma-separated "name=path" pairs, such as "regional=regional.csv,historical=historical.csv"
+
+    Returns:
+        dict: Dataset name to file path
+
+    Raises:
+        ValueError: If a pair has no name or no path
+    """
+    datasets = {}
+    for pair in filter(None, (pair.strip() for pair in (value or "").split(","))):
+        name, _, path = pair.partition("=")
+        if not name.strip() or not path.strip():
+            raise ValueError(f"Invalid DATASETS entry: {pair!r}, expected name=path")
+        datasets[name.strip()] = path.strip()
+    return datasets
+
+
+class CurrentData:
+    """
+    The main dataset, stored in the database, seen through the in-memory structures built from it.
+    """
+    name = None
+
+    def snapshot(self):
+        """Return the snapshot of the current data."""
+        return current_snapshot()
+
+    def interval_index(self, dimension="producers"):
+        """Return the interval index of a dimension over the current data."""
+        return current_interval_index(dimension)
+
+    def producer_index(self):
+        """Return the producer index of the current data."""
+        return current_producer_index()
+
+    def rollups(self):
+        """Return the rollups of the current data."""
+        return rollup_store.get()
+
+
+class Dataset:
+    """
+    A named, read-only dataset loaded from a file into an in-memory snapshot.
+
+    The structures built from the snapshot are created on first use and live
+    as long as the dataset stays loaded. Each one is measured when it is built,
+    so the size of the dataset covers its indexes, rollups and cached
+    responses, compressed bodies included, and not only the snapshot.
+
+    Attributes:
+        name (str): Dataset name
+        path (str): File the dataset was loaded from
+        loaded_at (float): Load time, as a Unix timestamp
+        load_seconds (float): Time spent reading the file
+        on_resize (callable): Called with the dataset after a structure is built, None if unset
+    """
+
+    def __init__(self, name, path):
+        """
+        Load a dataset file.
+
+        Args:
+            name (str): Dataset name
+            path (str): Path of the dataset file
+        """
+        self.name = name
+        self.path = path
+        started = time.perf_counter()
+        self._snapshot = AwardsSnapshot.from_file(path)
+        self.load_seconds = time.perf_counter() - started
+        self.loaded_at = time.time()
+        self.on_resize = None
+        self._derived = {}
+        self._derived_sizes = {}  # Structure name to its estimated bytes, measured once when built
+
+    def cached(self, name, build):
+        """
+        Return a structure built from the dataset snapshot, building it on first use.
+
+        Racing builds are harmless, the last one wins.
+
+        Args:
+            name (str): Name identifying the structure
+            build (callable): Function building the structure from an AwardsSnapshot
+
+        Returns:
+            object: The structure built from the dataset snapshot
+        """
+        structure = self._derived.get(name)
+        if structure is None:
+            structure = self._derived[name] = build(self._snapshot)
+            # The snapshot is counted on its own, not again through the structures referencing it
+            self._derived_sizes[name] = deep_sizeof(structure, {id(self._snapshot)})
+            if self.on_resize is not None:
+                self.on_resize(self)
+        return structure
+
+    def snapshot(self):
+        """Return the snapshot of the dataset."""
+        return self._snapshot
+
+    def interval_index(self, dimension="producers"):
+        """Return the interval index of a dimension over the dataset."""
+        return self.cached("interval-indexes", build_interval_indexes)[dimension]
+
+    def producer_index(self):
+        """Return the producer index of the dataset."""
+        return self.cached("producer-index", ProducerIndex)
+
+    def rollups(self):
+        """Return the rollups of the dataset."""
+        return self.cached("rollups", Rollups.from_snapshot)
+
+    def nbytes(self):
+        """
+        Estimate the memory held by the dataset.
+
+        Returns:
+            int: Estimated size in bytes of the snapshot and of every structure built from it
+        """
+        return self._snapshot.nbytes() + sum(self._derived_sizes.values())
+
+
+class DatasetRegistry:
+    """
+    LRU registry of the named datasets.
+
+    Datasets are loaded lazily on first use, and the least recently used ones
+    are evicted while the loaded datasets exceed the memory budget. A dataset's
+    size is measured at load and again whenever a structure is built from it,
+    so the budget covers the indexes and cached responses built later. The
+    dataset being used is never evicted, even if it alone exceeds the budget.
+    """
+
+    def __init__(self, paths, memory_budget):
+        """
+        Initialize the registry.
+
+        Args:
+            paths (dict): Dataset name to file path
+            memory_budget (int): Maximum estimated bytes of loaded datasets
+        """
+        self.paths = dict(paths)
+        self.memory_budget = memory_budget
+        self._loaded = OrderedDict()  # Name to Dataset, least recently used first
+        self._sizes = {}  # Name to estimated bytes, measured at load and after each structure is built
+        self._stats = {name: {"hits": 0, "loads": 0, "evictions": 0, "last_used": None} for name in self.paths}
+        self._lock = Lock()
+        self._flight = SingleFlight("datasets.load")
+
+    def __contains__(self, name):
+        return name in self.paths
+
+    def get(self, name):
+        """
+        Return a named dataset, loading it if needed.
+
+        Args:
+            name (str): Dataset name
+
+        Returns:
+            Dataset: The loaded dataset
+
+        Raises:
+            KeyError: If no dataset is configured with that name
+        """
+        if name not in self.paths:
+            raise KeyError(name)
+
+        with self._lock:
+            dataset = self._loaded.get(name)
+            stats = self._stats[name]
+            stats["last_used"] = time.time()
+            if dataset is not None:
+                self._loaded.move_to_end(name)
+                stats["hits"] += 1
+                metrics.increment(f"datasets.{name}.hits")
+                return dataset
+
+        # Concurrent first uses of a dataset share one load
+        return self._flight.do(name, lambda: self._load(name))
+
+    def _load(self, name):
+        dataset = Dataset(name, self.paths[name])
+        size = dataset.nbytes()
+        with self._lock:
+            self._loaded[name] = dataset
+            self._loaded.move_to_end(name)
+            self._sizes[name] = size
+            self._stats[name]["loads"] += 1
+            metrics.increment(f"datasets.{name}.loads")
+            metrics.observe(f"datasets.{name}.load", dataset.load_seconds)
+            self._evict()
+        dataset.on_resize = self._resized
+        return dataset
+
+    def _resized(self, dataset):
+        # A structure was built from a dataset in use: count it, and make room for it
+        with self._lock:
+            if self._loaded.get(dataset.name) is not dataset:
+                return  # Evicted meanwhile, its memory is no longer counted
+            self._loaded.move_to_end(dataset.name)
+            self._sizes[dataset.name] = dataset.nbytes()
+            self._evict()
+
+    def _evict(self):
+        # Evict least recently used datasets while over budget, never the most recently used one
+        while sum(self._sizes.values()) > self.memory_budget and len(self._loaded) > 1:
+            evicted, _ = self._loaded.popitem(last=False)
+            del self._sizes[evicted]
+            self._stats[evicted]["evictions"] += 1
+            metrics.increment(f"datasets.{evicted}.evictions")
+
+    def report(self):
+        """
+        Report the state, memory usage and eviction counters of every named dataset.
+
+        Returns:
+            dict: Dictionary with the memory budget, the bytes in use and per-dataset entries
+        """
+        with self._lock:
+            return {
+                "memory_budget": self.memory_budget,
+                "memory_used": sum(self._sizes.values()),
+                "datasets": {name: {
+                    "path": path,
+                    "loaded": name in self._loaded,
+                    "bytes": self._sizes.get(name, 0),
+                    "rows": len(self._loaded[name].snapshot()) if name in self._loaded else 0,
+                    **self._stats[name],
+                } for name, path in self.paths.items()},
+            }
+
+
+# Named datasets configured for this process, besides the main database
+dataset_registry = DatasetRegistry(
+    parse_datasets(environ.get("DATASETS")),
+    int(environ.get("DATASET_MEMORY_BUDGET_MB", "512")) * 2**20,
+)
+
+# The main dataset, used when a request names no dataset
+current_data = CurrentData()
@@ -0,0 +1,135 @@
+"""
+Dictionary encoding module for the Golden Raspberry Awards application.
+
+This module provides a reusable string dictionary that maps repeated strings,
+such as producers and studios, to small integer codes backed by a single
+shared string table.
+"""
+from array import array
+import sys
+
+
+class StringDictionary:
+    """
+    Bidirectional mapping between strings and dense integer codes.
+
+    Codes are assigned in first-seen order starting at 0, so a column of strings
+    can be stored as an array of integers plus one shared table of distinct values.
+    None is a valid value and gets its own code.
+    """
+    __slots__ = ("_codes", "_strings")
+
+    def __init__(self, values=()):
+        """
+        Initialize the dictionary, optionally encoding an initial set of values.
+
+        Args:
+            values (iterable): Strings to encode up front
+        """
+        self._codes = {}  # String to code
+        self._strings = []  # Code to string, the shared string table
+        for value in values:
+            self.encode(value)
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __contains__(self, value):
+        return value in self._codes
+
+    @property
+    def strings(self):
+        """
+        list: The shared string table, indexed by code. Must not be modified.
+        """
+        return self._strings
+
+    def encode(self, value):
+        """
+        Return the code for a value, adding it to the table if it is new.
+
+        Args:
+            value (str): The string to encode
+
+        Returns:
+            int: The code of the value
+        """
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._codes[value] = code
+            self._strings.append(value)
+        return code
+
+    def encode_many(self, values):
+        """
+        Encode a column of strings.
+
+        Args:
+            values (iterable): The strings to encode
+
+        Returns:
+            array: Array of signed integer codes, one per value
+        """
+        return array("i", map(self.encode, values))
+
+    def lookup(self, value):
+        """
+        Return the code for a value without adding it.
+
+        Args:
+            value (str): The string to look up
+
+        Returns:
+            int: The code of the value, or None if it was never encoded
+        """
+        return self._codes.get(value)
+
+    def decode(self, code):
+        """
+        Return the string for a code.
+
+        Args:
+            code (int): A code returned by encode
+
+        Returns:
+            str: The encoded string
+        """
+        return self._strings[code]
+
+    def decode_many(self, codes):
+        """
+        Decode a column of codes.
+
+        Args:
+            codes (iterable): Codes returned by encode
+
+        Returns:
+            list: The decoded strings
+        """
+        strings = self._strings
+        return [strings[code] for code in codes]
+
+    def nbytes(self):
+        """
+        Estimate the memory held by the dictionary: the string table, its strings and the code mapping.
+
+        Returns:
+            int: Estimated size in bytes
+        """
+        return sys.getsizeof(self._strings) + sum(map(sys.getsizeof, self._strings)) + sys.getsizeof(self._codes)
+
+    def intern(self, value):
+        """
+        Return the canonical shared instance of a string.
+
+        Equal strings passed through the same dictionary come back as the same
+        object, so repeated values are stored only once in memory.
+
+        Args:
+            value (str): The string to intern
+
+        Returns:
+            str: The shared instance equal to value
+        """
+        return self._strings[self.encode(value)]
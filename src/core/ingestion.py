@@ -0,0 +1,367 @@
+"""
+Dataset ingestion module for the Golden Raspberry Awards application.
+
+This module replaces the award data from uploaded dataset files while the
+application keeps serving. An upload is spooled to disk and queued as a job;
+a background worker parses it into a staging table in small transactions, then
+swaps the staging table for the awards table in one short transaction. Readers
+keep seeing the previous data until that swap commits. The worker then builds
+the snapshot, indexes and cached answers of the new data, so the first requests
+after a load do not rebuild them.
+
+On a file database every thread has its own connection and the worker runs
+alongside the requests. On an in-memory database, whose single connection is
+shared with the requests, each transaction of the worker waits for the
+request in progress and requests wait for the transaction in progress, so
+their statements never interleave on the connection.
+"""
+from src.core.awards import AwardsCore  # Warm-up of the answers after a swap
+from src.core.rollups import rollup_store  # Nomination and win counts, rebuilt after a swap
+from src.model.awards import Awards, LOAD_BATCH_SIZE  # Awards model and its insert batch size
+from src.service.db import db  # SQLAlchemy database instance
+from src.service.health import readiness  # Not ready while the answers of the new data are built
+from src.service.metrics import metrics  # Process-wide metrics registry
+from src.service.readers import read_rows  # Dataset reader for every supported format
+from src.service.serving import shared_connection_lock  # Serializes the worker with requests on an in-memory database
+from src.service.version import data_version  # Invalidates everything built from the previous data
+
+from sqlalchemy import MetaData, insert, text
+
+from collections import OrderedDict
+from os import environ
+from queue import Queue
+from threading import Lock, Thread
+import os
+import tempfile
+import time
+import uuid
+
+# Bytes read from the request body at a time while spooling an upload
+SPOOL_CHUNK_SIZE = 1 << 16
+
+# Finished jobs kept for the status endpoint, the oldest are forgotten first
+MAX_FINISHED_JOBS = 100
+
+# Errors kept per job
+MAX_ERRORS = 20
+
+# Name of the table an upload is parsed into before the swap
+STAGING_TABLE = "awards_staging"
+PREVIOUS_TABLE = "awards_previous"
+
+
+class UploadTooLarge(Exception):
+    """
+    Raised when an upload exceeds the maximum size.
+    """
+
+
+class IngestionJob:
+    """
+    One uploaded dataset and the progress of its ingestion.
+
+    Attributes:
+        id (str): Job identifier
+        status (str): "queued", "parsing", "swapping", "warming", "completed" or "failed"
+        path (str): Spooled upload, removed once the job finishes
+        delimiter (str): CSV delimiter of the upload
+        bytes (int): Size of the upload
+        rows (int): Rows parsed into the staging table so far
+        errors (list): Error messages, with the 1-based index of the data row for rows that could not be parsed
+        created_at (float): Upload time, as a Unix timestamp
+        started_at (float): Start of the ingestion, as a Unix timestamp, None while queued
+        finished_at (float): End of the ingestion, as a Unix timestamp, None while running
+    """
+
+    def __init__(self, path, size, delimiter):
+        self.id = uuid.uuid4().hex
+        self.status = "queued"
+        self.path = path
+        self.delimiter = delimiter
+        self.bytes = size
+        self.rows = 0
+        self.errors = []
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def report(self):
+        """
+        Return the progress of the job.
+
+        Returns:
+            dict: Status, size, rows processed, throughput and errors of the job
+        """
+        seconds = None
+        if self.started_at is not None:
+            seconds = (self.finished_at or time.time()) - self.started_at
+        return {
+            "id": self.id,
+            "status": self.status,
+            "bytes": self.bytes,
+            "rows": self.rows,
+            "seconds": seconds,
+            "rows_per_second": self.rows / seconds if seconds else None,
+            "errors": list(self.errors),
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class IngestionManager:
+    """
+    Spools uploads and ingests them one at a time on a background worker thread.
+
+    Counters "ingestion.completed" and "ingestion.failed" and the timings
+    "ingestion.parse" and "ingestion.swap" are kept in the metrics registry.
+    """
+
+    def __init__(self, spool_dir=None, max_bytes=None, registry=metrics):
+        """
+        Initialize the manager.
+
+        Args:
+            spool_dir (str): Directory uploads are spooled to, the system temporary directory if None
+            max_bytes (int): Maximum upload size in bytes, unlimited if None
+            registry (Metrics): Metrics registry receiving the counters and timings
+        """
+        self.spool_dir = spool_dir
+        self.max_bytes = max_bytes
+        self.metrics = registry
+        self.app = None
+        self._jobs = OrderedDict()  # Job id to IngestionJob, oldest first
+        self._queue = Queue()
+        self._worker = None
+        self._lock = Lock()
+
+    def init_app(self, app):
+        """
+        Bind the manager to the application whose database the worker writes.
+
+        Args:
+            app (Flask): The Flask application
+        """
+        self.app = app
+
+    def submit(self, stream, delimiter=None):
+        """
+        Spool an upload to disk and queue its ingestion.
+
+        Args:
+            stream (file): Binary stream of the uploaded dataset, in any format supported by read_rows
+            delimiter (str): CSV delimiter, the CSV_DELIMITER environment variable or ";" if None
+
+        Returns:
+            IngestionJob: The queued job
+
+        Raises:
+            UploadTooLarge: If the upload exceeds max_bytes
+        """
+        descriptor, path = tempfile.mkstemp(prefix="awards-upload-", dir=self.spool_dir)
+        size = 0
+        try:
+            with os.fdopen(descriptor, "wb") as spool:
+                while chunk := stream.read(SPOOL_CHUNK_SIZE):
+                    size += len(chunk)
+                    if self.max_bytes is not None and size > self.max_bytes:
+                        raise UploadTooLarge(f"Upload larger than {self.max_bytes} bytes")
+                    spool.write(chunk)
+        except BaseException:
+            os.remove(path)
+            raise
+
+        job = IngestionJob(path, size, delimiter or environ.get("CSV_DELIMITER", ";"))
+        with self._lock:
+            self._jobs[job.id] = job
+            self._forget_finished()
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = Thread(target=self._run, name="awards-ingestion", daemon=True)
+                self._worker.start()
+        self._queue.put(job)
+        return job
+
+    def get(self, job_id):
+        """
+        Return a job by id.
+
+        Args:
+            job_id (str): Job identifier
+
+        Returns:
+            IngestionJob: The job, None if unknown or forgotten
+        """
+        return self._jobs.get(job_id)
+
+    def jobs(self):
+        """
+        Return every known job, oldest first.
+
+        Returns:
+            list: IngestionJob instances
+        """
+        return list(self._jobs.values())
+
+    def wait(self, timeout=None):
+        """
+        Wait until every queued job has finished.
+
+        Args:
+            timeout (float): Maximum seconds to wait, unbounded if None
+
+        Returns:
+            bool: True if the queue was drained in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _forget_finished(self):
+        # Keep the history bounded, dropping the oldest finished jobs
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished_at is not None]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                with self.app.app_context():
+                    self._ingest(job)
+            except Exception as e:
+                # Record what escaped the job, such as a failed cleanup, and go on with the queued jobs
+                if job.status != "failed":
+                    job.status = "failed"
+                    self.metrics.increment("ingestion.failed")
+                if len(job.errors) < MAX_ERRORS:
+                    job.errors.append(str(e))
+                if job.finished_at is None:
+                    job.finished_at = time.time()
+            finally:
+                self._queue.task_done()
+
+    def _ingest(self, job):
+        """
+        Parse a spooled upload into the staging table and swap it for the awards table.
+
+        Args:
+            job (IngestionJob): The job to run
+        """
+        job.started_at = time.time()
+        job.status = "parsing"
+        staging = Awards.__table__.to_metadata(MetaData(), name=STAGING_TABLE)
+        engine = db.engine
+        try:
+            with self.metrics.timer("ingestion.parse"):
+                with shared_connection_lock.hold(), engine.begin() as connection:
+                    staging.drop(connection, checkfirst=True)
+                    staging.create(connection)
+                self._parse(job, engine, staging)
+            if not job.rows:
+                raise ValueError("The upload has no rows")
+
+            job.status = "swapping"
+            with self.metrics.timer("ingestion.swap"):
+                self._swap(engine)
+        except Exception as e:
+            job.status = "failed"
+            if len(job.errors) < MAX_ERRORS:
+                job.errors.append(str(e))
+            with shared_connection_lock.hold(), engine.begin() as connection:
+                staging.drop(connection, checkfirst=True)
+            self.metrics.increment("ingestion.failed")
+        else:
+            job.status = "warming"
+            try:
+                with self.metrics.timer("ingestion.warmup"):
+                    self._warm_up()
+            except Exception as e:
+                # The new data is in place, the requests build what the warm-up could not
+                job.errors.append(f"Warm-up: {e!r}")
+            job.status = "completed"
+            self.metrics.increment("ingestion.completed")
+        finally:
+            job.finished_at = time.time()
+            os.remove(job.path)
+
+    def _parse(self, job, engine, staging):
+        """
+        Insert the rows of an upload into the staging table, one transaction per batch.
+
+        Rows are reported by their 1-based index among the data rows rather than by
+        line, since compressed and columnar uploads have no meaningful line numbers.
+
+        Raises:
+            ValueError: If a row cannot be parsed, naming its index
+        """
+        rows = read_rows(job.path, delimiter=job.delimiter)
+        batch = []
+        while True:
+            index = job.rows + len(batch) + 1
+            try:
+                year, title, studios, producers, winner = next(rows)
+            except StopIteration:
+                break
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Row {index}: {e!r}")
+            if not title:
+                raise ValueError(f"Row {index}: missing title")
+
+            batch.append({"year": year, "title": title, "studios": studios, "producers": producers, "winner": winner})
+            if len(batch) == LOAD_BATCH_SIZE:
+                with shared_connection_lock.hold(), engine.begin() as connection:
+                    connection.execute(insert(staging), batch)
+                job.rows += len(batch)
+                batch = []
+        if batch:
+            with shared_connection_lock.hold(), engine.begin() as connection:
+                connection.execute(insert(staging), batch)
+            job.rows += len(batch)
+
+    def _swap(self, engine):
+        """
+        Replace the awards table by the staging table in one transaction.
+
+        Renaming tables only rewrites the schema, so the transaction stays short whatever the upload size.
+        """
+        with shared_connection_lock.hold(), engine.begin() as connection:
+            connection.execute(text(f"DROP TABLE IF EXISTS {PREVIOUS_TABLE}"))
+            connection.execute(text(f"ALTER TABLE {Awards.__tablename__} RENAME TO {PREVIOUS_TABLE}"))
+            connection.execute(text(f"ALTER TABLE {STAGING_TABLE} RENAME TO {Awards.__tablename__}"))
+            connection.execute(text(f"DROP TABLE {PREVIOUS_TABLE}"))
+
+        # Engine-level writes bypass the session listeners, so invalidate what was built from the previous data
+        rollup_store.invalidate()
+        data_version.bump()
+
+    def _warm_up(self):
+        """
+        Build the snapshot, indexes, rollups and cached answers of the swapped data.
+
+        The instance reports not ready meanwhile, and ready again once the warm-up ends.
+        On an in-memory database the shared connection is held for the whole warm-up
+        and the session removed before it is released, as at the end of a request.
+        """
+        readiness.mark_not_ready(reason="warming up")
+        timings = {}
+        try:
+            with shared_connection_lock.hold():
+                try:
+                    timings = AwardsCore().warm_up()
+                finally:
+                    db.session.remove()
+        finally:
+            # After a failed warm-up the requests build the answers, the data itself is in place
+            readiness.mark_ready(warmup=timings)
+
+
+def _max_bytes():
+    # Maximum upload size from INGESTION_MAX_MB, unlimited when unset or 0
+    megabytes = float(environ.get("INGESTION_MAX_MB", "0"))
+    return int(megabytes * 2**20) if megabytes > 0 else None
+
+
+# Process-wide ingestion manager, bound to the application in api.py
+ingestion_manager = IngestionManager(spool_dir=environ.get("INGESTION_SPOOL_DIR") or None, max_bytes=_max_bytes())
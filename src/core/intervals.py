@@ -0,0 +1,196 @@
+"""
+Interval index module for the Golden Raspberry Awards application.
+
+This module indexes the intervals between consecutive wins of producers,
+studios and other dimensions so the shortest and longest intervals can be
+answered for any window of years without rescanning the awards table.
+"""
+from src.core.snapshot import derived
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+# Snapshot columns with consecutive win intervals. Entries of every dimension name the value
+# "producer", so answers keep the shape of the consecutive awards response whatever the dimension
+DIMENSIONS = ("producers", "studios")
+
+
+class IntervalIndex:
+    """
+    Index of the intervals between consecutive wins of each value of one dimension.
+
+    Two consecutive wins of a producer both fall inside a window of years
+    exactly when the interval between them starts at or after the window start
+    and ends at or before the window end. Since the end of an interval is its
+    start plus its length, fixing the length turns that into a single range of
+    start years. The index therefore keeps, per distinct interval length, the
+    sorted start years of the intervals with that length, and answers a window
+    by bisecting the lengths in increasing (min) or decreasing (max) order.
+    Distinct lengths are bounded by the span of years in the dataset.
+
+    Indexes are built by build_interval_indexes, which fills every dimension
+    from a single sorted scan of the winning rows.
+
+    Attributes:
+        snapshot (AwardsSnapshot): Snapshot the index was built from
+        column (str): Encoded snapshot column wins are grouped by
+        wins (dict): Code to the sorted array of its winning years
+        lengths (list): Distinct interval lengths, ascending
+        starts (dict): Length to the sorted start years of the intervals with that length
+        rows (dict): Length to the snapshot rows of those intervals, parallel to starts
+    """
+
+    def __init__(self, snapshot, column="producers"):
+        """
+        Create an empty index, filled by build_interval_indexes.
+
+        Args:
+            snapshot (AwardsSnapshot): Snapshot of the awards table
+            column (str): Encoded snapshot column to group wins by
+        """
+        self.snapshot = snapshot
+        self.column = column
+        self.wins = {}
+        self.lengths = []
+        self.starts = {}
+        self.rows = {}
+
+    def _window(self, length, year_from, year_to):
+        # Positions of the intervals of this length lying inside [year_from, year_to]
+        starts = self.starts[length]
+        low = 0 if year_from is None else bisect_left(starts, year_from)
+        high = len(starts) if year_to is None else bisect_right(starts, year_to - length)
+        return low, high
+
+    def _entries(self, length, low, high):
+        # Decode the intervals of one length, in row order like the SQL query
+        dictionary, codes, years = self.snapshot.dictionaries[self.column], self.snapshot.codes[self.column], self.snapshot.years
+        return [{
+            "producer": dictionary.decode(codes[index]),
+            "interval": length,
+            "previousWin": years[index],
+            "followingWin": years[index] + length,
+        } for index in sorted(self.rows[length][low:high])]
+
+    def query(self, year_from=None, year_to=None):
+        """
+        Find the shortest and longest intervals between consecutive wins inside a window of years.
+
+        Args:
+            year_from (int): First year of the window, unbounded if None
+            year_to (int): Last year of the window, unbounded if None
+
+        Returns:
+            dict: Dictionary containing lists of entries with the shortest and longest intervals
+        """
+        shortest = longest = None
+        for length in self.lengths:
+            low, high = self._window(length, year_from, year_to)
+            if low < high:
+                shortest = (length, low, high)
+                break
+        if shortest is None:
+            return {"min": [], "max": []}
+
+        for length in reversed(self.lengths):
+            low, high = self._window(length, year_from, year_to)
+            if low < high:
+                longest = (length, low, high)
+                break
+
+        # As in the SQL query, the max list is empty when it would repeat the min list
+        return {
+            "min": self._entries(*shortest),
+            "max": self._entries(*longest) if longest[0] != shortest[0] else [],
+        }
+
+    def wins_between(self, value, year_from=None, year_to=None):
+        """
+        List the winning years of a dimension value inside a window of years.
+
+        Args:
+            value (str): Producer or studio as stored in the awards table
+            year_from (int): First year of the window, unbounded if None
+            year_to (int): Last year of the window, unbounded if None
+
+        Returns:
+            list: Sorted winning years, with repeats for several wins in one year
+        """
+        code = self.snapshot.dictionaries[self.column].lookup(value)
+        code_years = self.wins.get(code)
+        if code_years is None:
+            return []
+        low = 0 if year_from is None else bisect_left(code_years, year_from)
+        high = len(code_years) if year_to is None else bisect_right(code_years, year_to)
+        return list(code_years[low:high])
+
+
+def build_interval_indexes(snapshot, columns=tuple(DIMENSIONS)):
+    """
+    Build the interval indexes of several dimensions from one sorted scan of the winners.
+
+    The winner filter and the sort by year are shared by every dimension. While
+    scanning in year order each dimension keeps, per value, its last winning year
+    and the rows won in that year; the next later win closes an interval for each
+    of those rows. Intervals of one length are closed in increasing start order,
+    so the per-length arrays come out sorted without a second sort.
+
+    Args:
+        snapshot (AwardsSnapshot): Snapshot of the awards table
+        columns (iterable): Encoded snapshot columns to index
+
+    Returns:
+        dict: Column name to its IntervalIndex
+    """
+    years, winners = snapshot.years, snapshot.winners
+    winning = sorted((index for index in range(len(snapshot)) if winners[index]), key=years.__getitem__)
+
+    indexes = {}
+    for column in columns:
+        index = indexes[column] = IntervalIndex(snapshot, column)
+        codes = snapshot.codes[column]
+        # As in the SQL query, where NULL never equals NULL, rows without a value form no intervals
+        null = snapshot.dictionaries[column].lookup(None)
+        last = {}  # Code to (last winning year, rows won that year)
+        wins, starts, rows = {}, {}, {}
+
+        for row in winning:
+            year, code = years[row], codes[row]
+            if code == null:
+                continue
+            wins.setdefault(code, []).append(year)
+            previous = last.get(code)
+            if previous is None or previous[0] < year:
+                if previous is not None:
+                    length = year - previous[0]
+                    length_starts, length_rows = starts.get(length), rows.get(length)
+                    if length_starts is None:
+                        length_starts, length_rows = starts[length], rows[length] = array("i"), array("i")
+                    for previous_row in previous[1]:
+                        length_starts.append(previous[0])
+                        length_rows.append(previous_row)
+                last[code] = (year, [row])
+            else:
+                previous[1].append(row)
+
+        index.wins = {code: array("i", code_years) for code, code_years in wins.items()}
+        index.lengths = sorted(starts)
+        index.starts, index.rows = starts, rows
+    return indexes
+
+
+def current_interval_index(column="producers"):
+    """
+    Return the interval index of a dimension over the current data, rebuilding it after writes.
+
+    The indexes of every dimension are built together, so asking for a second
+    dimension of the same data is free.
+
+    Args:
+        column (str): Dimension to index, one of DIMENSIONS
+
+    Returns:
+        IntervalIndex: Index over the current snapshot
+    """
+    return derived("interval-indexes", build_interval_indexes)[column]
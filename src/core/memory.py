@@ -0,0 +1,112 @@
+"""
+Memory accounting module for the Golden Raspberry Awards application.
+
+This module reports the memory used by the loaded data: the SQLite database
+pages and allocator counters, the in-memory snapshot and the structures built
+from it, the response cache and the named datasets, plus tracemalloc and
+process counters when available.
+"""
+from src.core.datasets import dataset_registry
+from src.core.rollups import rollup_store
+from src.core.snapshot import built_structures
+from src.service.cache import response_cache
+from src.service.db import db
+from src.service.sizing import deep_sizeof  # Deep size estimate, shared with the named datasets
+
+from sqlalchemy import text
+import ctypes
+import sys
+import tracemalloc
+
+# sqlite3_status64 operation codes
+SQLITE_STATUS_MEMORY_USED = 0
+SQLITE_STATUS_PAGECACHE_USED = 1
+
+def sqlite_status():
+    """
+    Read the SQLite allocator counters of the process.
+
+    Python's sqlite3 module does not expose sqlite3_status64, so it is called
+    through ctypes on the library the module is linked against.
+
+    Returns:
+        dict: Current and highwater bytes of the SQLite heap and page cache, None if unavailable
+    """
+    try:
+        import _sqlite3
+        status64 = ctypes.CDLL(_sqlite3.__file__).sqlite3_status64
+    except (ImportError, OSError, AttributeError):
+        return None
+
+    counters = {}
+    for name, operation in (("memory", SQLITE_STATUS_MEMORY_USED), ("pagecache", SQLITE_STATUS_PAGECACHE_USED)):
+        current, highwater = ctypes.c_int64(), ctypes.c_int64()
+        if status64(operation, ctypes.byref(current), ctypes.byref(highwater), 0) != 0:
+            return None
+        counters[f"{name}_used"] = current.value
+        counters[f"{name}_highwater"] = highwater.value
+    return counters
+
+
+def database_pages():
+    """
+    Read the page counts of the database the application is connected to.
+
+    Returns:
+        dict: Page size, page and free page counts and total bytes, None for databases other than SQLite
+    """
+    if db.engine.dialect.name != "sqlite":
+        return None
+    page_size = db.session.execute(text("PRAGMA page_size")).scalar()
+    page_count = db.session.execute(text("PRAGMA page_count")).scalar()
+    freelist_count = db.session.execute(text("PRAGMA freelist_count")).scalar()
+    return {"page_size": page_size, "page_count": page_count, "freelist_count": freelist_count, "bytes": page_size * page_count}
+
+
+def process_memory():
+    """
+    Read the peak resident set size of the process.
+
+    Returns:
+        dict: Peak resident bytes, None where the resource module is unavailable
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {"max_rss": max_rss if sys.platform == "darwin" else max_rss * 1024}  # Linux reports kilobytes
+
+
+def memory_report():
+    """
+    Report the memory used by the loaded data.
+
+    Only structures already built are measured; the report never builds them.
+    Must run inside an application context.
+
+    Returns:
+        dict: Bytes per component, rows in the main dataset and bytes per row
+    """
+    seen = set()
+    structures = {name: deep_sizeof(structure, seen) for name, structure in built_structures().items()}
+    rollups = rollup_store.peek()
+    if rollups is not None:
+        structures["rollups"] = deep_sizeof(rollups, seen)
+    structures["response-cache"] = deep_sizeof(response_cache.entries(), seen)
+
+    rows = db.session.execute(text("SELECT count(*) FROM awards")).scalar()
+    database = database_pages()
+    in_memory = sum(structures.values()) + (database["bytes"] if database else 0)
+
+    return {
+        "rows": rows,
+        "bytes": in_memory,
+        "bytes_per_row": in_memory / rows if rows else None,
+        "database": database,
+        "sqlite": sqlite_status(),
+        "structures": structures,
+        "datasets": {name: entry["bytes"] for name, entry in dataset_registry.report()["datasets"].items()},
+        "tracemalloc": dict(zip(("current", "peak"), tracemalloc.get_traced_memory())) if tracemalloc.is_tracing() else None,
+        "process": process_memory(),
+    }
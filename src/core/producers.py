@@ -0,0 +1,132 @@
+"""
+Producer index module for the Golden Raspberry Awards application.
+
+This module splits the producers column into individual producer names and
+indexes them in a sorted array, so producers can be searched by prefix and
+their nomination history read without scanning the awards table.
+"""
+from src.core.snapshot import derived
+
+from bisect import bisect_left
+import re
+
+# Producers are listed as "A, B and C"
+PRODUCER_SEPARATOR = re.compile(r",\s*(?:and\s+)?|\s+and\s+")
+
+# Sorts after any character that can follow a prefix, closing the bisect range
+PREFIX_END = "\U0010ffff"
+
+
+def split_producers(value):
+    """
+    Split a producers column value into individual producer names.
+
+    Args:
+        value (str): Value of the producers column, such as "Wyck Godfrey, Stephenie Meyer and Karen Rosenfelt"
+
+    Returns:
+        list: The producer names, in order, without duplicates
+    """
+    if not value:
+        return []
+    names = []
+    for name in PRODUCER_SEPARATOR.split(value):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+class ProducerIndex:
+    """
+    Sorted index of individual producer names over a snapshot.
+
+    Names are kept sorted by their case-folded form, so a case-insensitive prefix
+    is a contiguous range found with two bisections.
+
+    Attributes:
+        snapshot (AwardsSnapshot): Snapshot the index was built from
+        keys (list): Case-folded names, sorted
+        names (list): Producer names, parallel to keys
+        rows (list): Snapshot rows of each name's nominations, parallel to keys
+    """
+
+    def __init__(self, snapshot):
+        """
+        Build the index from a snapshot.
+
+        Args:
+            snapshot (AwardsSnapshot): Snapshot of the awards table
+        """
+        self.snapshot = snapshot
+
+        # Split each distinct producers value once, then map its names to the value's rows
+        strings, codes = snapshot.dictionaries["producers"].strings, snapshot.codes["producers"]
+        split = [split_producers(value) for value in strings]
+        rows = {}
+        for index in range(len(snapshot)):
+            for name in split[codes[index]]:
+                rows.setdefault(name, []).append(index)
+
+        entries = sorted((name.casefold(), name) for name in rows)
+        self.keys = [key for key, _ in entries]
+        self.names = [name for _, name in entries]
+        self.rows = [rows[name] for name in self.names]
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, prefix, limit=None):
+        """
+        Find the producers whose name starts with a prefix, ignoring case.
+
+        Args:
+            prefix (str): Start of the producer name
+            limit (int): Maximum number of producers returned, unlimited if None
+
+        Returns:
+            list: Dictionaries with the producer name and its nomination and win counts, sorted by name
+        """
+        prefix = prefix.casefold()
+        low = bisect_left(self.keys, prefix)
+        high = bisect_left(self.keys, prefix + PREFIX_END, low)
+        if limit is not None:
+            high = min(high, low + limit)
+
+        winners = self.snapshot.winners
+        return [{
+            "producer": self.names[position],
+            "nominations": len(self.rows[position]),
+            "wins": sum(winners[index] for index in self.rows[position]),
+        } for position in range(low, high)]
+
+    def history(self, name):
+        """
+        List the nominations of a producer, matching the name exactly but ignoring case.
+
+        Args:
+            name (str): Producer name
+
+        Returns:
+            list: Award dictionaries of the producer's nominations, ordered by year and id
+        """
+        key = name.casefold()
+        position = bisect_left(self.keys, key)
+        rows = []
+        while position < len(self.keys) and self.keys[position] == key:
+            rows.extend(self.rows[position])
+            position += 1
+
+        snapshot = self.snapshot
+        rows.sort(key=lambda index: (snapshot.years[index], snapshot.ids[index]))
+        return [snapshot.record(index).to_dict() for index in rows]
+
+
+def current_producer_index():
+    """
+    Return the producer index of the current data, rebuilding it after writes.
+
+    Returns:
+        ProducerIndex: Index over the current snapshot
+    """
+    return derived("producer-index", ProducerIndex)
@@ -0,0 +1,218 @@
+"""
+Rollup statistics module for the Golden Raspberry Awards application.
+
+This module keeps nomination and win counts per year, studio and producer.
+The counts are built once from the snapshot and then updated from the
+session's writes, so serving them never aggregates the whole table.
+"""
+from src.core.producers import split_producers
+from src.core.snapshot import current_snapshot
+from src.model.awards import Awards
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from heapq import nsmallest
+from threading import Lock
+
+# Groups with rollups, to the key naming the group value in each entry
+GROUPS = {"year": "year", "studios": "studio", "producers": "producer"}
+
+# Orders available for the rollup entries
+ORDERS = ("nominations", "wins")
+
+
+class Rollups:
+    """
+    Exact nomination and win counts per year, studio and producer.
+
+    Studios and producers listed together ("A, B and C") are counted individually.
+
+    Attributes:
+        counts (dict): Group name to a dictionary of value to [nominations, wins]
+    """
+
+    def __init__(self):
+        self.counts = {group: {} for group in GROUPS}
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """
+        Build the rollups of a snapshot.
+
+        Args:
+            snapshot (AwardsSnapshot): Snapshot of the awards table
+
+        Returns:
+            Rollups: The counts of every row of the snapshot
+        """
+        rollups = cls()
+        for record in snapshot.records():
+            rollups.add(record.year, record.studios, record.producers, record.winner)
+        return rollups
+
+    def copy(self):
+        """
+        Return an independent copy of the counts.
+
+        Returns:
+            Rollups: Rollups with the same counts
+        """
+        rollups = Rollups()
+        rollups.counts = {group: {value: list(count) for value, count in values.items()} for group, values in self.counts.items()}
+        return rollups
+
+    def add(self, year, studios, producers, winner, sign=1):
+        """
+        Count one award row, or remove it from the counts with sign=-1.
+
+        Args:
+            year (int): Award year
+            studios (str): Value of the studios column
+            producers (str): Value of the producers column
+            winner (bool): Whether the movie won
+            sign (int): 1 to add the row, -1 to remove it
+        """
+        win = sign if winner else 0
+        self._add("year", year, sign, win)
+        # Studios are listed in the same format as producers
+        for studio in split_producers(studios):
+            self._add("studios", studio, sign, win)
+        for producer in split_producers(producers):
+            self._add("producers", producer, sign, win)
+
+    def _add(self, group, value, nominations, wins):
+        counts = self.counts[group]
+        count = counts.get(value)
+        if count is None:
+            count = counts[value] = [0, 0]
+        count[0] += nominations
+        count[1] += wins
+        if count[0] <= 0:
+            del counts[value]
+
+    def top(self, group, order="nominations", limit=None):
+        """
+        List the counts of a group, highest first.
+
+        Args:
+            group (str): One of GROUPS
+            order (str): One of ORDERS, the count entries are sorted by
+            limit (int): Maximum number of entries, every entry if None
+
+        Returns:
+            list: Dictionaries with the group value and its nomination and win counts
+        """
+        position = ORDERS.index(order)
+
+        def sort_key(item):
+            # Highest count first, ties by ascending value
+            value, count = item
+            return (-count[position], str(value))
+
+        items = self.counts[group].items()
+        items = sorted(items, key=sort_key) if limit is None else nsmallest(limit, items, key=sort_key)
+        return [{GROUPS[group]: value, "nominations": count[0], "wins": count[1]} for value, count in items]
+
+
+class RollupStore:
+    """
+    Holder of the current rollups, kept up to date from session writes.
+
+    Inserts and deletes made through the unit of work are applied as deltas
+    to a copy of the current rollups, which then replaces them, so readers
+    never see a half-applied write and never take the lock. Other writes (updates and statement-level writes) and rollbacks make the
+    rollups stale, and they are rebuilt from the snapshot on the next read.
+    """
+
+    def __init__(self):
+        self._rollups = None  # None while stale
+        self._generation = 0  # Changes on every write, so a rebuild racing a write is discarded
+        self._lock = Lock()
+
+    def get(self):
+        """
+        Return the current rollups, rebuilding them if stale.
+
+        Returns:
+            Rollups: Counts matching the current data
+        """
+        rollups = self._rollups
+        if rollups is not None:
+            return rollups
+
+        generation = self._generation
+        rollups = Rollups.from_snapshot(current_snapshot())
+        with self._lock:
+            if generation == self._generation:
+                self._rollups = rollups
+        return rollups
+
+    def peek(self):
+        """
+        Return the current rollups without rebuilding them.
+
+        Returns:
+            Rollups: The current rollups, None if stale
+        """
+        return self._rollups
+
+    def apply(self, added=(), deleted=()):
+        """
+        Apply inserted and deleted rows to the current rollups.
+
+        Args:
+            added (iterable): Awards instances inserted
+            deleted (iterable): Awards instances deleted
+        """
+        with self._lock:
+            self._generation += 1
+            if self._rollups is None:
+                return
+            rollups = self._rollups.copy()
+            for sign, awards in ((1, added), (-1, deleted)):
+                for award in awards:
+                    rollups.add(award.year, award.studios, award.producers, award.winner, sign)
+            self._rollups = rollups
+
+    def invalidate(self):
+        """
+        Mark the rollups as stale.
+        """
+        with self._lock:
+            self._generation += 1
+            self._rollups = None
+
+
+# Process-wide rollups of the awards table
+rollup_store = RollupStore()
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    if any(isinstance(award, Awards) for award in session.dirty):
+        rollup_store.invalidate()
+        return
+    added = [award for award in session.new if isinstance(award, Awards)]
+    deleted = [award for award in session.deleted if isinstance(award, Awards)]
+    if added or deleted:
+        session.info["rollups_applied"] = True
+        rollup_store.apply(added, deleted)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    session.info.pop("rollups_applied", None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        rollup_store.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    # Deltas of a rolled back flush were already applied
+    if session.info.pop("rollups_applied", False):
+        rollup_store.invalidate()
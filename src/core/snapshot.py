@@ -0,0 +1,229 @@
+"""
+In-memory snapshot module for the Golden Raspberry Awards application.
+
+This module keeps a compact, columnar copy of the awards table in memory.
+The repetitive producers and studios columns are dictionary-encoded: each row
+stores an integer code and the distinct strings live in one shared table,
+so comparisons become integer equality and repeated strings are stored once.
+"""
+from src.core.dictionary import StringDictionary
+from src.model.awards import Awards, AwardRecord
+from src.service.coalesce import SingleFlight
+from src.service.readers import detect_format, read_columnar
+from src.service.version import data_version
+
+from array import array
+import sys
+
+# Columns stored as integer codes plus a shared string table
+ENCODED_COLUMNS = ("producers", "studios")
+
+
+class AwardsSnapshot:
+    """
+    Immutable columnar copy of the awards table, ordered by id.
+
+    Attributes:
+        version (int): Data version the snapshot was built from
+        ids (array): Award ids
+        years (array): Award years
+        titles (list): Movie titles
+        winners (bytearray): 1 for winning rows, 0 otherwise
+        codes (dict): Column name to array of dictionary codes, for ENCODED_COLUMNS
+        dictionaries (dict): Column name to the StringDictionary holding its strings
+    """
+    __slots__ = ("version", "ids", "years", "titles", "winners", "codes", "dictionaries")
+
+    def __init__(self, version=None):
+        self.version = version
+        self.ids = array("q")
+        self.years = array("i")
+        self.titles = []
+        self.winners = bytearray()
+        self.dictionaries = {column: StringDictionary() for column in ENCODED_COLUMNS}
+        self.codes = {column: array("i") for column in ENCODED_COLUMNS}
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_records(cls, records, version=None):
+        """
+        Build a snapshot from AwardRecord rows.
+
+        Args:
+            records (iterable): AwardRecord rows ordered by id
+            version (int): Data version the records were read at
+
+        Returns:
+            AwardsSnapshot: The encoded snapshot
+        """
+        snapshot = cls(version)
+        producers, studios = snapshot.dictionaries["producers"], snapshot.dictionaries["studios"]
+        producer_codes, studio_codes = snapshot.codes["producers"], snapshot.codes["studios"]
+        for record in records:
+            snapshot.ids.append(record.id)
+            snapshot.years.append(record.year)
+            snapshot.titles.append(record.title)
+            snapshot.winners.append(1 if record.winner else 0)
+            producer_codes.append(producers.encode(record.producers))
+            studio_codes.append(studios.encode(record.studios))
+        return snapshot
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Build a snapshot straight from a dataset file.
+
+        Columnar files are loaded column by column, copying the arrays and string
+        tables as they are; other formats go through Awards.read_dataset.
+
+        Args:
+            path (str): Path of the dataset file
+
+        Returns:
+            AwardsSnapshot: The encoded snapshot, with ids numbered from 1 in file order
+        """
+        if detect_format(path) != "columnar":
+            return cls.from_records(Awards.read_dataset(path))
+
+        columns = read_columnar(path)
+        snapshot = cls()
+        snapshot.ids = array("q", range(1, len(columns["years"]) + 1))
+        snapshot.years = columns["years"]
+        snapshot.titles = columns["titles"]
+        snapshot.winners = bytearray(columns["winners"])
+        for column in ENCODED_COLUMNS:
+            codes, strings = columns[column]
+            snapshot.codes[column] = codes
+            snapshot.dictionaries[column] = StringDictionary(strings)
+        return snapshot
+
+    @classmethod
+    def from_database(cls):
+        """
+        Build a snapshot of the current awards table.
+
+        Returns:
+            AwardsSnapshot: The encoded snapshot, tagged with the current data version
+        """
+        # Read the version first, so a concurrent write makes the snapshot look stale rather than current
+        version = data_version.value
+        return cls.from_records(Awards.iter_records(), version)
+
+    def nbytes(self):
+        """
+        Estimate the memory held by the snapshot.
+
+        Counts the column arrays, the titles and the shared string tables; strings
+        shared with other objects are counted as if owned by the snapshot.
+
+        Returns:
+            int: Estimated size in bytes
+        """
+        size = sys.getsizeof(self.ids) + sys.getsizeof(self.years) + sys.getsizeof(self.winners)
+        size += sys.getsizeof(self.titles) + sum(map(sys.getsizeof, self.titles))
+        for column in ENCODED_COLUMNS:
+            size += sys.getsizeof(self.codes[column]) + self.dictionaries[column].nbytes()
+        return size
+
+    def record(self, index):
+        """
+        Decode a single row of the snapshot.
+
+        Args:
+            index (int): Row position in the snapshot
+
+        Returns:
+            AwardRecord: The decoded row
+        """
+        return AwardRecord(
+            self.ids[index],
+            self.years[index],
+            self.titles[index],
+            self.dictionaries["studios"].decode(self.codes["studios"][index]),
+            self.dictionaries["producers"].decode(self.codes["producers"][index]),
+            bool(self.winners[index]),
+        )
+
+    def records(self):
+        """
+        Decode every row of the snapshot.
+
+        Yields:
+            AwardRecord: The decoded rows, ordered by id
+        """
+        for index in range(len(self)):
+            yield self.record(index)
+
+
+# Snapshot of the current data, replaced as a whole when the data version changes,
+# so readers only ever see a complete snapshot and never take a lock
+_current = None
+
+# Concurrent rebuilds of the same snapshot or structure are shared
+_snapshot_flight = SingleFlight("snapshot.rebuild")
+_derived_flight = SingleFlight("snapshot.derived")
+
+
+def current_snapshot():
+    """
+    Return a snapshot of the current data, rebuilding it after writes.
+
+    The current snapshot is read without a lock; only a rebuild goes through the single-flight.
+
+    Returns:
+        AwardsSnapshot: Snapshot matching the current data version
+    """
+    snapshot = _current
+    version = data_version.value
+    if snapshot is None or snapshot.version != version:
+        # Threads seeing the same stale snapshot wait on a single rebuild
+        snapshot = _snapshot_flight.do(version, _rebuild)
+    return snapshot
+
+
+def _rebuild():
+    global _current
+    snapshot = _current = AwardsSnapshot.from_database()
+    return snapshot
+
+
+# Structures built from the current snapshot, by name, as (snapshot, structure)
+_derived = {}
+
+
+def derived(name, build):
+    """
+    Return a structure built from the current snapshot, rebuilding it after writes.
+
+    Args:
+        name (str): Name identifying the structure
+        build (callable): Function building the structure from an AwardsSnapshot
+
+    Returns:
+        object: The structure built from the current snapshot
+    """
+    snapshot = current_snapshot()
+    entry = _derived.get(name)
+    if entry is None or entry[0] is not snapshot:
+        entry = _derived_flight.do((name, id(snapshot)), lambda: _build(name, snapshot, build))
+    return entry[1]
+
+
+def _build(name, snapshot, build):
+    entry = _derived[name] = (snapshot, build(snapshot))
+    return entry
+
+
+def built_structures():
+    """
+    Return the snapshot and the structures already built from it, without building anything.
+
+    Returns:
+        dict: Structure name to structure, empty if no snapshot was built yet
+    """
+    snapshot = _current
+    if snapshot is None:
+        return {}
+    return {"snapshot": snapshot, **{name: structure for name, (source, structure) in list(_derived.items()) if source is snapshot}}
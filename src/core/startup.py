@@ -0,0 +1,59 @@
+"""
+Startup module for the Golden Raspberry Awards application.
+
+This module loads the initial dataset and warms up the caches on a background
+thread while the server is already listening, so the liveness endpoint answers
+during a long load and the readiness endpoint answers 503 until the warm-up has
+finished.
+"""
+from src.core.awards import AwardsCore  # Awards business logic
+from src.model.awards import Awards  # Awards model
+from src.service.db import db  # SQLAlchemy database instance
+from src.service.health import readiness  # Readiness state reported by /health/ready
+from src.service.serving import shared_connection_lock  # Serializes the startup with requests on an in-memory database
+
+from threading import Thread
+import traceback  # For detailed error tracking
+
+
+def start(app):
+    """
+    Create the schema, load the initial dataset and warm up the caches, then report ready.
+
+    The instance reports not ready while loading and warming up, with the failure
+    if the startup raises. On an in-memory database the shared connection is held
+    for the whole startup, as by a request.
+
+    Args:
+        app (Flask): The Flask application
+    """
+    readiness.mark_not_ready(reason="loading")
+    try:
+        with app.app_context(), shared_connection_lock.hold():
+            try:
+                db.create_all()
+                Awards.load_dataset()
+                readiness.mark_not_ready(reason="warming up")
+                timings = AwardsCore().warm_up()
+            finally:
+                db.session.remove()
+    except Exception as e:
+        print(traceback.format_exc())  # Print detailed stack trace for debugging
+        readiness.mark_not_ready(reason="startup failed", error=repr(e))
+        return
+    readiness.mark_ready(warmup=timings)
+
+
+def start_in_background(app):
+    """
+    Run start on a background thread, so the server can listen meanwhile.
+
+    Args:
+        app (Flask): The Flask application
+
+    Returns:
+        Thread: The started thread
+    """
+    thread = Thread(target=start, args=(app,), name="awards-startup", daemon=True)
+    thread.start()
+    return thread
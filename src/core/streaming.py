@@ -0,0 +1,140 @@
+"""
+Streaming intervals module for the Golden Raspberry Awards application.
+
+This module computes the longest and fastest consecutive awards answer
+straight from a dataset file, without a database or a snapshot. The rows are
+read as a stream and only each producer's last winning year and the running
+shortest and longest intervals are kept, so memory grows with the number of
+distinct producers rather than with the number of rows.
+"""
+from src.service.readers import read_rows
+
+
+class UnsortedInput(Exception):
+    """
+    Raised when a producer wins in a year earlier than one of its previous wins.
+    """
+
+
+class IntervalTracker:
+    """
+    Running shortest and longest intervals between consecutive wins of each producer.
+
+    Wins must be added in non-decreasing year order per producer. Like the SQL
+    query, producers are compared as stored in the dataset, and every win of a
+    producer in one year closes its own interval with the producer's next later
+    win, so repeated wins in one year give repeated entries.
+
+    Attributes:
+        last (dict): Producer to its last winning year and the rows won in that year
+        shortest (int): Shortest interval found, None before the first interval
+        longest (int): Longest interval found, None before the first interval
+        min_entries (list): (row, producer, previous win, following win) of the shortest intervals
+        max_entries (list): (row, producer, previous win, following win) of the longest intervals
+    """
+    __slots__ = ("last", "shortest", "longest", "min_entries", "max_entries")
+
+    def __init__(self):
+        self.last = {}
+        self.shortest = None
+        self.longest = None
+        self.min_entries = []
+        self.max_entries = []
+
+    def add(self, row, year, producer):
+        """
+        Add a win.
+
+        Args:
+            row (int): Position of the row in the dataset, used to order the entries as the SQL query does
+            year (int): Award year
+            producer (str): Value of the producers column
+
+        Raises:
+            UnsortedInput: If the producer already won in a later year
+        """
+        last = self.last.get(producer)
+        if last is None:
+            self.last[producer] = [year, [row]]
+            return
+
+        last_year, rows = last
+        if year == last_year:
+            rows.append(row)
+            return
+        if year < last_year:
+            raise UnsortedInput(f"{producer!r} won in {year} after winning in {last_year}")
+
+        # The win closes an interval for every win of the producer's last winning year
+        interval = year - last_year
+        if self.shortest is None or interval <= self.shortest:
+            if interval != self.shortest:
+                self.shortest, self.min_entries = interval, []
+            self.min_entries.extend((start, producer, last_year, year) for start in rows)
+        if self.longest is None or interval >= self.longest:
+            if interval != self.longest:
+                self.longest, self.max_entries = interval, []
+            self.max_entries.extend((start, producer, last_year, year) for start in rows)
+        self.last[producer] = [year, [row]]
+
+    def result(self):
+        """
+        Return the answer in the layout of the consecutive awards endpoint.
+
+        Returns:
+            dict: Dictionary containing lists of producers with the shortest and longest intervals
+        """
+        def entries(found, interval):
+            return [{
+                "producer": producer,
+                "interval": interval,
+                "previousWin": previous,
+                "followingWin": following,
+            } for _, producer, previous, following in sorted(found)]
+
+        # As in the SQL query, the max list is empty when it would repeat the min list
+        return {
+            "min": entries(self.min_entries, self.shortest),
+            "max": entries(self.max_entries, self.longest) if self.longest != self.shortest else [],
+        }
+
+
+def stream_consecutive_awards(path, delimiter=None):
+    """
+    Compute the longest and fastest consecutive awards answer from a dataset file.
+
+    The file is read once as a stream when each producer's wins appear in year order,
+    as in the Movielist dataset. Otherwise the file is read again, its winning rows are
+    sorted by year once, and the sorted wins are tracked the same way.
+
+    Args:
+        path (str): Path of the dataset file, in any format supported by read_rows
+        delimiter (str): CSV delimiter, the CSV_DELIMITER environment variable or ";" if None
+
+    Returns:
+        tuple: A tuple containing:
+            - dict: The same answer as the consecutive awards endpoint over the file
+            - int: Number of rows read, counting both passes of unsorted files
+    """
+    tracker = IntervalTracker()
+    rows = 0
+    try:
+        for rows, (year, _, _, producers, winner) in enumerate(read_rows(path, delimiter=delimiter), 1):
+            if winner:
+                tracker.add(rows, year, producers)
+        return tracker.result(), rows
+    except UnsortedInput:
+        pass
+
+    # Fall back to a single sort of the winning rows, keeping the row order among wins of one year
+    wins = []
+    read = 0
+    for read, (year, _, _, producers, winner) in enumerate(read_rows(path, delimiter=delimiter), 1):
+        if winner:
+            wins.append((year, read, producers))
+    wins.sort()
+
+    tracker = IntervalTracker()
+    for year, row, producers in wins:
+        tracker.add(row, year, producers)
+    return tracker.result(), rows + read
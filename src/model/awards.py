@@ -4,12 +4,50 @@ Awards model module for the Golden Raspberry Awards application.
 This module defines the database model for movie awards, including data structure,
 initialization logic, data loading functionality, and analytical queries.
 """
-from sqlalchemy import Column, Integer, String, Boolean, and_, select, exists, func
+from sqlalchemy import Column, Integer, String, Boolean, and_, select, exists, func, insert, literal_column, union_all
 from sqlalchemy.orm import aliased
+from typing import NamedTuple, Optional
 
+from src.core.dictionary import StringDictionary
 from src.service.db import db
+from src.service.queries import QueryRegistry
+from src.service.readers import read_rows
 from os import environ
-import csv
+
+# Rows inserted per statement by load_dataset
+LOAD_BATCH_SIZE = 10000
+
+# Execution options of the read queries: reads never flush pending writes of the session
+READ_OPTIONS = {"autoflush": False}
+
+# Award statements, built once and reused so every execution hits the compiled cache
+award_queries = QueryRegistry()
+
+
+class AwardRecord(NamedTuple):
+    """
+    Lightweight, tuple-backed read model for a single award row.
+
+    Read paths (listing, export and analytics) load rows through column-only selects
+    into this record instead of materializing ORM instances, skipping instance state,
+    identity-map entries and attribute instrumentation. The Awards ORM class is kept
+    for writes.
+    """
+    id: int
+    year: int
+    title: str
+    studios: Optional[str]
+    producers: Optional[str]
+    winner: bool
+
+    def to_dict(self):
+        """
+        Convert the record to a dictionary with the same keys as Awards.to_dict.
+
+        Returns:
+            dict: Dictionary representation of the record
+        """
+        return self._asdict()
 
 
 class Awards(db.Model):
@@ -44,9 +82,9 @@ class Awards(db.Model):
         """
         Load the initial dataset from a CSV file into the database.
         
-        This method reads the CSV file specified in the INITIAL_DATASET_PATH
-        environment variable, parses each row into an Awards object, and
-        commits the data to the database.
+        This method reads the dataset file specified in the INITIAL_DATASET_PATH
+        environment variable, in any format supported by read_dataset, inserts
+        the rows in bulk and commits the data to the database.
         
         Raises:
             ValueError: If the INITIAL_DATASET_PATH environment variable is not set
@@ -59,21 +97,39 @@ class Awards(db.Model):
         if dataset_path is None:
             raise ValueError("INITIAL_DATASET_PATH environment variable is not set")
 
-        with open(dataset_path, mode="r", encoding="utf-8") as file:
-            reader = csv.DictReader(file, delimiter=";")
-            for row in reader:
-                movie = self(
-                    year=int(row["year"]),
-                    title=row["title"],
-                    studios=row["studios"],
-                    producers=row["producers"],
-                    winner=row["winner"],
-                )
-                db.session.add(movie)
-            db.session.commit()
+        # Bulk insert in batches, without building an Awards instance per row
+        batch = []
+        for record in self.read_dataset(dataset_path):
+            batch.append({"year": record.year, "title": record.title, "studios": record.studios, "producers": record.producers, "winner": record.winner})
+            if len(batch) == LOAD_BATCH_SIZE:
+                db.session.execute(insert(self), batch)
+                batch = []
+        if batch:
+            db.session.execute(insert(self), batch)
+        db.session.commit()
 
         print("Database setup complete.")
 
+    @staticmethod
+    def read_dataset(dataset_path):
+        """
+        Read a dataset file as AwardRecord rows, without touching the database.
+
+        The format is detected from the file: CSV, plain or compressed with gzip,
+        bz2 or xz, or the binary columnar format (see src.service.readers).
+
+        Args:
+            dataset_path (str): Path of the dataset file
+
+        Yields:
+            AwardRecord: One record per row, with ids numbered from 1 in file order
+        """
+        # Share one string instance per distinct studio and producer across rows
+        studios, producers = StringDictionary(), StringDictionary()
+
+        for number, (year, title, studio, producer, winner) in enumerate(read_rows(dataset_path), start=1):
+            yield AwardRecord(number, year, title, studios.intern(studio), producers.intern(producer), winner)
+
     def to_dict(self):
         """
         Convert the Awards object to a dictionary.
@@ -83,6 +139,55 @@ class Awards(db.Model):
         """
         return {"id": self.id, "year": self.year, "title": self.title, "studios": self.studios, "producers": self.producers, "winner": self.winner}
 
+    @classmethod
+    def select_records(self):
+        """
+        Return the column-only select matching the AwardRecord field order.
+
+        The statement never autoflushes, so reading does not write pending changes of the session.
+
+        Returns:
+            Select: Statement selecting the award columns ordered by id, the same object on every call
+        """
+        return award_queries.statement("records")
+
+    @classmethod
+    def records_statement(self):
+        """
+        Build the statement returned by select_records.
+
+        Returns:
+            Select: Statement selecting the award columns ordered by id
+        """
+        return select(self.id, self.year, self.title, self.studios, self.producers, self.winner).order_by(self.id).execution_options(**READ_OPTIONS)
+
+    @classmethod
+    def iter_records(self, batch_size=10000):
+        """
+        Stream every award row as an AwardRecord without building ORM instances.
+
+        Args:
+            batch_size (int): Number of rows fetched from the cursor at a time
+
+        Yields:
+            AwardRecord: One record per award row, ordered by id
+        """
+        result = db.session.execute(self.select_records().execution_options(yield_per=batch_size))
+        make = AwardRecord._make  # Bind once, called for every row
+        for partition in result.partitions():
+            for row in partition:
+                yield make(row)
+
+    @classmethod
+    def get_records(self):
+        """
+        Load every award row as an AwardRecord.
+
+        Returns:
+            list: List of AwardRecord ordered by id
+        """
+        return list(map(AwardRecord._make, award_queries.execute(db.session, "records")))
+
     @classmethod
     def get_longest_fastest_consecutive_awards(self):
         """
@@ -95,6 +200,34 @@ class Awards(db.Model):
         Returns:
             dict: Dictionary containing lists of producers with the shortest and longest intervals
         """
+        return self.format_consecutive_awards(award_queries.execute(db.session, "consecutive-awards", **READ_OPTIONS))
+
+    @classmethod
+    async def get_longest_fastest_consecutive_awards_async(self, session):
+        """
+        Same as get_longest_fastest_consecutive_awards, over an asyncio session.
+
+        Args:
+            session (AsyncSession): Session of the async engine
+
+        Returns:
+            dict: Dictionary containing lists of producers with the shortest and longest intervals
+        """
+        return self.format_consecutive_awards(await award_queries.execute_async(session, "consecutive-awards", **READ_OPTIONS))
+
+    @classmethod
+    def consecutive_awards_statement(self):
+        """
+        Build the statement selecting the shortest and longest intervals between consecutive wins.
+
+        Both lists come from one round trip: the shortest and the longest interval selects
+        are joined with UNION ALL, each row tagged by a kind column. Rows are ordered by
+        kind, the shortest intervals first, then by the id of the award opening the interval.
+
+        Returns:
+            CompoundSelect: Statement with kind ("min" or "max"), producer, interval,
+            previous win, following win and opening award id columns
+        """
         # Create alias for self-join operations
         AwardAlias = aliased(self)
 
@@ -115,7 +248,7 @@ class Awards(db.Model):
         min_interval_subquery = select(func.min(difference_cte.c.interval)).scalar_subquery()
 
         # CTE 'min' to find producers with the minimum interval
-        min_cte = select(difference_cte.c.producers, difference_cte.c.interval, difference_cte.c.year, difference_cte.c.next_win).where(difference_cte.c.interval == min_interval_subquery).cte('min')
+        min_cte = select(difference_cte.c.producers, difference_cte.c.interval, difference_cte.c.year, difference_cte.c.next_win, difference_cte.c.id).where(difference_cte.c.interval == min_interval_subquery).cte('min')
 
         # Find maximum interval from the 'difference' CTE
         max_interval_subquery = select(func.max(difference_cte.c.interval)).scalar_subquery()
@@ -126,27 +259,42 @@ class Awards(db.Model):
             difference_cte.c.interval,
             difference_cte.c.year,
             difference_cte.c.next_win,
+            difference_cte.c.id,
         ).where(and_(
             difference_cte.c.interval == max_interval_subquery,
             difference_cte.c.interval != min_interval_subquery,  # Ensure it's not the same as min
         )).cte('max')
 
-        # Execute the queries to get the results
-        min_result = db.session.execute(select(min_cte)).all()
-        max_result = db.session.execute(select(max_cte)).all()
-
-        # Format the results into the expected output structure
-        return {
-            "min": [{
-                "producer": award[0],
-                "interval": award[1],
-                "previousWin": award[2],
-                "followingWin": award[3]
-            } for award in min_result],
-            "max": [{
-                "producer": award[0],
-                "interval": award[1],
-                "previousWin": award[2],
-                "followingWin": award[3]
-            } for award in max_result],
-        }
+        # The kinds are literal SQL rather than bound parameters, so the statement takes no parameters
+        statement = union_all(
+            select(literal_column("'min'").label("kind"), min_cte),
+            select(literal_column("'max'").label("kind"), max_cte),
+        )
+        # "min" sorts after "max", so the kind is ordered descending to list the shortest intervals first
+        return statement.order_by(statement.selected_columns.kind.desc(), statement.selected_columns.id)
+
+    @staticmethod
+    def format_consecutive_awards(rows):
+        """
+        Format the rows of the consecutive awards statement into the response structure.
+
+        Args:
+            rows (list): Rows of the statement, with the kind column first and the award id last
+
+        Returns:
+            dict: Dictionary containing lists of producers with the shortest and longest intervals
+        """
+        # Format the results into the expected output structure, splitting the rows by kind
+        result = {"min": [], "max": []}
+        for kind, producer, interval, previous_win, following_win, _ in rows:
+            result[kind].append({
+                "producer": producer,
+                "interval": interval,
+                "previousWin": previous_win,
+                "followingWin": following_win
+            })
+        return result
+
+
+award_queries.register("records", Awards.records_statement)
+award_queries.register("consecutive-awards", Awards.consecutive_awards_statement)
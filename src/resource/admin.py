@@ -0,0 +1,256 @@
+"""
+Admin resources module for the Golden Raspberry Awards API.
+
+This module defines operational endpoints used to observe the running
+service, such as the metrics registry, the named datasets, the memory report
+and the on-demand profiling tools. The memory report and the profiling
+endpoints are admin-gated, since they walk every structure or slow the
+service down: they are disabled unless ADMIN_TOKEN is set, and require it in
+the X-Admin-Token header.
+"""
+from flask import Response, request
+from flask_restx import Namespace, Resource, reqparse
+from src.core.datasets import dataset_registry  # Named datasets hosted besides the main database
+from src.core.memory import memory_report  # Memory used by the loaded data
+from src.service.admission import awards_admission  # Admission control of the awards namespace
+from src.service.db import db  # SQLAlchemy database instance, whose engine the slow query log watches
+from src.service.metrics import metrics  # Process-wide metrics registry
+from src.service.profiling import request_profiler, sample_stacks, slow_query_log  # On-demand profiling tools
+
+from functools import wraps
+from os import environ
+import hmac
+
+# Define API namespace for operational endpoints
+admin_ns = Namespace("admin", description="Administração")
+
+# Longest sampling window accepted, so a request cannot hold a worker indefinitely
+MAX_SAMPLE_SECONDS = 60
+
+request_profile_parser = reqparse.RequestParser()
+request_profile_parser.add_argument("count", type=int, default=10, location="args", help="Quantidade de requisições a perfilar")
+request_profile_parser.add_argument("path", type=str, default="/awards", location="args", help="Prefixo do path das requisições perfiladas")
+
+request_report_parser = reqparse.RequestParser()
+request_report_parser.add_argument("output", choices=("text", "pstats"), default="text", location="args", help="Listagem do pstats ou arquivo binário do pstats")
+request_report_parser.add_argument("sort", type=str, default="cumulative", location="args", help="Ordenação da listagem")
+request_report_parser.add_argument("limit", type=int, default=50, location="args", help="Quantidade de funções na listagem")
+
+sample_parser = reqparse.RequestParser()
+sample_parser.add_argument("seconds", type=float, default=5, location="args", help="Duração da amostragem em segundos")
+sample_parser.add_argument("interval_ms", type=float, default=5, location="args", help="Intervalo entre amostras em milissegundos")
+
+slow_query_parser = reqparse.RequestParser()
+slow_query_parser.add_argument("threshold_ms", type=float, default=100, location="args", help="Duração mínima das consultas registradas")
+
+
+def admin_required(view):
+    """
+    Decorate a view so it runs only for requests carrying the admin token.
+
+    Args:
+        view (callable): Resource method
+
+    Returns:
+        callable: The decorated method, answering 403 when ADMIN_TOKEN is not set
+        and 401 when the X-Admin-Token header does not match it
+    """
+    @wraps(view)
+    def guarded(*args, **kwargs):
+        token = environ.get("ADMIN_TOKEN")
+        if not token:
+            admin_ns.abort(403, "Admin endpoints are disabled, set ADMIN_TOKEN to enable them")
+        if not hmac.compare_digest(request.headers.get("X-Admin-Token", ""), token):
+            admin_ns.abort(401, "Invalid admin token")
+        return view(*args, **kwargs)
+    return guarded
+
+
+@admin_ns.route("/metrics")
+class MetricsResource(Resource):
+    """
+    Resource for reading the service metrics.
+    """
+
+    @admin_ns.doc(description="Métricas do serviço")
+    def get(self):
+        """
+        Get every counter and timing recorded by the service, and the current admission state.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with "counters", "timings" and "admission"
+                - int: HTTP status code (200 for success)
+        """
+        return {**metrics.snapshot(), "admission": {"awards": awards_admission.report()}}, 200
+
+
+@admin_ns.route("/datasets")
+class DatasetsResource(Resource):
+    """
+    Resource for reading the state of the named datasets.
+    """
+
+    @admin_ns.doc(description="Datasets nomeados")
+    def get(self):
+        """
+        Get the memory usage, hits, loads and evictions of every named dataset.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the memory budget, the bytes in use and per-dataset entries
+                - int: HTTP status code (200 for success)
+        """
+        return dataset_registry.report(), 200
+
+
+@admin_ns.route("/memory")
+class MemoryResource(Resource):
+    """
+    Resource for reading the memory used by the loaded data.
+    """
+
+    @admin_ns.doc(description="Uso de memória")
+    @admin_required
+    def get(self):
+        """
+        Get the bytes used by the database pages, caches, in-memory structures and named datasets.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the bytes per component and per row
+                - int: HTTP status code (200 for success, 401 or 403 without the admin token)
+        """
+        return memory_report(), 200
+
+
+@admin_ns.route("/profiling/requests")
+class RequestProfilingResource(Resource):
+    """
+    Resource for profiling the next requests with cProfile.
+    """
+
+    @admin_ns.doc(description="Resultado do perfil das requisições")
+    @admin_ns.expect(request_report_parser)
+    @admin_required
+    def get(self):
+        """
+        Get the cProfile statistics of the profiled requests.
+
+        Returns:
+            Response: The pstats listing as text, or the binary pstats file, 404 if no request was profiled yet
+        """
+        args = request_report_parser.parse_args()
+        report = request_profiler.report(args["output"], args["sort"], args["limit"])
+        if report is None:
+            return {"message": "No request profiled yet", "remaining": request_profiler.remaining}, 404
+        if args["output"] == "pstats":
+            return Response(report, mimetype="application/octet-stream", headers={"Content-Disposition": "attachment; filename=requests.prof"})
+        return Response(report, mimetype="text/plain")
+
+    @admin_ns.doc(description="Perfilar as próximas requisições")
+    @admin_ns.expect(request_profile_parser)
+    @admin_required
+    def post(self):
+        """
+        Profile the next requests whose path starts with the "path" query parameter.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the number of requests to profile and the path prefix
+                - int: HTTP status code (202 for accepted)
+        """
+        args = request_profile_parser.parse_args()
+        request_profiler.arm(args["count"], args["path"])
+        return {"remaining": args["count"], "path": args["path"]}, 202
+
+    @admin_ns.doc(description="Cancelar o perfil das requisições")
+    @admin_required
+    def delete(self):
+        """
+        Stop profiling requests.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the number of requests profiled
+                - int: HTTP status code (200 for success)
+        """
+        request_profiler.disarm()
+        return {"profiled": request_profiler.profiled}, 200
+
+
+@admin_ns.route("/profiling/sample")
+class SamplingProfilingResource(Resource):
+    """
+    Resource for sampling the stacks of the running threads.
+    """
+
+    @admin_ns.doc(description="Amostragem das pilhas de execução")
+    @admin_ns.expect(sample_parser)
+    @admin_required
+    def post(self):
+        """
+        Sample the stacks of every other thread for a window of time.
+
+        Returns:
+            Response: Collapsed stacks as text, one "frame;frame count" line per distinct stack
+        """
+        args = sample_parser.parse_args()
+        if not 0 < args["seconds"] <= MAX_SAMPLE_SECONDS or args["interval_ms"] <= 0:
+            return {"message": f"seconds must be in (0, {MAX_SAMPLE_SECONDS}] and interval_ms positive"}, 400
+        return Response(sample_stacks(args["seconds"], args["interval_ms"] / 1000), mimetype="text/plain")
+
+
+@admin_ns.route("/profiling/slow-queries")
+class SlowQueriesResource(Resource):
+    """
+    Resource for logging slow SQL queries with their query plans.
+    """
+
+    @admin_ns.doc(description="Consultas lentas registradas")
+    @admin_required
+    def get(self):
+        """
+        Get the slow queries logged so far.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the threshold and the logged queries, newest last
+                - int: HTTP status code (200 for success)
+        """
+        threshold = slow_query_log.threshold
+        return {
+            "enabled": slow_query_log.enabled,
+            "threshold_ms": None if threshold is None else threshold * 1000,
+            "queries": list(slow_query_log.entries),
+        }, 200
+
+    @admin_ns.doc(description="Registrar consultas lentas")
+    @admin_ns.expect(slow_query_parser)
+    @admin_required
+    def post(self):
+        """
+        Start logging the queries slower than the "threshold_ms" query parameter.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the threshold
+                - int: HTTP status code (200 for success)
+        """
+        args = slow_query_parser.parse_args()
+        slow_query_log.enable(db.engine, args["threshold_ms"] / 1000)
+        return {"enabled": True, "threshold_ms": args["threshold_ms"]}, 200
+
+    @admin_ns.doc(description="Parar o registro de consultas lentas")
+    @admin_required
+    def delete(self):
+        """
+        Stop logging slow queries.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the state of the log
+                - int: HTTP status code (200 for success)
+        """
+        slow_query_log.disable()
+        return {"enabled": False}, 200
@@ -2,15 +2,96 @@
 Award resources module for the Golden Raspberry Awards API.
 
 This module defines the API endpoints related to award information,
-including the endpoint for retrieving data about consecutive awards.
+including the endpoint for retrieving data about consecutive awards
+and the listing and export of the loaded dataset. Every endpoint answers
+from the main database, or from the named dataset given in the X-Dataset
+header or the "dataset" query parameter.
 """
-from flask_restx import Namespace, Resource
+from flask import Response, request
+from flask_restx import Namespace, Resource, reqparse
+from werkzeug.exceptions import HTTPException
 from src.core.awards import AwardsCore  # Core business logic for awards
+from src.core.datasets import dataset_registry  # Named datasets hosted besides the main database
+from src.core.intervals import DIMENSIONS  # Dimensions with consecutive win intervals
+from src.core.rollups import GROUPS, ORDERS  # Groups and orders of the rollup statistics
+from src.service.admission import awards_admission  # Bounded concurrency for the award computations
+
+from os import environ
 
 import traceback  # For detailed error tracking
 
-# Define API namespace for award-related endpoints
-awards_ns = Namespace("awards", description="Prêmios")
+# Define API namespace for award-related endpoints, admitting a bounded number of requests at a time
+awards_ns = Namespace("awards", description="Prêmios", decorators=[awards_admission])
+
+# Header and query parameter naming the dataset a request is answered from
+DATASET_HEADER = "X-Dataset"
+DATASET_ARGUMENT = "dataset"
+
+
+def awards_core():
+    """
+    Build the AwardsCore for the dataset named by the current request.
+
+    The dataset is named by the X-Dataset header or the "dataset" query parameter;
+    requests naming no dataset are answered from the main database.
+
+    Returns:
+        AwardsCore: Core business logic bound to the requested dataset
+
+    Raises:
+        HTTPException: 404 for an unknown dataset, 400 for a dataset whose file cannot be loaded
+    """
+    name = request.headers.get(DATASET_HEADER) or request.args.get(DATASET_ARGUMENT)
+    if not name:
+        return AwardsCore()
+    if name not in dataset_registry:
+        awards_ns.abort(404, f"Dataset '{name}' not found")
+    try:
+        dataset = dataset_registry.get(name)
+    except Exception as e:
+        print(f"Error: {e}")
+        print(traceback.format_exc())
+        awards_ns.abort(400, f"Dataset '{name}' could not be loaded")
+    return AwardsCore(dataset=dataset)
+
+
+def encoded_response(cached, status=200):
+    """
+    Build a response from a cached answer, compressed as the client's Accept-Encoding allows.
+
+    The compressed bodies are stored with the answer, so no compression runs per request.
+
+    Args:
+        cached (CachedResponse): The cached answer with its stored bodies
+        status (int): HTTP status code
+
+    Returns:
+        Response: The response carrying the stored body
+    """
+    encoding, body = cached.negotiate(request.accept_encodings)
+    response = Response(body, status=status, mimetype=cached.mimetype)
+    response.vary.add("Accept-Encoding")  # Caches in between must key the body on the request encoding
+    if encoding != "identity":
+        response.content_encoding = encoding
+    return response
+
+
+# Optional window of years for the consecutive awards endpoint
+interval_parser = reqparse.RequestParser()
+interval_parser.add_argument("from", type=int, location="args", help="Ano inicial da janela")
+interval_parser.add_argument("to", type=int, location="args", help="Ano final da janela")
+interval_parser.add_argument("dimension", choices=tuple(DIMENSIONS), default="producers", location="args", help="Agrupar por produtores ou estúdios")
+
+# Prefix search over producer names
+producer_search_parser = reqparse.RequestParser()
+producer_search_parser.add_argument("q", type=str, default="", location="args", help="Início do nome do produtor")
+producer_search_parser.add_argument("limit", type=int, location="args", help="Quantidade máxima de produtores")
+
+# Group and top-N of the rollup statistics
+stats_parser = reqparse.RequestParser()
+stats_parser.add_argument("group_by", choices=tuple(GROUPS), default="year", location="args", help="Agrupar por ano, estúdio ou produtor")
+stats_parser.add_argument("order", choices=ORDERS, default="nominations", location="args", help="Ordenar por indicações ou vitórias")
+stats_parser.add_argument("top", type=int, location="args", help="Quantidade máxima de resultados")
 
 
 @awards_ns.route("/longest-fastest-consecutive-awards")
@@ -23,20 +104,178 @@ class ListRegionResource(Resource):
     """
 
     @awards_ns.doc(description="Intervalo de prêmios")
+    @awards_ns.expect(interval_parser)
     def get(self):
         """
         Get the producers with the longest and shortest intervals between consecutive awards.
+
+        When the "from" or "to" query parameters are given, only consecutive wins
+        inside that window of years are considered. The "dimension" query parameter
+        groups the wins by studios instead of producers.
         
         Returns:
             tuple: A tuple containing:
                 - dict: JSON response with min and max intervals data
                 - int: HTTP status code (200 for success, 400 for error)
         """
+        args = interval_parser.parse_args()
         try:
-            # Call the business logic layer to get the award intervals
-            return AwardsCore().get_longest_fastest_consecutive_awards()
+            core = awards_core()
+            if args["from"] is not None or args["to"] is not None or args["dimension"] != "producers":
+                # Windowed and per-studio answers come from the in-memory interval index
+                return core.get_longest_fastest_consecutive_awards_between(args["from"], args["to"], args["dimension"])
+
+            # Call the business logic layer to get the award intervals, already encoded as JSON
+            return encoded_response(*core.get_longest_fastest_consecutive_awards_encoded())
+        except HTTPException:
+            raise  # Unknown or unloadable datasets keep their own status and message
         except Exception as e:
             # Log any errors that occur during processing
             print(f"Error: {e}")
             print(traceback.format_exc())  # Print detailed stack trace for debugging
             return {}, 400  # Return empty response with 400 Bad Request status code
+
+
+@awards_ns.route("/producers")
+class SearchProducersResource(Resource):
+    """
+    Resource for searching producers by the start of their name.
+    """
+
+    @awards_ns.doc(description="Busca de produtores")
+    @awards_ns.expect(producer_search_parser)
+    def get(self):
+        """
+        Get the producers whose name starts with the "q" query parameter, ignoring case.
+
+        Returns:
+            tuple: A tuple containing:
+                - list: JSON response with the producers and their nomination and win counts
+                - int: HTTP status code (200 for success, 400 for error)
+        """
+        args = producer_search_parser.parse_args()
+        try:
+            core = awards_core()
+            return core.search_producers(args["q"], args["limit"])
+        except HTTPException:
+            raise
+        except Exception as e:
+            print(f"Error: {e}")
+            print(traceback.format_exc())
+            return [], 400
+
+
+@awards_ns.route("/producers/<string:name>")
+class ProducerHistoryResource(Resource):
+    """
+    Resource for the nomination history of one producer.
+    """
+
+    @awards_ns.doc(description="Histórico do produtor")
+    def get(self, name):
+        """
+        Get every nomination of a producer, matching the name ignoring case.
+
+        Args:
+            name (str): Producer name
+
+        Returns:
+            tuple: A tuple containing:
+                - list: JSON response with the producer's nominations ordered by year
+                - int: HTTP status code (200 for success, 404 for an unknown producer, 400 for error)
+        """
+        try:
+            core = awards_core()
+            return core.get_producer_history(name)
+        except HTTPException:
+            raise
+        except Exception as e:
+            print(f"Error: {e}")
+            print(traceback.format_exc())
+            return [], 400
+
+
+@awards_ns.route("/stats")
+class StatsResource(Resource):
+    """
+    Resource for the nomination and win counts per year, studio or producer.
+    """
+
+    @awards_ns.doc(description="Estatísticas de indicações e vitórias")
+    @awards_ns.expect(stats_parser)
+    def get(self):
+        """
+        Get the nomination and win counts grouped by year, studio or producer, highest first.
+
+        Returns:
+            tuple: A tuple containing:
+                - list: JSON response with the group value and its nomination and win counts
+                - int: HTTP status code (200 for success, 400 for error)
+        """
+        args = stats_parser.parse_args()
+        try:
+            core = awards_core()
+            return core.get_stats(args["group_by"], args["order"], args["top"])
+        except HTTPException:
+            raise
+        except Exception as e:
+            print(f"Error: {e}")
+            print(traceback.format_exc())
+            return [], 400
+
+
+@awards_ns.route("/")
+class ListAwardsResource(Resource):
+    """
+    Resource for listing every award in the dataset.
+    """
+
+    @awards_ns.doc(description="Lista de prêmios")
+    def get(self):
+        """
+        Get every award row in the dataset.
+
+        The listing is encoded once per data version and sent compressed when the client accepts it.
+
+        Returns:
+            Response: JSON response with one object per award, or an empty list with 400 on error
+        """
+        try:
+            core = awards_core()
+            return encoded_response(*core.list_awards_encoded())
+        except HTTPException:
+            raise
+        except Exception as e:
+            print(f"Error: {e}")
+            print(traceback.format_exc())
+            return [], 400
+
+
+@awards_ns.route("/export")
+class ExportAwardsResource(Resource):
+    """
+    Resource for exporting the dataset as CSV.
+
+    The CSV has the same columns and delimiter as the input dataset,
+    so an export can be loaded back with Awards.load_dataset.
+    """
+
+    @awards_ns.doc(description="Exportação dos prêmios em CSV")
+    def get(self):
+        """
+        Get every award row as CSV.
+
+        The CSV is built and compressed once per data version and served from the response cache.
+
+        Returns:
+            Response: text/csv response, or an empty body with 400 on error
+        """
+        try:
+            core = awards_core()
+            return encoded_response(*core.export_awards_encoded(delimiter=environ.get("CSV_DELIMITER", ";")))
+        except HTTPException:
+            raise
+        except Exception as e:
+            print(f"Error: {e}")
+            print(traceback.format_exc())
+            return Response("", status=400, mimetype="text/csv")
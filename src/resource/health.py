@@ -0,0 +1,52 @@
+"""
+Health resources module for the Golden Raspberry Awards API.
+
+This module defines the liveness and readiness endpoints polled by the orchestrator.
+"""
+from flask_restx import Namespace, Resource
+from src.service.health import readiness  # Readiness state of the instance
+
+import time
+
+# Define API namespace for health endpoints
+health_ns = Namespace("health", description="Saúde do serviço")
+
+
+@health_ns.route("/live")
+class LivenessResource(Resource):
+    """
+    Resource reporting that the process is up and serving requests.
+    """
+
+    @health_ns.doc(description="Liveness")
+    def get(self):
+        """
+        Report that the process is alive.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the status and uptime in seconds
+                - int: HTTP status code (200, always)
+        """
+        return {"status": "alive", "uptime": time.time() - readiness.started_at}, 200
+
+
+@health_ns.route("/ready")
+class ReadinessResource(Resource):
+    """
+    Resource reporting whether the instance has finished warming up.
+    """
+
+    @health_ns.doc(description="Readiness")
+    def get(self):
+        """
+        Report whether the instance should receive traffic.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the status and warm-up details
+                - int: HTTP status code (200 when ready, 503 otherwise)
+        """
+        if readiness.ready:
+            return {"status": "ready", **readiness.details}, 200
+        return {"status": "not ready", **readiness.details}, 503
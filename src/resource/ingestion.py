@@ -0,0 +1,85 @@
+"""
+Ingestion resources module for the Golden Raspberry Awards API.
+
+This module defines the endpoints that replace the award data from an uploaded
+dataset file. The upload is spooled to disk and ingested by a background
+worker, so the request returns a job at once and the awards endpoints keep
+serving the previous data until the job completes. Like the profiling
+endpoints, they require the admin token.
+"""
+from flask import request
+from flask_restx import Namespace, Resource, reqparse
+from src.core.ingestion import UploadTooLarge, ingestion_manager  # Background dataset ingestion
+from src.resource.admin import admin_required  # Admin token check
+
+# Define API namespace for dataset ingestion
+ingestions_ns = Namespace("ingestions", description="Carga de datasets")
+
+upload_parser = reqparse.RequestParser()
+upload_parser.add_argument("delimiter", type=str, location="args", help="Delimitador do CSV enviado, o de CSV_DELIMITER se omitido")
+
+
+@ingestions_ns.route("")
+class IngestionsResource(Resource):
+    """
+    Resource for uploading datasets and listing the ingestion jobs.
+    """
+
+    @ingestions_ns.doc(description="Jobs de carga")
+    @admin_required
+    def get(self):
+        """
+        Get the progress of every known ingestion job.
+
+        Returns:
+            tuple: A tuple containing:
+                - list: JSON response with one report per job, oldest first
+                - int: HTTP status code (200 for success)
+        """
+        return [job.report() for job in ingestion_manager.jobs()], 200
+
+    @ingestions_ns.doc(description="Enviar um dataset para substituir os dados")
+    @ingestions_ns.expect(upload_parser)
+    @admin_required
+    def post(self):
+        """
+        Spool the request body, a dataset file in any supported format, and queue its ingestion.
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the report of the queued job
+                - int: HTTP status code (202 for accepted, 413 when the upload is too large)
+                - dict: Location header of the job
+        """
+        args = upload_parser.parse_args()
+        try:
+            job = ingestion_manager.submit(request.stream, args["delimiter"])
+        except UploadTooLarge as e:
+            return {"message": str(e)}, 413
+        return job.report(), 202, {"Location": f"{request.path}/{job.id}"}
+
+
+@ingestions_ns.route("/<string:job_id>")
+class IngestionResource(Resource):
+    """
+    Resource for following one ingestion job.
+    """
+
+    @ingestions_ns.doc(description="Progresso de um job de carga")
+    @admin_required
+    def get(self, job_id):
+        """
+        Get the status, rows processed, throughput and errors of a job.
+
+        Args:
+            job_id (str): Job identifier returned by the upload
+
+        Returns:
+            tuple: A tuple containing:
+                - dict: JSON response with the report of the job
+                - int: HTTP status code (200 for success, 404 for an unknown job)
+        """
+        job = ingestion_manager.get(job_id)
+        if job is None:
+            return {"message": f"Unknown ingestion job {job_id}"}, 404
+        return job.report(), 200
@@ -0,0 +1,163 @@
+"""
+Admission control service module for the Golden Raspberry Awards application.
+
+This module bounds the number of requests computing at the same time. Requests
+beyond that limit wait in a bounded queue until a deadline, and are rejected
+right away with 503 and Retry-After when the queue is full, so latency stays
+bounded under overload instead of growing without limit.
+"""
+from src.service.metrics import metrics
+
+from flask import Response
+from functools import wraps
+from os import environ
+from threading import Condition
+import json
+import time
+
+
+class Rejected(Exception):
+    """
+    Raised when a request is not admitted.
+
+    Attributes:
+        reason (str): "queue_full" or "timeout"
+    """
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionController:
+    """
+    Bounded concurrency with a bounded, deadline-limited wait queue.
+
+    Counters "<name>.admitted" and "<name>.rejected.<reason>" and the timing
+    "<name>.queue_time" are kept in the metrics registry.
+    """
+
+    def __init__(self, name, max_concurrent, max_queue, queue_timeout, retry_after=1, registry=metrics):
+        """
+        Initialize the controller.
+
+        Args:
+            name (str): Prefix for the metrics of this controller
+            max_concurrent (int): Maximum number of requests computing at the same time
+            max_queue (int): Maximum number of requests waiting for a slot
+            queue_timeout (float): Maximum seconds a request waits for a slot
+            retry_after (int): Seconds sent in the Retry-After header of rejections
+            registry (Metrics): Metrics registry receiving the counters and timings
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.metrics = registry
+        self._active = 0
+        self._waiting = 0
+        self._condition = Condition()
+
+    def acquire(self):
+        """
+        Take a computation slot, waiting in the queue if none is free.
+
+        Raises:
+            Rejected: If the queue is full or the deadline passes before a slot frees up
+        """
+        started = time.perf_counter()
+        with self._condition:
+            if self._active >= self.max_concurrent:
+                if self._waiting >= self.max_queue:
+                    self._reject("queue_full")
+                self._waiting += 1
+                try:
+                    deadline = started + self.queue_timeout
+                    while self._active >= self.max_concurrent:
+                        remaining = deadline - time.perf_counter()
+                        if remaining <= 0:
+                            self._reject("timeout")
+                        self._condition.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            self._active += 1
+        self.metrics.increment(f"{self.name}.admitted")
+        self.metrics.observe(f"{self.name}.queue_time", time.perf_counter() - started)
+
+    def release(self):
+        """
+        Give back a computation slot taken with acquire.
+        """
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+    def rejection(self, reason):
+        """
+        Return the body and headers of the 503 response rejecting a request.
+
+        Args:
+            reason (str): Reason of the Rejected exception
+
+        Returns:
+            tuple: A tuple containing:
+                - str: JSON body
+                - dict: Headers, with Retry-After
+        """
+        body = json.dumps({"message": "Service overloaded, retry later", "reason": reason}) + "\n"
+        return body, {"Retry-After": str(self.retry_after)}
+
+    def _reject(self, reason):
+        self.metrics.increment(f"{self.name}.rejected.{reason}")
+        raise Rejected(reason)
+
+    def report(self):
+        """
+        Report the limits and the current number of active and waiting requests.
+
+        Returns:
+            dict: Dictionary with the limits and current occupancy
+        """
+        return {
+            "active": self._active,
+            "waiting": self._waiting,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+        }
+
+    def __call__(self, view):
+        """
+        Decorate a view so it runs only once admitted.
+
+        Rejected requests get a 503 response with a Retry-After header.
+
+        Args:
+            view (callable): Flask view function
+
+        Returns:
+            callable: The decorated view
+        """
+        @wraps(view)
+        def admitted(*args, **kwargs):
+            try:
+                self.acquire()
+            except Rejected as e:
+                body, headers = self.rejection(e.reason)
+                return Response(body, status=503, mimetype="application/json", headers=headers)
+            try:
+                return view(*args, **kwargs)
+            finally:
+                self.release()
+        return admitted
+
+
+# Admission control of the awards namespace
+awards_admission = AdmissionController(
+    "admission.awards",
+    max_concurrent=int(environ.get("ADMISSION_MAX_CONCURRENT", "8")),
+    max_queue=int(environ.get("ADMISSION_MAX_QUEUE", "64")),
+    queue_timeout=float(environ.get("ADMISSION_QUEUE_TIMEOUT_MS", "1000")) / 1000,
+    retry_after=int(environ.get("ADMISSION_RETRY_AFTER", "1")),
+)
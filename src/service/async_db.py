@@ -0,0 +1,64 @@
+"""
+Async database service module for the Golden Raspberry Awards application.
+
+This module creates the SQLAlchemy async engine used by the ASGI application.
+The engine runs over aiosqlite, an optional dependency only needed by the
+ASGI serving mode; the Flask application keeps the synchronous engine.
+"""
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
+
+import importlib.util
+
+# Synchronous SQLite drivers, and the async driver replacing them
+SQLITE_DRIVERS = ("sqlite", "sqlite+pysqlite")
+ASYNC_SQLITE_DRIVER = "sqlite+aiosqlite"
+
+
+def async_database_url(url):
+    """
+    Translate a synchronous SQLite database URL to the async driver.
+
+    Args:
+        url (str): SQLAlchemy database URL, such as sqlite:///:memory:
+
+    Returns:
+        str: The same database over sqlite+aiosqlite
+
+    Raises:
+        ValueError: If the URL is not a SQLite URL
+    """
+    url = make_url(url)
+    if url.drivername == ASYNC_SQLITE_DRIVER:
+        return url.render_as_string(hide_password=False)
+    if url.drivername not in SQLITE_DRIVERS:
+        raise ValueError(f"The ASGI mode supports SQLite databases only, got {url.drivername!r}")
+    return url.set(drivername=ASYNC_SQLITE_DRIVER).render_as_string(hide_password=False)
+
+
+def create_async_database(url):
+    """
+    Create the async engine and session factory of a database.
+
+    Sessions never autoflush and keep their loaded state after commit, since they only
+    serve reads once the dataset is loaded. Connections are not pooled: the query runs
+    once per data version, and each aiosqlite connection holds a thread until closed.
+
+    Args:
+        url (str): SQLAlchemy database URL, synchronous or async SQLite
+
+    Returns:
+        tuple: A tuple containing:
+            - AsyncEngine: The async engine
+            - async_sessionmaker: Factory of AsyncSession bound to the engine
+
+    Raises:
+        RuntimeError: If aiosqlite is not installed
+    """
+    if importlib.util.find_spec("aiosqlite") is None:
+        raise RuntimeError("The ASGI mode requires aiosqlite, install it with: pip install aiosqlite")
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(async_database_url(url), poolclass=NullPool)
+    return engine, async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
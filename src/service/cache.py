@@ -0,0 +1,134 @@
+"""
+Response cache service module for the Golden Raspberry Awards application.
+
+This module keeps computed award answers together with their JSON-encoded
+bodies, tagged with the data version they were computed from, so repeated
+requests skip both the query and the serialization. Bodies are also stored
+gzip and deflate compressed, so clients accepting a compressed response are
+sent bytes compressed once per data version instead of once per request.
+"""
+from threading import Lock
+import gzip
+import json
+import zlib
+
+# Content codings stored for each body, in order of preference when the client accepts several
+ENCODINGS = ("gzip", "deflate")
+
+# Bodies smaller than this are only stored uncompressed, the saving would not cover the headers
+MIN_COMPRESS_SIZE = 1024
+
+COMPRESSION_LEVEL = 6
+
+
+class CachedResponse:
+    """
+    A computed answer and its encoded body, uncompressed and compressed.
+
+    Attributes:
+        version (int): Data version the answer was computed from
+        data (object): The JSON-serializable answer, None for bodies that are not JSON
+        body (bytes): The answer encoded as a response body
+        mimetype (str): Media type of the body
+        variants (dict): The body under each stored content coding, "identity" included
+    """
+    __slots__ = ("version", "data", "body", "mimetype", "variants")
+
+    def __init__(self, version, data, body=None, mimetype="application/json"):
+        self.version = version
+        self.data = data
+        if body is None:
+            body = (json.dumps(data) + "\n").encode("utf-8")  # Same layout as the flask-restx JSON output
+        self.body = body
+        self.mimetype = mimetype
+        self.variants = {"identity": body}
+        if len(body) >= MIN_COMPRESS_SIZE:
+            # mtime=0 keeps the gzip bytes identical across processes serving the same data
+            self.variants["gzip"] = gzip.compress(body, compresslevel=COMPRESSION_LEVEL, mtime=0)
+            self.variants["deflate"] = zlib.compress(body, COMPRESSION_LEVEL)  # HTTP "deflate" is the zlib format
+
+    def negotiate(self, accept_encodings):
+        """
+        Pick the stored body best matching the client's Accept-Encoding header.
+
+        Args:
+            accept_encodings (werkzeug.datastructures.Accept): Parsed Accept-Encoding header
+
+        Returns:
+            tuple: A tuple containing:
+                - str: The content coding of the body, "identity" when uncompressed
+                - bytes: The body under that content coding
+        """
+        offered = [encoding for encoding in ENCODINGS if encoding in self.variants] + ["identity"]
+        encoding = accept_encodings.best_match(offered, default="identity")
+        return encoding, self.variants[encoding]
+
+
+class ResponseCache:
+    """
+    Per-name cache holding the latest CachedResponse of each answer.
+
+    Entries are replaced rather than mutated, so readers never need the lock.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = Lock()
+
+    def get(self, name, version):
+        """
+        Return the cached answer for a name if it was computed from the given data version.
+
+        Args:
+            name (str): Name of the answer
+            version (int): Current data version
+
+        Returns:
+            CachedResponse: The cached answer, or None if missing or stale
+        """
+        entry = self._entries.get(name)
+        if entry is not None and entry.version == version:
+            return entry
+        return None
+
+    def put(self, name, version, data, body=None, mimetype="application/json"):
+        """
+        Encode and store an answer.
+
+        Args:
+            name (str): Name of the answer
+            version (int): Data version the answer was computed from
+            data (object): The JSON-serializable answer
+            body (bytes): Already encoded body, data is encoded as JSON if None
+            mimetype (str): Media type of the body
+
+        Returns:
+            CachedResponse: The stored entry
+        """
+        entry = CachedResponse(version, data, body=body, mimetype=mimetype)
+        with self._lock:
+            current = self._entries.get(name)
+            # Never replace an answer computed from newer data
+            if current is None or current.version <= version:
+                self._entries[name] = entry
+        return entry
+
+    def entries(self):
+        """
+        Return every cached answer.
+
+        Returns:
+            list: The CachedResponse entries
+        """
+        return list(self._entries.values())
+
+    def clear(self):
+        """
+        Drop every cached answer.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide response cache shared by the application
+response_cache = ResponseCache()
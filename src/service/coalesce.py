@@ -0,0 +1,152 @@
+"""
+Request coalescing service module for the Golden Raspberry Awards application.
+
+This module implements single-flight execution: concurrent callers asking for
+the same key wait on one in-flight computation and share its result, instead
+of each running the same expensive query.
+"""
+from src.service.metrics import metrics
+
+from threading import Event, Lock
+import asyncio
+
+
+class _Call:
+    """
+    A computation in flight, shared by the caller running it and the callers waiting on it.
+    """
+    __slots__ = ("done", "result", "error", "futures")
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+        self.futures = []  # Futures of the asyncio callers waiting, with their event loops
+
+    def finish(self):
+        """
+        Wake every caller waiting on the computation, once it has been retired.
+        """
+        self.done.set()
+        for loop, future in self.futures:
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+            except RuntimeError:
+                pass  # The loop was closed, nothing awaits the future anymore
+
+
+def _resolve(future):
+    # The waiting coroutine may have been cancelled meanwhile
+    if not future.done():
+        future.set_result(None)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into a single execution.
+
+    Only calls that overlap in time are coalesced; once a computation finishes
+    the next call for the same key runs again. Counters "<name>.executed" and
+    "<name>.coalesced" are kept in the metrics registry.
+    """
+
+    def __init__(self, name, registry=metrics):
+        """
+        Initialize the coalescing group.
+
+        Args:
+            name (str): Prefix for the metrics of this group
+            registry (Metrics): Metrics registry receiving the counters
+        """
+        self.name = name
+        self.metrics = registry
+        self._calls = {}
+        self._lock = Lock()
+
+    def do(self, key, fn):
+        """
+        Run fn for key, or wait for the identical call already in flight.
+
+        Args:
+            key (hashable): Identity of the computation
+            fn (callable): Function without arguments computing the result
+
+        Returns:
+            object: The result of fn, shared by every coalesced caller
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every coalesced caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self.metrics.increment(f"{self.name}.coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        self.metrics.increment(f"{self.name}.executed")
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # Retire the call before waking the waiters, so later callers start a fresh computation
+            with self._lock:
+                del self._calls[key]
+            call.finish()
+        return call.result
+
+    async def do_async(self, key, fn):
+        """
+        Same as do, awaiting a coroutine function.
+
+        Calls with the same key are coalesced with the calls of do as well. A caller
+        waiting on a computation in flight awaits a future resolved when it finishes,
+        so no thread is held meanwhile.
+
+        Args:
+            key (hashable): Identity of the computation
+            fn (callable): Coroutine function without arguments computing the result
+
+        Returns:
+            object: The result of fn, shared by every coalesced caller
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every coalesced caller
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                # Registered while the call is still in flight, so its finish resolves the future
+                waiting = loop.create_future()
+                call.futures.append((loop, waiting))
+
+        if not leader:
+            self.metrics.increment(f"{self.name}.coalesced")
+            await waiting
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        self.metrics.increment(f"{self.name}.executed")
+        try:
+            call.result = await fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.finish()
+        return call.result
@@ -10,3 +10,6 @@ from flask_sqlalchemy import SQLAlchemy  # Flask extension for SQLAlchemy ORM
 # Create a SQLAlchemy instance without binding it to an app
 # This instance will be initialized with the Flask app in api.py using init_app()
 db = SQLAlchemy()
+
+# Register the session listeners that track the data version on every write
+from src.service import version  # noqa: E402,F401
@@ -0,0 +1,54 @@
+"""
+Health service module for the Golden Raspberry Awards application.
+
+This module tracks whether the instance has finished loading and warming up,
+so the orchestrator can route traffic only to instances that answer at
+steady-state latency.
+"""
+from threading import Event
+import time
+
+
+class Readiness:
+    """
+    Readiness state of the instance.
+
+    The instance starts not ready and becomes ready once the warm-up phase
+    has precomputed the common answers.
+    """
+
+    def __init__(self):
+        self._ready = Event()
+        self.started_at = time.time()
+        self.details = {}
+
+    @property
+    def ready(self):
+        """
+        bool: Whether the instance should receive traffic.
+        """
+        return self._ready.is_set()
+
+    def mark_ready(self, **details):
+        """
+        Mark the instance as ready.
+
+        Args:
+            **details: Information reported by the readiness endpoint, such as warm-up timings
+        """
+        self.details = details
+        self._ready.set()
+
+    def mark_not_ready(self, **details):
+        """
+        Mark the instance as not ready, for example while data is being reloaded.
+
+        Args:
+            **details: Information reported by the readiness endpoint, such as the reason
+        """
+        self._ready.clear()
+        self.details = details
+
+
+# Process-wide readiness state
+readiness = Readiness()
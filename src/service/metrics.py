@@ -0,0 +1,103 @@
+"""
+Metrics service module for the Golden Raspberry Awards application.
+
+This module provides a small in-process registry of counters and timings
+that the core and resource layers update, and that the admin namespace exposes.
+"""
+from contextlib import contextmanager
+from threading import Lock
+import time
+
+
+class Metrics:
+    """
+    Thread-safe registry of named counters and timings.
+    """
+
+    def __init__(self):
+        self._counters = {}
+        self._timings = {}  # Name to [count, total seconds, max seconds]
+        self._lock = Lock()
+
+    def increment(self, name, value=1):
+        """
+        Add to a counter, creating it at zero if needed.
+
+        Args:
+            name (str): Counter name
+            value (int): Amount to add
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name, seconds):
+        """
+        Record one duration in a timing.
+
+        Args:
+            name (str): Timing name
+            seconds (float): Observed duration in seconds
+        """
+        with self._lock:
+            timing = self._timings.get(name)
+            if timing is None:
+                timing = self._timings[name] = [0, 0.0, 0.0]
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+
+    @contextmanager
+    def timer(self, name):
+        """
+        Context manager recording the duration of its block in a timing.
+
+        Args:
+            name (str): Timing name
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def counter(self, name):
+        """
+        Return the current value of a counter.
+
+        Args:
+            name (str): Counter name
+
+        Returns:
+            int: The counter value, 0 if it was never incremented
+        """
+        return self._counters.get(name, 0)
+
+    def snapshot(self):
+        """
+        Return a JSON-serializable copy of every counter and timing.
+
+        Returns:
+            dict: Dictionary with "counters" and "timings" keys
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "timings": {name: {
+                    "count": count,
+                    "total": total,
+                    "mean": total / count,
+                    "max": maximum,
+                } for name, (count, total, maximum) in self._timings.items()},
+            }
+
+    def reset(self):
+        """
+        Drop every counter and timing.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+# Process-wide metrics registry shared by the application
+metrics = Metrics()
@@ -0,0 +1,241 @@
+"""
+Profiling service module for the Golden Raspberry Awards application.
+
+This module provides on-demand profiling of the running service: cProfile over
+the next N requests, a sampling profiler over a window of time producing
+collapsed stacks, and a log of slow SQL queries with their query plans. Every
+tool is off by default; disabled, the request hooks cost one attribute check
+and no database listeners are installed.
+"""
+from sqlalchemy import event
+
+from collections import Counter, deque
+from threading import Lock, get_ident
+import cProfile
+import io
+import marshal
+import pstats
+import sys
+import time
+
+
+class RequestProfiler:
+    """
+    cProfile over the next N requests, merged into one set of statistics.
+
+    One request is profiled at a time: since Python 3.12 cProfile runs on
+    sys.monitoring, which takes a single profiler per process, so requests
+    arriving while another is profiled are served without profiling.
+    """
+
+    def __init__(self):
+        self.remaining = 0  # Requests still to profile, 0 when disabled
+        self.path_prefix = "/"
+        self.profiled = 0
+        self._stats = None
+        self._active = False  # Whether a request is being profiled
+        self._lock = Lock()
+
+    def init_app(self, app):
+        """
+        Install the request hooks on a Flask application.
+
+        Args:
+            app (Flask): The application whose requests can be profiled
+        """
+        from flask import g, request
+
+        @app.before_request
+        def _start_profile():
+            if not self.remaining or not request.path.startswith(self.path_prefix):
+                return
+            with self._lock:
+                if self.remaining <= 0 or self._active:
+                    return
+                self.remaining -= 1
+                self._active = True
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler, outside of this one, holds the process
+                with self._lock:
+                    self._active = False
+                    self.remaining += 1
+                return
+            g.profile = profile
+
+        @app.teardown_request
+        def _stop_profile(exception):
+            profile = g.pop("profile", None)
+            if profile is None:
+                return
+            profile.disable()
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profile)
+                else:
+                    self._stats.add(profile)
+                self.profiled += 1
+                self._active = False
+
+    def arm(self, count, path_prefix="/"):
+        """
+        Profile the next requests, dropping the statistics of earlier ones.
+
+        Args:
+            count (int): Number of requests to profile
+            path_prefix (str): Only requests whose path starts with it are profiled
+        """
+        with self._lock:
+            self._stats = None
+            self.profiled = 0
+            self.path_prefix = path_prefix
+            self.remaining = count
+
+    def disarm(self):
+        """
+        Stop profiling requests that have not started yet.
+        """
+        with self._lock:
+            self.remaining = 0
+
+    def report(self, output="text", sort="cumulative", limit=50):
+        """
+        Return the statistics of the profiled requests.
+
+        Args:
+            output (str): "text" for the pstats listing, "pstats" for the binary
+                format read by pstats.Stats and tools such as snakeviz
+            sort (str): pstats sort key of the text listing
+            limit (int): Number of functions in the text listing
+
+        Returns:
+            str or bytes: The statistics, None if no request was profiled yet
+        """
+        with self._lock:
+            if self._stats is None:
+                return None
+            if output == "pstats":
+                return marshal.dumps(self._stats.stats)
+            stream = io.StringIO()
+            self._stats.stream = stream
+            self._stats.sort_stats(sort).print_stats(limit)
+            return stream.getvalue()
+
+
+def sample_stacks(seconds, interval=0.005):
+    """
+    Sample the stacks of every other thread for a window of time.
+
+    Args:
+        seconds (float): Length of the sampling window
+        interval (float): Seconds between samples
+
+    Returns:
+        str: Collapsed stacks, one "frame;frame;frame count" line per distinct stack, as read by flamegraph tools
+    """
+    stacks = Counter()
+    sampler = get_ident()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for thread, frame in sys._current_frames().items():
+            if thread == sampler:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            stacks[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+class SlowQueryLog:
+    """
+    Log of the SQL statements slower than a threshold, with their query plans.
+
+    Engine listeners are installed only while the log is enabled.
+    """
+
+    def __init__(self, size=100):
+        """
+        Initialize the log.
+
+        Args:
+            size (int): Number of slow queries kept
+        """
+        self.threshold = None  # Seconds, None when disabled
+        self.entries = deque(maxlen=size)
+        self._engine = None
+
+    @property
+    def enabled(self):
+        """
+        bool: Whether slow queries are being logged.
+        """
+        return self._engine is not None
+
+    def enable(self, engine, threshold):
+        """
+        Start logging the statements of an engine slower than a threshold.
+
+        Args:
+            engine (Engine): SQLAlchemy engine to watch
+            threshold (float): Minimum duration in seconds of a logged statement
+        """
+        self.disable()
+        self.threshold = threshold
+        self._engine = engine
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def disable(self):
+        """
+        Stop logging slow statements and remove the engine listeners.
+        """
+        if self._engine is not None:
+            event.remove(self._engine, "before_cursor_execute", self._before_cursor_execute)
+            event.remove(self._engine, "after_cursor_execute", self._after_cursor_execute)
+            self._engine = None
+        self.threshold = None
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("query_started")
+        if not started:
+            return  # The statement began before the log was enabled
+        elapsed = time.perf_counter() - started.pop()
+        if self.threshold is None or elapsed < self.threshold or executemany:
+            return
+
+        entry = {
+            "at": time.time(),
+            "seconds": elapsed,
+            "statement": statement,
+            "parameters": repr(parameters),
+            "plan": self._explain(conn, statement, parameters),
+        }
+        self.entries.append(entry)
+        print(f"Slow query ({elapsed * 1000:.1f} ms): {statement}\nParameters: {entry['parameters']}\nPlan:\n{entry['plan']}")
+
+    def _explain(self, conn, statement, parameters):
+        # Run the plan on a raw DBAPI cursor, so the explain itself does not go through these listeners
+        prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+        try:
+            cursor = conn.connection.dbapi_connection.cursor()
+            try:
+                cursor.execute(prefix + statement, parameters)
+                return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+            finally:
+                cursor.close()
+        except Exception as e:
+            return f"Explain failed: {e}"
+
+
+# Process-wide profiling tools
+request_profiler = RequestProfiler()
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,136 @@
+"""
+Query registry module for the Golden Raspberry Awards application.
+
+This module keeps the application's SQL statements as named objects built once
+and reused for every execution. Building a statement (aliases, subqueries,
+CTEs) is pure Python work, and a statement built once always produces the same
+cache key, so after the first execution SQLAlchemy's compiled cache returns
+the SQL string without compiling again.
+
+Each execution through the registry records two timings in the metrics
+registry: "query.<name>.compile", from the call to the moment the SQL reaches
+the database cursor (cache key, compiled cache lookup, compilation on a miss,
+parameter processing), and "query.<name>.execute", for the database work and
+fetching the rows. Counters "query.<name>.cache_hit" and
+"query.<name>.cache_miss" count the compiled cache outcomes.
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.interfaces import CacheStats
+
+from src.service.metrics import metrics  # Process-wide metrics registry
+
+from threading import Lock
+import time
+
+# Execution option carrying the per-execution timing of a registered query to the cursor listener
+TIMING_OPTION = "registered_query_timing"
+
+
+class QueryRegistry:
+    """
+    Named SQL statements built once, on first use, and executed with timings.
+
+    Statements are registered as builder functions, so they can reference mapped
+    classes before the mappers are configured. Statements may take bound
+    parameters (sqlalchemy.bindparam), whose values are given at execution.
+    """
+
+    def __init__(self, registry=metrics):
+        """
+        Initialize an empty registry.
+
+        Args:
+            registry (Metrics): Metrics registry receiving the timings and counters
+        """
+        self.metrics = registry
+        self._builders = {}
+        self._statements = {}
+        self._lock = Lock()
+
+    def register(self, name, build):
+        """
+        Register a function that builds a statement.
+
+        Args:
+            name (str): Query name, used in the metric names
+            build (callable): Function without arguments returning the statement
+        """
+        with self._lock:
+            self._builders[name] = build
+            self._statements.pop(name, None)
+
+    def statement(self, name):
+        """
+        Return a registered statement, building it on first use.
+
+        Args:
+            name (str): Query name
+
+        Returns:
+            Executable: The statement, the same object on every call
+        """
+        statement = self._statements.get(name)
+        if statement is None:
+            with self._lock:
+                statement = self._statements.get(name)
+                if statement is None:
+                    statement = self._statements[name] = self._builders[name]()
+        return statement
+
+    def execute(self, session, name, params=None, **options):
+        """
+        Execute a registered statement and fetch every row.
+
+        Args:
+            session (Session): Session executing the statement
+            name (str): Query name
+            params (dict): Values of the bound parameters of the statement
+            **options: Execution options
+
+        Returns:
+            list: Rows of the result
+        """
+        timing = {}
+        started = time.perf_counter()
+        rows = session.execute(self.statement(name), params, execution_options={**options, TIMING_OPTION: timing}).all()
+        self._record(name, started, timing)
+        return rows
+
+    async def execute_async(self, session, name, params=None, **options):
+        """
+        Same as execute, over an asyncio session.
+
+        Args:
+            session (AsyncSession): Session of the async engine
+            name (str): Query name
+            params (dict): Values of the bound parameters of the statement
+            **options: Execution options
+
+        Returns:
+            list: Rows of the result
+        """
+        timing = {}
+        started = time.perf_counter()
+        rows = (await session.execute(self.statement(name), params, execution_options={**options, TIMING_OPTION: timing})).all()
+        self._record(name, started, timing)
+        return rows
+
+    def _record(self, name, started, timing):
+        finished = time.perf_counter()
+        cursor = timing.get("cursor", finished)  # No cursor time if the statement never reached the database
+        self.metrics.observe(f"query.{name}.compile", cursor - started)
+        self.metrics.observe(f"query.{name}.execute", finished - cursor)
+        if timing.get("cache_hit") is CacheStats.CACHE_HIT:
+            self.metrics.increment(f"query.{name}.cache_hit")
+        elif timing.get("cache_hit") is CacheStats.CACHE_MISS:
+            self.metrics.increment(f"query.{name}.cache_miss")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Mark where compilation ended for executions coming from a registry, a dictionary lookup for any other
+    timing = context.execution_options.get(TIMING_OPTION) if context is not None else None
+    if timing is not None:
+        timing["cursor"] = time.perf_counter()
+        timing["cache_hit"] = context.cache_hit
@@ -0,0 +1,256 @@
+"""
+Dataset readers service module for the Golden Raspberry Awards application.
+
+This module reads dataset files in several formats, detected automatically
+from their first bytes:
+
+- CSV, plain or compressed with gzip, bz2 or xz, decompressed as a stream
+  without temporary files;
+- a compact binary columnar format of our own, read through a memory map with
+  no per-field parsing: years, winners and dictionary codes are copied as whole
+  arrays and only the distinct strings are decoded.
+
+Columnar layout (little-endian): the 8-byte MAGIC, the row count (uint64),
+then one (offset, length) pair of uint64 per section in SECTIONS order, then
+the sections, each starting at a multiple of 8 bytes. String columns are an
+array of uint64 end offsets into a UTF-8 blob; studios and producers are
+stored as int32 codes into such a string table.
+"""
+from array import array
+from os import environ
+import bz2
+import csv
+import gzip
+import io
+import lzma
+import mmap
+import struct
+import sys
+
+# First bytes of each supported format
+MAGIC = b"GRACOL\x00\x01"
+SIGNATURES = (
+    (MAGIC, "columnar"),
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+)
+
+# Openers of the compressed CSV formats, in text mode
+COMPRESSED_OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+# Sections of the columnar format, in file order
+SECTIONS = (
+    "years", "winners",
+    "title_offsets", "title_blob",
+    "studio_codes", "studio_offsets", "studio_blob",
+    "producer_codes", "producer_offsets", "producer_blob",
+)
+_HEADER = struct.Struct("<8sQ")
+_SECTION = struct.Struct("<QQ")
+
+# Dataset columns, in CSV order
+COLUMNS = ("year", "title", "studios", "producers", "winner")
+
+
+def detect_format(path):
+    """
+    Detect the format of a dataset file from its first bytes.
+
+    Args:
+        path (str): Path of the dataset file
+
+    Returns:
+        str: "columnar", "gzip", "bz2", "xz" or "csv"
+    """
+    with open(path, "rb") as file:
+        head = file.read(len(MAGIC))
+    for signature, name in SIGNATURES:
+        if head.startswith(signature):
+            return name
+    return "csv"
+
+
+def read_rows(path, delimiter=None):
+    """
+    Read the rows of a dataset file in any supported format.
+
+    Args:
+        path (str): Path of the dataset file
+        delimiter (str): CSV delimiter, the CSV_DELIMITER environment variable or ";" if None
+
+    Yields:
+        tuple: (year, title, studios, producers, winner) with year as int and winner as bool
+    """
+    file_format = detect_format(path)
+    if file_format == "columnar":
+        yield from _columnar_rows(read_columnar(path))
+        return
+
+    delimiter = delimiter or environ.get("CSV_DELIMITER", ";")
+    opener = COMPRESSED_OPENERS.get(file_format, open)
+    with opener(path, mode="rt", encoding="utf-8", newline="") as file:
+        for row in csv.DictReader(file, delimiter=delimiter):
+            yield int(row["year"]), row["title"], row["studios"], row["producers"], row["winner"] == "yes"
+
+
+def write_csv(rows, path, compression=None, delimiter=None):
+    """
+    Write rows as a dataset CSV file, optionally compressed.
+
+    Args:
+        rows (iterable): (year, title, studios, producers, winner) tuples
+        path (str): Destination path
+        compression (str): "gzip", "bz2", "xz" or None for plain CSV
+        delimiter (str): CSV delimiter, the CSV_DELIMITER environment variable or ";" if None
+
+    Returns:
+        int: Number of rows written
+    """
+    opener = COMPRESSED_OPENERS[compression] if compression else open
+    count = 0
+    with opener(path, mode="wt", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, delimiter=delimiter or environ.get("CSV_DELIMITER", ";"), lineterminator="\n")
+        writer.writerow(COLUMNS)
+        for year, title, studios, producers, winner in rows:
+            writer.writerow((year, title, studios, producers, "yes" if winner else ""))
+            count += 1
+    return count
+
+
+def _columnar_rows(columns):
+    # Decode the columns of a columnar file back into rows
+    studios, producers = columns["studios"], columns["producers"]
+    for index, year in enumerate(columns["years"]):
+        yield (
+            year,
+            columns["titles"][index],
+            studios[1][studios[0][index]],
+            producers[1][producers[0][index]],
+            bool(columns["winners"][index]),
+        )
+
+
+def _string_column(values):
+    # Encode strings as uint64 end offsets into one UTF-8 blob
+    offsets, blob, end = array("Q"), io.BytesIO(), 0
+    for value in values:
+        encoded = (value or "").encode("utf-8")
+        blob.write(encoded)
+        end += len(encoded)
+        offsets.append(end)
+    return offsets, blob.getvalue()
+
+
+def _decode_strings(offsets, blob):
+    # Decode a string column written by _string_column
+    strings, start = [], 0
+    for end in offsets:
+        strings.append(str(blob[start:end], "utf-8"))
+        start = end
+    return strings
+
+
+def _little_endian(values):
+    # Arrays are stored little-endian whatever the platform
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def write_columnar(rows, path):
+    """
+    Write rows in the binary columnar format.
+
+    None studios or producers are written as empty strings, as in the CSV export.
+
+    Args:
+        rows (iterable): (year, title, studios, producers, winner) tuples
+        path (str): Destination path
+
+    Returns:
+        int: Number of rows written
+    """
+    years, winners, titles = array("i"), bytearray(), []
+    codes = {"studio": array("i"), "producer": array("i")}
+    tables = {"studio": {}, "producer": {}}  # String to code, in first-seen order
+    for year, title, studios, producers, winner in rows:
+        years.append(year)
+        winners.append(1 if winner else 0)
+        titles.append(title)
+        for column, value in (("studio", studios or ""), ("producer", producers or "")):
+            codes[column].append(tables[column].setdefault(value, len(tables[column])))
+
+    sections = {"years": _little_endian(years).tobytes(), "winners": bytes(winners)}
+    offsets, blob = _string_column(titles)
+    sections["title_offsets"], sections["title_blob"] = _little_endian(offsets).tobytes(), blob
+    for column in ("studio", "producer"):
+        offsets, blob = _string_column(tables[column])
+        sections[f"{column}_codes"] = _little_endian(codes[column]).tobytes()
+        sections[f"{column}_offsets"], sections[f"{column}_blob"] = _little_endian(offsets).tobytes(), blob
+
+    with open(path, "wb") as file:
+        position = _HEADER.size + _SECTION.size * len(SECTIONS)
+        table = []
+        for name in SECTIONS:
+            position += -position % 8  # Align every section to 8 bytes
+            table.append((position, len(sections[name])))
+            position += len(sections[name])
+
+        file.write(_HEADER.pack(MAGIC, len(years)))
+        for offset, length in table:
+            file.write(_SECTION.pack(offset, length))
+        for name, (offset, length) in zip(SECTIONS, table):
+            file.write(b"\x00" * (offset - file.tell()))
+            file.write(sections[name])
+    return len(years)
+
+
+def read_columnar(path):
+    """
+    Read a columnar file through a memory map.
+
+    Args:
+        path (str): Path of the columnar file
+
+    Returns:
+        dict: "years" (array of int32), "winners" (bytes), "titles" (list of str),
+        and "studios" and "producers" as (array of int32 codes, list of distinct strings)
+
+    Raises:
+        ValueError: If the file is not in the columnar format
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        magic, rows = _HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a columnar dataset file")
+
+        view = memoryview(mapped)
+        sections = {}
+        try:
+            for position, name in enumerate(SECTIONS):
+                offset, length = _SECTION.unpack_from(mapped, _HEADER.size + position * _SECTION.size)
+                sections[name] = view[offset:offset + length]
+
+            def numbers(name, typecode):
+                values = array(typecode)
+                values.frombytes(sections[name])
+                return _little_endian(values)
+
+            columns = {
+                "years": numbers("years", "i"),
+                "winners": bytes(sections["winners"]),
+                "titles": _decode_strings(numbers("title_offsets", "Q"), sections["title_blob"]),
+            }
+            for column, key in (("studio", "studios"), ("producer", "producers")):
+                columns[key] = (numbers(f"{column}_codes", "i"), _decode_strings(numbers(f"{column}_offsets", "Q"), sections[f"{column}_blob"]))
+        finally:
+            # Release every view before the map closes
+            for section in sections.values():
+                section.release()
+            view.release()
+
+    if len(columns["years"]) != rows:
+        raise ValueError(f"{path} is truncated: expected {rows} rows")
+    return columns
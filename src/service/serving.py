@@ -0,0 +1,235 @@
+"""
+Serving mode service module for the Golden Raspberry Awards application.
+
+This module configures the database and the WSGI server for serving requests
+from several threads. A single in-memory SQLite connection cannot be used by
+threads at the same time, so threaded serving moves the database to a file in
+WAL mode, where every thread reads through its own pooled connection without
+blocking the others or being blocked by a writer.
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from werkzeug.serving import BaseWSGIServer
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import BoundedSemaphore, Lock
+import atexit
+import os
+import shutil
+import tempfile
+
+# Seconds a connection waits for a lock held by a writer before failing
+BUSY_TIMEOUT = 5
+
+
+def is_memory_database(url):
+    """
+    Tell whether a database URL names an in-memory SQLite database.
+
+    Args:
+        url (str): SQLAlchemy database URL
+
+    Returns:
+        bool: True for sqlite:// and sqlite:///:memory: URLs
+    """
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def database_settings(url, threads):
+    """
+    Return the database URL and engine options for serving from a number of threads.
+
+    With a single thread the URL is used as given. With several threads an in-memory
+    database is replaced by a file in a temporary directory, removed at exit, and the
+    connection pool keeps one connection per serving thread.
+
+    Args:
+        url (str): SQLAlchemy database URL from the configuration
+        threads (int): Number of threads serving requests
+
+    Returns:
+        tuple: A tuple containing:
+            - str: The database URL to use
+            - dict: Engine options for SQLALCHEMY_ENGINE_OPTIONS
+    """
+    if threads <= 1 or make_url(url).get_backend_name() != "sqlite":
+        return url, {}
+
+    if is_memory_database(url):
+        directory = tempfile.mkdtemp(prefix="golden-raspberry-awards-")
+        atexit.register(shutil.rmtree, directory, ignore_errors=True)
+        url = f"sqlite:///{os.path.join(directory, 'awards.db')}"
+
+    return url, {
+        "pool_size": threads,  # One connection per serving thread
+        "max_overflow": threads,  # Headroom for background work such as the warm-up
+        # Pooled connections move between threads, one thread at a time
+        "connect_args": {"check_same_thread": False, "timeout": BUSY_TIMEOUT},
+    }
+
+
+def configure_engine(engine):
+    """
+    Put every new connection of a file-backed SQLite engine in WAL mode.
+
+    In WAL mode readers see the last committed data without taking locks,
+    so reads on the serving threads never wait for each other or for a writer.
+
+    Args:
+        engine (Engine): Engine of the application database
+    """
+    if engine.url.get_backend_name() != "sqlite" or is_memory_database(engine.url):
+        return
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")  # The data is reloaded from the dataset on every start
+        cursor.close()
+
+
+class SharedConnectionLock:
+    """
+    Serializes requests and background writers on a single shared in-memory connection.
+
+    An in-memory SQLite database lives in one connection shared by every user, so
+    a transaction of a background thread would interleave with the statements and
+    the end-of-request rollback of a request on the same connection. When the
+    application uses an in-memory database, each request holds the lock from its
+    start until its session is removed, and background writers hold it around each
+    of their transactions. Requests under the exempt path prefixes, which never
+    use the database, are served without the lock. With a file database every
+    thread has its own connection and the lock is never taken.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.exempt = ()
+        self._lock = Lock()
+
+    def init_app(self, app, session, exempt=()):
+        """
+        Install the request hooks when the application uses an in-memory database.
+
+        Args:
+            app (Flask): The application
+            session (scoped_session): Session removed before a request releases the lock
+            exempt (tuple): Path prefixes of the requests served without the lock
+        """
+        from flask import g, request
+
+        self.enabled = is_memory_database(app.config["SQLALCHEMY_DATABASE_URI"])
+        self.exempt = tuple(exempt)
+        if not self.enabled:
+            return
+
+        @app.before_request
+        def _acquire_connection():
+            if request.path.startswith(self.exempt):
+                return
+            self._lock.acquire()
+            g.shared_connection = True
+
+        @app.teardown_request
+        def _release_connection(exception):
+            if g.pop("shared_connection", False):
+                try:
+                    session.remove()  # End the request's use of the connection before a writer may begin
+                finally:
+                    self._lock.release()
+
+    @contextmanager
+    def hold(self):
+        """
+        Context manager holding the shared connection for a background transaction, a no-op on file databases.
+        """
+        if not self.enabled:
+            yield
+            return
+        with self._lock:
+            yield
+
+
+# Lock of the shared in-memory connection, installed on the application in api.py
+shared_connection_lock = SharedConnectionLock()
+
+
+class ThreadPoolWSGIServer(BaseWSGIServer):
+    """
+    WSGI server handling each connection on one of a fixed number of threads.
+
+    Unlike a thread per connection, the number of threads, and so of database
+    connections, stays bounded under load. Besides the threads serving requests,
+    the pool has a thread for every request the admission controller lets compute
+    or wait in its queue. Those requests never take the serving threads, which
+    stay free for the other endpoints and for answering 503 once the admission
+    queue is full. While every thread is busy the server stops accepting, so
+    further connections wait in the listen backlog instead of queueing in memory.
+    """
+    multithread = True
+
+    def __init__(self, host, port, app, threads, admission=0):
+        """
+        Initialize the server.
+
+        Args:
+            host (str): Host to listen on
+            port (int): Port to listen on, 0 for any free port
+            app (callable): WSGI application
+            threads (int): Number of threads serving requests
+            admission (int): Additional threads for the requests computing or queued under admission control
+        """
+        super().__init__(host, port, app)
+        self.threads = threads + admission
+        self.executor = ThreadPoolExecutor(self.threads, thread_name_prefix="awards-request")
+        self.idle = BoundedSemaphore(self.threads)  # Free threads, the accept loop waits for one before handing a connection over
+
+    def process_request(self, request, client_address):
+        self.idle.acquire()
+        try:
+            self.executor.submit(self._handle, request, client_address)
+        except BaseException:
+            self.idle.release()
+            self.shutdown_request(request)
+            raise
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.idle.release()
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+def serve(app, host="127.0.0.1", port=5000, threads=1, admission=0):
+    """
+    Serve the application until interrupted.
+
+    Args:
+        app (Flask): The application
+        host (str): Host to listen on
+        port (int): Port to listen on
+        threads (int): Number of threads serving requests, one runs the Flask development server single-threaded
+        admission (int): Additional threads for the requests computing or queued under admission control
+    """
+    if threads <= 1:
+        app.run(host=host, port=port, threaded=False)
+        return
+
+    server = ThreadPoolWSGIServer(host, port, app, threads, admission)
+    print(f" * Serving on http://{server.server_address[0]}:{server.port} with {threads} threads and {admission} for admitted and queued requests")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,50 @@
+"""
+Sizing service module for the Golden Raspberry Awards application.
+
+This module estimates the memory held by in-memory structures, for the memory
+report and the memory budget of the named datasets.
+"""
+from array import array
+import sys
+
+# Objects whose size does not grow with the data, and that may be shared across structures
+_LEAVES = (str, bytes, bytearray, int, float, array, type(None), bool, type)
+
+
+def deep_sizeof(obj, seen=None):
+    """
+    Estimate the memory held by an object and everything it references.
+
+    Objects already in seen are not counted again, so passing the same set
+    to several calls accounts shared objects once, to the first caller.
+
+    Args:
+        obj (object): Object to measure
+        seen (set): Ids of the objects already counted, updated in place
+
+    Returns:
+        int: Estimated size in bytes
+    """
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or current is None or isinstance(current, bool):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, _LEAVES):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        else:
+            if hasattr(current, "__dict__"):
+                stack.append(current.__dict__)
+            for cls in type(current).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    stack.append(getattr(current, slot, None))
+    return size
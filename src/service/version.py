@@ -0,0 +1,72 @@
+"""
+Data version service module for the Golden Raspberry Awards application.
+
+This module keeps a process-wide counter that changes whenever the award data
+is written, so in-memory snapshots, indexes and caches can tell whether they
+were built from the current data.
+"""
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from threading import Lock
+
+
+class DataVersion:
+    """
+    Monotonic counter identifying the current state of the award data.
+    """
+
+    def __init__(self):
+        self._value = 0
+        self._lock = Lock()
+
+    @property
+    def value(self):
+        """
+        int: The current data version.
+        """
+        return self._value
+
+    def bump(self):
+        """
+        Advance the data version, invalidating anything built from older data.
+
+        Returns:
+            int: The new data version
+        """
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+# Process-wide data version shared by the application
+data_version = DataVersion()
+
+
+def _mark_written(session):
+    # Remember that this transaction wrote data and invalidate right away,
+    # since the same session already reads its own uncommitted rows
+    session.info["data_written"] = True
+    data_version.bump()
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    # Unit of work writes: session.add, session.delete and dirty instances
+    if session.new or session.dirty or session.deleted:
+        _mark_written(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state):
+    # Statement writes: query(...).delete(), session.execute(insert(...)) and friends
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _mark_written(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _after_transaction(session):
+    # Committed or discarded writes both change what readers see
+    if session.info.pop("data_written", False):
+        data_version.bump()
@@ -0,0 +1,83 @@
+"""
+Integration tests for the award listing and export endpoints.
+
+This module verifies that the /awards/ and /awards/export endpoints return
+every row of the dataset through the AwardRecord read model.
+"""
+from src.model.awards import Awards, AwardRecord
+from src.service.db import db
+
+import csv
+import io
+
+
+def test_iter_records_returns_read_model(application):
+    """
+    Test that iter_records yields AwardRecord tuples instead of ORM instances.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    with application.app_context():
+        records = list(Awards.iter_records(batch_size=7))
+
+        assert len(records) == db.session.query(Awards).count()
+        assert all(isinstance(record, AwardRecord) for record in records)
+        assert [record.id for record in records] == sorted(record.id for record in records)
+        assert records == Awards.get_records()
+
+
+def test_record_to_dict_matches_orm(application):
+    """
+    Test that AwardRecord.to_dict has the same content as Awards.to_dict.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    with application.app_context():
+        orm_rows = [award.to_dict() for award in db.session.query(Awards).order_by(Awards.id)]
+        assert [record.to_dict() for record in Awards.get_records()] == orm_rows
+
+
+def test_list_awards(client, application):
+    """
+    Test that the listing endpoint returns every award row.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    with application.app_context():
+        db.session.query(Awards).delete()
+        db.session.add(Awards(1980, "Film A", "Studio A", "Producer X", True))
+        db.session.add(Awards(1981, "Film B", "Studio B", "Producer Y", "no"))
+        db.session.commit()
+
+        response = client.get("/awards/")
+        assert response.status_code == 200
+        assert [(item["title"], item["winner"]) for item in response.json] == [("Film A", True), ("Film B", False)]
+
+
+def test_export_awards_round_trip(client, application):
+    """
+    Test that the export endpoint produces a CSV in the input dataset layout.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    with application.app_context():
+        db.session.query(Awards).delete()
+        db.session.add(Awards(1980, "Film; A", "Studio A", "Producer X", True))
+        db.session.add(Awards(1981, "Film B", None, "Producer Y", False))
+        db.session.commit()
+
+        response = client.get("/awards/export")
+        assert response.status_code == 200
+        assert response.mimetype == "text/csv"
+
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True)), delimiter=";"))
+        assert rows == [
+            {"year": "1980", "title": "Film; A", "studios": "Studio A", "producers": "Producer X", "winner": "yes"},
+            {"year": "1981", "title": "Film B", "studios": "", "producers": "Producer Y", "winner": ""},
+        ]
@@ -0,0 +1,220 @@
+"""
+Tests for single-flight coalescing of the consecutive awards computation.
+
+This module verifies that concurrent identical requests share a single
+computation and that the number of coalesced requests is reported in the metrics.
+"""
+from src.core.awards import AwardsCore, longest_fastest_flight
+from src.service.coalesce import SingleFlight
+from src.service.metrics import Metrics
+
+from threading import Barrier, Event, Thread
+import asyncio
+import time
+
+
+def wait_until(condition, timeout=10):
+    """
+    Poll a condition until it holds or the timeout expires.
+
+    Args:
+        condition (callable): Function returning True once the wait is over
+        timeout (float): Maximum seconds to wait
+
+    Returns:
+        bool: Whether the condition held before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def run_concurrently(count, target):
+    """
+    Start count threads running target and wait for all of them.
+
+    Args:
+        count (int): Number of threads
+        target (callable): Function run by each thread
+
+    Returns:
+        list: The values returned by target, in thread start order
+    """
+    results = [None] * count
+
+    def worker(position):
+        results[position] = target()
+
+    threads = [Thread(target=worker, args=(position,)) for position in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results
+
+
+def test_single_flight_shares_one_execution():
+    """
+    Test that overlapping calls with the same key run the function once.
+    """
+    registry = Metrics()
+    flight = SingleFlight("test", registry)
+    release = Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(timeout=10)  # Hold the computation until every caller is waiting
+        return {"answer": 42}
+
+    def caller():
+        return flight.do("key", compute)
+
+    threads = [Thread(target=caller) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    # Wait until the seven followers are queued behind the leader
+    queued = wait_until(lambda: registry.counter("test.coalesced") >= 7)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert queued
+    assert len(calls) == 1
+    assert registry.counter("test.executed") == 1
+    assert registry.counter("test.coalesced") == 7
+
+
+def test_single_flight_runs_again_after_completion():
+    """
+    Test that calls that do not overlap each run the function.
+    """
+    flight = SingleFlight("test", Metrics())
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+
+
+def test_single_flight_shares_errors():
+    """
+    Test that an error raised by the leader is raised in every coalesced caller.
+    """
+    flight = SingleFlight("test", Metrics())
+    barrier = Barrier(4)
+
+    def failing():
+        raise RuntimeError("boom")
+
+    def caller():
+        barrier.wait(timeout=10)
+        try:
+            flight.do("key", failing)
+        except RuntimeError as e:
+            return str(e)
+
+    assert run_concurrently(4, caller) == ["boom"] * 4
+
+
+def test_async_callers_wait_on_a_synchronous_leader():
+    """
+    Test that coroutines coalesce with a call of do in flight, and are woken when it finishes.
+    """
+    registry = Metrics()
+    flight = SingleFlight("test", registry)
+    release = Event()
+
+    def compute():
+        release.wait(timeout=10)
+        return {"answer": 42}
+
+    leader = Thread(target=flight.do, args=("key", compute))
+    leader.start()
+    assert wait_until(lambda: "key" in flight._calls)
+
+    async def fail():
+        raise AssertionError("a follower must not compute")
+
+    async def run():
+        followers = asyncio.gather(*(flight.do_async("key", fail) for _ in range(3)))
+        while registry.counter("test.coalesced") < 3:
+            await asyncio.sleep(0.001)
+        release.set()
+        return await followers
+
+    assert asyncio.run(run()) == [{"answer": 42}] * 3
+    leader.join(timeout=10)
+    assert registry.counter("test.executed") == 1
+
+
+def test_async_callers_share_one_execution_and_its_errors():
+    """
+    Test that overlapping coroutines run the coroutine function once, sharing its error.
+    """
+    registry = Metrics()
+    flight = SingleFlight("test", registry)
+
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("boom")
+
+    async def run():
+        return await asyncio.gather(*(flight.do_async("key", failing) for _ in range(4)), return_exceptions=True)
+
+    assert [str(error) for error in asyncio.run(run())] == ["boom"] * 4
+    assert registry.counter("test.executed") == 1
+    assert registry.counter("test.coalesced") == 3
+    assert asyncio.run(flight.do_async("key", lambda: asyncio.sleep(0, result=2))) == 2
+
+
+def test_core_coalesces_concurrent_requests(application, monkeypatch):
+    """
+    Test that concurrent AwardsCore calls run the model query once and report it in the metrics.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        monkeypatch: Pytest fixture used to slow down the model query
+    """
+    release = Event()
+    calls = []
+
+    def slow_query():
+        calls.append(1)
+        release.wait(timeout=10)
+        return {"min": [], "max": []}
+
+    monkeypatch.setattr(AwardsCore().model, "get_longest_fastest_consecutive_awards", slow_query)
+    registry = longest_fastest_flight.metrics
+    coalesced = registry.counter("awards.longest_fastest.coalesced")
+
+    def request():
+        with application.app_context():
+            return AwardsCore().get_longest_fastest_consecutive_awards()
+
+    threads = [Thread(target=request) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    queued = wait_until(lambda: registry.counter("awards.longest_fastest.coalesced") >= coalesced + 4)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert queued
+    assert len(calls) == 1
+
+
+def test_metrics_endpoint_reports_coalescing(client):
+    """
+    Test that the metrics endpoint exposes the coalescing counters.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+    """
+    client.get("/awards/longest-fastest-consecutive-awards")
+
+    response = client.get("/admin/metrics")
+    assert response.status_code == 200
+    assert "timings" in response.json
+    assert response.json["counters"]["awards.longest_fastest.executed"] >= 1
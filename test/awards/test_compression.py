@@ -0,0 +1,98 @@
+"""
+Tests for the pre-compressed response bodies.
+
+This module verifies that cached answers are stored gzip and deflate compressed
+once per data version, and that the endpoints pick the stored body matching the
+client's Accept-Encoding header.
+"""
+from src.model.awards import Awards
+from src.service.cache import MIN_COMPRESS_SIZE, CachedResponse, response_cache
+from src.service.db import db
+from src.service.version import data_version
+
+import gzip
+import zlib
+
+
+def test_cached_response_stores_compressed_variants():
+    """
+    Test that large bodies are stored compressed and small ones only uncompressed.
+    """
+    large = CachedResponse(1, [{"title": "Film"}] * 200)
+    assert set(large.variants) == {"identity", "gzip", "deflate"}
+    assert gzip.decompress(large.variants["gzip"]) == large.body
+    assert zlib.decompress(large.variants["deflate"]) == large.body
+
+    small = CachedResponse(1, {"min": [], "max": []})
+    assert len(small.body) < MIN_COMPRESS_SIZE
+    assert set(small.variants) == {"identity"}
+
+
+def test_listing_negotiates_encoding(client, application):
+    """
+    Test that the listing is sent with the content coding preferred by the client.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    identity = client.get("/awards/")
+    assert identity.status_code == 200
+    assert "Content-Encoding" not in identity.headers
+    assert "Accept-Encoding" in identity.headers["Vary"]
+
+    compressed = client.get("/awards/", headers={"Accept-Encoding": "gzip, deflate"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert gzip.decompress(compressed.data) == identity.data
+
+    deflated = client.get("/awards/", headers={"Accept-Encoding": "gzip;q=0, deflate"})
+    assert deflated.headers["Content-Encoding"] == "deflate"
+    assert zlib.decompress(deflated.data) == identity.data
+
+    unsupported = client.get("/awards/", headers={"Accept-Encoding": "br"})
+    assert "Content-Encoding" not in unsupported.headers
+    assert unsupported.data == identity.data
+
+
+def test_compressed_body_computed_once_per_version(client, application):
+    """
+    Test that repeated requests reuse the stored compressed body until the data changes.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    first = client.get("/awards/", headers={"Accept-Encoding": "gzip"})
+    cached = response_cache.get("awards", data_version.value)
+    assert cached is not None
+    assert first.data == cached.variants["gzip"]
+
+    client.get("/awards/", headers={"Accept-Encoding": "gzip"})
+    assert response_cache.get("awards", data_version.value) is cached
+
+    with application.app_context():
+        db.session.add(Awards(2030, "Film Z", "Studio Z", "Producer Z", True))
+        db.session.commit()
+
+    changed = client.get("/awards/", headers={"Accept-Encoding": "gzip"})
+    assert b"Film Z" in gzip.decompress(changed.data)
+    assert response_cache.get("awards", data_version.value) is not cached
+
+
+def test_export_negotiates_encoding(client, application):
+    """
+    Test that the CSV export is sent compressed with its CSV media type.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    identity = client.get("/awards/export")
+    compressed = client.get("/awards/export", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.status_code == 200
+    assert compressed.mimetype == "text/csv"
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(compressed.data) == identity.data
+    assert identity.data.startswith(b"year;title;studios;producers;winner\n")
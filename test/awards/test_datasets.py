@@ -0,0 +1,194 @@
+"""
+Tests for hosting several named datasets in one process.
+
+This module verifies the DATASETS configuration parsing, lazy loading and
+LRU eviction of the named datasets, and that the award endpoints answer from
+the dataset named by the X-Dataset header or the "dataset" query parameter.
+"""
+from src.core.datasets import DatasetRegistry, parse_datasets
+import src.resource.awards
+
+import pytest
+
+HEADER = "year;title;studios;producers;winner\n"
+
+
+def write_dataset(directory, name, rows):
+    """
+    Write a dataset CSV file.
+
+    Args:
+        directory: Directory receiving the file
+        name (str): File name without extension
+        rows (list): CSV lines without the header
+
+    Returns:
+        str: Path of the written file
+    """
+    path = directory / f"{name}.csv"
+    path.write_text(HEADER + "".join(row + "\n" for row in rows), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture()
+def registry(tmp_path, monkeypatch):
+    """
+    Fixture providing a registry with two named datasets, installed in the awards resources.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture
+        monkeypatch: Pytest fixture used to install the registry
+
+    Returns:
+        DatasetRegistry: Registry with the "regional" and "historical" datasets
+    """
+    registry = DatasetRegistry({
+        "regional": write_dataset(tmp_path, "regional", [
+            "1990;Film A;Studio A;Producer R;yes",
+            "1993;Film B;Studio A;Producer R;yes",
+            "1991;Film C;Studio B;Producer S;",
+        ]),
+        "historical": write_dataset(tmp_path, "historical", [
+            "1950;Film H;Studio H;Producer H;yes",
+            "1970;Film I;Studio H;Producer H;yes",
+        ]),
+    }, memory_budget=2**30)
+    monkeypatch.setattr(src.resource.awards, "dataset_registry", registry)
+    return registry
+
+
+def test_parse_datasets():
+    """
+    Test parsing of the DATASETS environment variable.
+    """
+    assert parse_datasets("regional=a.csv, historical = b.csv") == {"regional": "a.csv", "historical": "b.csv"}
+    assert parse_datasets("") == {}
+    assert parse_datasets(None) == {}
+    with pytest.raises(ValueError):
+        parse_datasets("regional")
+
+
+def test_datasets_load_lazily(registry):
+    """
+    Test that datasets are loaded on first use and reused afterwards.
+
+    Args:
+        registry: Registry fixture
+    """
+    assert not registry.report()["datasets"]["regional"]["loaded"]
+
+    dataset = registry.get("regional")
+    assert registry.get("regional") is dataset
+
+    report = registry.report()["datasets"]["regional"]
+    assert report["loaded"] and report["rows"] == 3 and report["bytes"] > 0
+    assert (report["loads"], report["hits"], report["evictions"]) == (1, 1, 0)
+
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+def test_least_recently_used_dataset_is_evicted(registry):
+    """
+    Test that loading past the memory budget evicts the least recently used dataset.
+
+    Args:
+        registry: Registry fixture
+    """
+    registry.get("regional")
+    registry.memory_budget = registry.report()["memory_used"]  # Room for exactly one dataset
+
+    registry.get("historical")
+    report = registry.report()
+    assert not report["datasets"]["regional"]["loaded"]
+    assert report["datasets"]["regional"]["evictions"] == 1
+    assert report["datasets"]["historical"]["loaded"]
+    assert report["memory_used"] == report["datasets"]["historical"]["bytes"]
+
+    # Using an evicted dataset loads it again
+    registry.get("regional")
+    assert registry.report()["datasets"]["regional"]["loads"] == 2
+
+
+def test_budget_counts_structures_built_after_load(client, registry):
+    """
+    Test that indexes and cached responses built after the load count towards the memory budget.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        registry: Registry fixture
+    """
+    registry.get("historical")
+    registry.get("regional")
+    loaded = registry.report()["datasets"]["regional"]["bytes"]
+    registry.memory_budget = registry.report()["memory_used"]  # Both datasets fit as loaded, with no room to grow
+
+    client.get("/awards/?dataset=regional", headers={"Accept-Encoding": "gzip"})
+    client.get("/awards/longest-fastest-consecutive-awards?dataset=regional")
+
+    report = registry.report()
+    assert report["datasets"]["regional"]["bytes"] > loaded
+    assert not report["datasets"]["historical"]["loaded"]  # Evicted to make room for the structures
+    assert report["datasets"]["historical"]["evictions"] == 1
+
+
+def test_endpoints_answer_from_named_dataset(client, registry):
+    """
+    Test that the award endpoints answer from the dataset named by the header or query parameter.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        registry: Registry fixture
+    """
+    response = client.get("/awards/longest-fastest-consecutive-awards", headers={"X-Dataset": "regional"})
+    assert response.status_code == 200
+    assert response.json == {"min": [{"producer": "Producer R", "interval": 3, "previousWin": 1990, "followingWin": 1993}], "max": []}
+
+    response = client.get("/awards/longest-fastest-consecutive-awards?dataset=historical")
+    assert response.json["min"][0]["producer"] == "Producer H"
+
+    response = client.get("/awards/?dataset=regional")
+    assert [item["title"] for item in response.json] == ["Film A", "Film B", "Film C"]
+
+    response = client.get("/awards/stats?group_by=studios&dataset=regional")
+    assert response.json == [
+        {"studio": "Studio A", "nominations": 2, "wins": 2},
+        {"studio": "Studio B", "nominations": 1, "wins": 0},
+    ]
+
+    response = client.get("/awards/producers/producer s", headers={"X-Dataset": "regional"})
+    assert [item["title"] for item in response.json] == ["Film C"]
+
+    response = client.get("/awards/export?dataset=historical")
+    assert response.get_data(as_text=True).splitlines()[1] == "1950;Film H;Studio H;Producer H;yes"
+
+    response = client.get("/awards/stats", headers={"X-Dataset": "missing"})
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("path", [
+    "/awards/longest-fastest-consecutive-awards",
+    "/awards/producers",
+    "/awards/producers/producer r",
+    "/awards/stats",
+    "/awards/",
+    "/awards/export",
+])
+def test_dataset_load_failure_is_an_error_response(client, tmp_path, monkeypatch, path):
+    """
+    Test that a named dataset whose file cannot be loaded answers 400 instead of an unhandled error.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        tmp_path: Pytest temporary directory fixture
+        monkeypatch: Pytest fixture used to install the registry
+        path (str): Endpoint requested
+    """
+    registry = DatasetRegistry({"broken": str(tmp_path / "deleted.csv")}, memory_budget=2**30)
+    monkeypatch.setattr(src.resource.awards, "dataset_registry", registry)
+
+    response = client.get(path, headers={"X-Dataset": "broken"})
+    assert response.status_code == 400
+    assert response.json == {"message": "Dataset 'broken' could not be loaded"}
+
+    assert client.get(path, headers={"X-Dataset": "missing"}).status_code == 404
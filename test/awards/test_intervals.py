@@ -0,0 +1,194 @@
+"""
+Tests for the year-range restricted consecutive awards queries.
+
+This module verifies the in-memory interval index against the SQL query and
+against a brute-force recomputation over the rows of each window, and the
+"from", "to" and "dimension" parameters of the
+/awards/longest-fastest-consecutive-awards endpoint.
+"""
+from src.core.intervals import build_interval_indexes, current_interval_index
+from src.core.snapshot import AwardsSnapshot
+from src.model.awards import Awards, AwardRecord
+from src.service.db import db
+
+import random
+
+# Dataset with several producers, repeated years and non-winning rows
+TEST_DATA = [
+    (2000, "Film A", "Studio A", "Producer X", True),
+    (2000, "Film B", "Studio B", "Producer X", True),  # Same year
+    (2002, "Film C", "Studio C", "Producer X", True),
+    (2001, "Film D", "Studio D", "Producer X", False),  # Not a win
+    (1990, "Film E", "Studio E", "Producer Y", True),
+    (2010, "Film F", "Studio F", "Producer Y", True),
+    (1995, "Film G", "Studio G", "Producer Z", True),
+    (2005, "Film H", "Studio H", "Producer Z", True),
+    (2009, "Film I", "Studio I", "Producer Z", True),
+]
+
+
+def load(application, rows):
+    """
+    Replace the awards table with the given rows.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        rows (list): Tuples with the Awards constructor arguments
+    """
+    with application.app_context():
+        db.session.query(Awards).delete()
+        db.session.add_all([Awards(*row) for row in rows])
+        db.session.commit()
+
+
+def test_unbounded_query_matches_sql(application):
+    """
+    Test that the index without a window gives the same answer as the SQL query.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    load(application, TEST_DATA)
+    with application.app_context():
+        assert current_interval_index().query() == Awards.get_longest_fastest_consecutive_awards()
+
+
+def test_null_values_form_no_intervals(client, application):
+    """
+    Test that winners without a producer or studio are never paired, as in the SQL query.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    load(application, [(1980, "Film A", None, None, True), (1982, "Film B", None, None, True),
+                       (1990, "Film C", "Studio", "P", True), (2000, "Film D", "Studio", "P", True)])
+    with application.app_context():
+        expected = Awards.get_longest_fastest_consecutive_awards()
+        indexes = build_interval_indexes(AwardsSnapshot.from_database())
+
+    assert expected == {"min": [{"producer": "P", "interval": 10, "previousWin": 1990, "followingWin": 2000}], "max": []}
+    assert indexes["producers"].query() == expected
+    assert indexes["producers"].query(1900, 2100) == expected
+    assert indexes["studios"].query() == {"min": [{**expected["min"][0], "producer": "Studio"}], "max": []}
+    assert client.get("/awards/longest-fastest-consecutive-awards?from=1900").json == expected
+
+
+def test_windows_match_brute_force():
+    """
+    Test random windows over a random dataset against recomputing the answer from the window's rows.
+    """
+    rng = random.Random(7)
+    records = [AwardRecord(i, rng.randint(1980, 2020), f"Film {i}", "Studio", f"Producer {rng.randrange(15)}", rng.random() < 0.6) for i in range(300)]
+    indexes = build_interval_indexes(AwardsSnapshot.from_records(records))
+
+    for _ in range(200):
+        year_from, year_to = sorted(rng.sample(range(1975, 2026), 2))
+        inside = [record for record in records if year_from <= record.year <= year_to]
+        expected = build_interval_indexes(AwardsSnapshot.from_records(inside))["producers"].query()
+        assert indexes["producers"].query(year_from, year_to) == expected
+
+
+def test_wins_between():
+    """
+    Test the per-producer sorted win years lookup.
+    """
+    records = [AwardRecord(i, *row) for i, row in enumerate(TEST_DATA, start=1)]
+    index = build_interval_indexes(AwardsSnapshot.from_records(records))["producers"]
+
+    assert index.wins_between("Producer X") == [2000, 2000, 2002]
+    assert index.wins_between("Producer Z", 2000, 2009) == [2005, 2009]
+    assert index.wins_between("Nobody") == []
+
+
+def test_endpoint_window(client, application):
+    """
+    Test the "from" and "to" query parameters of the consecutive awards endpoint.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    load(application, TEST_DATA)
+
+    response = client.get("/awards/longest-fastest-consecutive-awards?from=1995&to=2006")
+    assert response.status_code == 200
+    assert response.json == {
+        "min": [
+            {"producer": "Producer X", "interval": 2, "previousWin": 2000, "followingWin": 2002},
+            {"producer": "Producer X", "interval": 2, "previousWin": 2000, "followingWin": 2002},
+        ],
+        "max": [{"producer": "Producer Z", "interval": 10, "previousWin": 1995, "followingWin": 2005}],
+    }
+
+    # Producer Y's 20 year interval appears only once the window covers both of its wins
+    response = client.get("/awards/longest-fastest-consecutive-awards?from=1990")
+    assert response.json["max"] == [{"producer": "Producer Y", "interval": 20, "previousWin": 1990, "followingWin": 2010}]
+
+    response = client.get("/awards/longest-fastest-consecutive-awards?from=2011&to=2000")
+    assert response.json == {"min": [], "max": []}
+
+
+def test_dimensions_share_one_scan_and_match_sql(application):
+    """
+    Test that every dimension's index agrees with the SQL query run over that column.
+
+    The studios answer is checked by swapping the studios and producers columns,
+    so the SQL query groups by the original studios.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    load(application, TEST_DATA)
+    with application.app_context():
+        indexes = build_interval_indexes(AwardsSnapshot.from_database())
+        producers = Awards.get_longest_fastest_consecutive_awards()
+
+    swapped = [(year, title, producers_, studios, winner) for year, title, studios, producers_, winner in TEST_DATA]
+    load(application, swapped)
+    with application.app_context():
+        studios = Awards.get_longest_fastest_consecutive_awards()
+
+    assert indexes["producers"].query() == producers
+    assert indexes["studios"].query() == studios
+
+
+def test_endpoint_studios_dimension(client, application):
+    """
+    Test the "dimension" query parameter of the consecutive awards endpoint.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    load(application, [
+        (2000, "Film A", "Paramount Pictures", "Producer X", True),
+        (2003, "Film B", "Paramount Pictures", "Producer Y", True),
+        (2001, "Film C", "Columbia Pictures", "Producer Z", True),
+        (2011, "Film D", "Columbia Pictures", "Producer W", True),
+    ])
+
+    response = client.get("/awards/longest-fastest-consecutive-awards?dimension=studios")
+    assert response.status_code == 200
+    assert response.json == {
+        "min": [{"producer": "Paramount Pictures", "interval": 3, "previousWin": 2000, "followingWin": 2003}],
+        "max": [{"producer": "Columbia Pictures", "interval": 10, "previousWin": 2001, "followingWin": 2011}],
+    }
+
+    # Producers never win twice in this dataset
+    response = client.get("/awards/longest-fastest-consecutive-awards?dimension=producers")
+    assert response.json == {"min": [], "max": []}
+
+    response = client.get("/awards/longest-fastest-consecutive-awards?dimension=directors")
+    assert response.status_code == 400
+
+
+def test_endpoint_rejects_invalid_window(client):
+    """
+    Test that non-integer window bounds are rejected.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+    """
+    response = client.get("/awards/longest-fastest-consecutive-awards?from=nineteen")
+    assert response.status_code == 400
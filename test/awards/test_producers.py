@@ -0,0 +1,95 @@
+"""
+Tests for the producer search and history endpoints.
+
+This module verifies the splitting of the producers column, the sorted
+producer index and the /awards/producers endpoints built on it.
+"""
+from src.core.producers import split_producers
+from src.model.awards import Awards
+from src.service.db import db
+
+
+def test_split_producers():
+    """
+    Test that producers listed together are split into individual names.
+    """
+    assert split_producers("Wyck Godfrey, Stephenie Meyer and Karen Rosenfelt") == ["Wyck Godfrey", "Stephenie Meyer", "Karen Rosenfelt"]
+    assert split_producers("Yoram Globus and Menahem Golan") == ["Yoram Globus", "Menahem Golan"]
+    assert split_producers("Tom DeSanto, and Don Murphy") == ["Tom DeSanto", "Don Murphy"]
+    assert split_producers("Allan Carr") == ["Allan Carr"]
+    assert split_producers("") == []
+    assert split_producers(None) == []
+
+
+def load(application):
+    """
+    Replace the awards table with a small dataset of shared producers.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    with application.app_context():
+        db.session.query(Awards).delete()
+        db.session.add_all([
+            Awards(1986, "Film A", "Cannon Films", "Yoram Globus and Menahem Golan", True),
+            Awards(1984, "Film B", "Cannon Films", "Menahem Golan", False),
+            Awards(1990, "Film C", "Studio C", "Menahem Golan, Jerry Weintraub", True),
+            Awards(1980, "Film D", "Studio D", "Jerry Weintraub", False),
+            Awards(1981, "Film E", "Studio E", "jerry bruckheimer", False),
+        ])
+        db.session.commit()
+
+
+def test_search_by_prefix_ignores_case(client, application):
+    """
+    Test the case-insensitive prefix search over individual producer names.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    load(application)
+
+    response = client.get("/awards/producers?q=JERRY")
+    assert response.status_code == 200
+    assert response.json == [
+        {"producer": "jerry bruckheimer", "nominations": 1, "wins": 0},
+        {"producer": "Jerry Weintraub", "nominations": 2, "wins": 1},
+    ]
+
+    response = client.get("/awards/producers?q=men")
+    assert response.json == [{"producer": "Menahem Golan", "nominations": 3, "wins": 2}]
+
+    response = client.get("/awards/producers?q=j&limit=1")
+    assert [item["producer"] for item in response.json] == ["jerry bruckheimer"]
+
+    response = client.get("/awards/producers?q=zz")
+    assert response.json == []
+
+    # An empty prefix lists every producer
+    response = client.get("/awards/producers")
+    assert len(response.json) == 4
+
+
+def test_producer_history(client, application):
+    """
+    Test that the history endpoint lists a producer's nominations ordered by year.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    load(application)
+
+    response = client.get("/awards/producers/menahem golan")
+    assert response.status_code == 200
+    assert [(item["year"], item["title"], item["winner"]) for item in response.json] == [
+        (1984, "Film B", False),
+        (1986, "Film A", True),
+        (1990, "Film C", True),
+    ]
+    assert response.json[0]["producers"] == "Menahem Golan"
+
+    response = client.get("/awards/producers/Nobody")
+    assert response.status_code == 404
+    assert response.json == []
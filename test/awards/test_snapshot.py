@@ -0,0 +1,76 @@
+"""
+Tests for the dictionary-encoded in-memory snapshot of the awards table.
+
+This module verifies the StringDictionary component and the columnar snapshot
+built from the database.
+"""
+from src.core.dictionary import StringDictionary
+from src.core.snapshot import AwardsSnapshot, current_snapshot
+from src.model.awards import Awards
+from src.service.db import db
+from src.service.version import data_version
+
+
+def test_string_dictionary_round_trip():
+    """
+    Test that encoding assigns dense first-seen codes and decoding restores the strings.
+    """
+    dictionary = StringDictionary()
+    values = ["Paramount Pictures", "Columbia Pictures", "Paramount Pictures", None, "Columbia Pictures"]
+
+    codes = dictionary.encode_many(values)
+
+    assert list(codes) == [0, 1, 0, 2, 1]
+    assert len(dictionary) == 3
+    assert dictionary.decode_many(codes) == values
+    assert dictionary.lookup("Columbia Pictures") == 1
+    assert dictionary.lookup("Universal Studios") is None
+    assert "Universal Studios" not in dictionary
+
+
+def test_string_dictionary_intern_shares_instances():
+    """
+    Test that equal strings come back as the same object after interning.
+    """
+    dictionary = StringDictionary()
+    first = dictionary.intern("".join(["Paramount", " Pictures"]))
+    second = dictionary.intern("".join(["Paramount ", "Pictures"]))
+
+    assert first == second
+    assert first is second
+
+
+def test_snapshot_encodes_dataset(application):
+    """
+    Test that the snapshot holds every row with producers and studios encoded once.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    with application.app_context():
+        records = Awards.get_records()
+        snapshot = AwardsSnapshot.from_records(records)
+
+        assert list(snapshot.records()) == records
+        assert len(snapshot.dictionaries["studios"]) == len({record.studios for record in records})
+        assert len(snapshot.dictionaries["producers"]) == len({record.producers for record in records})
+
+
+def test_current_snapshot_follows_writes(application):
+    """
+    Test that the current snapshot is reused until the data changes.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    with application.app_context():
+        snapshot = current_snapshot()
+        assert current_snapshot() is snapshot
+
+        version = data_version.value
+        db.session.add(Awards(2030, "Film Z", "Studio Z", "Producer Z", True))
+        db.session.commit()
+
+        assert data_version.value > version
+        assert current_snapshot() is not snapshot
+        assert len(current_snapshot()) == len(snapshot) + 1
@@ -0,0 +1,128 @@
+"""
+Tests for the rollup statistics endpoint.
+
+This module verifies the nomination and win counts per year, studio and
+producer, and that they follow inserts, deletes and updates.
+"""
+from src.core.rollups import Rollups, rollup_store
+from src.core.snapshot import current_snapshot
+from src.model.awards import Awards
+from src.service.db import db
+
+import pytest
+
+
+def load(application):
+    """
+    Replace the awards table with a small dataset.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    with application.app_context():
+        db.session.query(Awards).delete()
+        db.session.add_all([
+            Awards(1980, "Film A", "Paramount Pictures", "Producer X and Producer Y", True),
+            Awards(1980, "Film B", "Columbia Pictures, Paramount Pictures", "Producer X", False),
+            Awards(1981, "Film C", "Columbia Pictures", "Producer Z", True),
+            Awards(1982, "Film D", "Paramount Pictures", "Producer X", True),
+        ])
+        db.session.commit()
+
+
+def test_stats_by_group(client, application):
+    """
+    Test the counts of each group, sorted and limited.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    load(application)
+
+    response = client.get("/awards/stats")
+    assert response.status_code == 200
+    assert response.json == [
+        {"year": 1980, "nominations": 2, "wins": 1},
+        {"year": 1981, "nominations": 1, "wins": 1},
+        {"year": 1982, "nominations": 1, "wins": 1},
+    ]
+
+    response = client.get("/awards/stats?group_by=studios")
+    assert response.json == [
+        {"studio": "Paramount Pictures", "nominations": 3, "wins": 2},
+        {"studio": "Columbia Pictures", "nominations": 2, "wins": 1},
+    ]
+
+    response = client.get("/awards/stats?group_by=producers&order=wins&top=2")
+    assert response.json == [
+        {"producer": "Producer X", "nominations": 3, "wins": 2},
+        {"producer": "Producer Y", "nominations": 1, "wins": 1},
+    ]
+
+    response = client.get("/awards/stats?group_by=directors")
+    assert response.status_code == 400
+
+
+def test_stats_follow_writes(client, application, monkeypatch):
+    """
+    Test that inserts and deletes update the rollups without a rebuild and updates rebuild them.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+        monkeypatch: pytest fixture for patching attributes
+    """
+    load(application)
+    client.get("/awards/stats")
+    rollups = rollup_store.get()
+    before = rollups.copy().counts
+
+    with application.app_context(), monkeypatch.context() as patch:
+        # Deltas must be applied to the current counts, never rebuilt from the snapshot
+        patch.setattr(Rollups, "from_snapshot", classmethod(lambda cls, snapshot: pytest.fail("rollups rebuilt")))
+
+        db.session.add(Awards(1983, "Film E", "Studio E", "Producer W", True))
+        db.session.commit()
+        updated = rollup_store.get()
+        assert updated is not rollups  # Replaced by an updated copy
+        assert rollups.counts == before  # Readers holding the previous rollups never see the write
+
+        award = db.session.query(Awards).filter_by(title="Film A").one()
+        db.session.delete(award)
+        db.session.commit()
+        assert rollup_store.get() is not updated
+
+    with application.app_context():
+
+        award = db.session.query(Awards).filter_by(title="Film C").one()
+        award.winner = False
+        db.session.commit()
+
+        expected = Rollups.from_snapshot(current_snapshot()).counts
+        assert rollup_store.get().counts == expected
+
+    response = client.get("/awards/stats?group_by=producers")
+    assert {item["producer"]: (item["nominations"], item["wins"]) for item in response.json} == {
+        "Producer X": (2, 1),
+        "Producer Z": (1, 0),
+        "Producer W": (1, 1),
+    }
+
+
+def test_stats_discard_rolled_back_writes(application):
+    """
+    Test that rolled back inserts do not stay in the rollups.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    load(application)
+    with application.app_context():
+        before = {year: list(count) for year, count in rollup_store.get().counts["year"].items()}
+
+        db.session.add(Awards(1999, "Film Z", "Studio Z", "Producer Z", True))
+        db.session.flush()
+        db.session.rollback()
+
+        assert rollup_store.get().counts["year"] == before
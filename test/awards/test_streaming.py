@@ -0,0 +1,121 @@
+"""
+Tests for the database-free consecutive awards computation.
+
+This module verifies that the streaming computation over a dataset file gives
+the same answer, in the same order, as the SQL query over the same rows, for
+sorted and unsorted files, and that the intervals command prints the body of
+the consecutive awards endpoint.
+"""
+from src.core.streaming import IntervalTracker, UnsortedInput, stream_consecutive_awards
+from src.model.awards import Awards
+from src.service.db import db
+from src.service.readers import read_rows, write_csv
+
+from os import path
+import pytest
+import random
+import subprocess
+import sys
+
+ROOT = path.dirname(path.dirname(path.dirname(path.abspath(__file__))))
+DATASET = path.join(ROOT, "test", "Movielist.csv")
+
+# Ties, repeated wins in one year, a producer listed in several ways and a longest interval equal to the shortest one
+ROWS = [
+    (1990, "Film A", "Studio A", "Producer X", True),
+    (1990, "Film B", "Studio A", "Producer X", True),
+    (1991, "Film C", "Studio B", "Producer Y", True),
+    (1992, "Film D", "Studio B", "Producer X", True),
+    (1993, "Film E", "Studio C", "Producer Y", False),
+    (1994, "Film F", "Studio C", "Producer Y", True),
+    (1995, "Film G", "Studio D", "Producer Z and Producer X", True),
+    (2000, "Film H", "Studio D", "Producer Z", True),
+    (2002, "Film I", "Studio D", "Producer Z", True),
+    (2010, "Film J", "Studio E", "Producer W", True),
+    (2018, "Film K", "Studio E", "Producer W", True),
+    (2026, "Film L", "Studio E", "Producer W", True),
+]
+
+
+def query(application, dataset, monkeypatch):
+    """
+    Load a dataset file into the database and run the consecutive awards SQL query.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        dataset (str): Path of the dataset file
+        monkeypatch: pytest fixture for patching the environment
+
+    Returns:
+        dict: The answer of the SQL query
+    """
+    monkeypatch.setenv("INITIAL_DATASET_PATH", dataset)
+    with application.app_context():
+        db.session.query(Awards).delete()
+        db.session.commit()
+        Awards.load_dataset()
+        return Awards.get_longest_fastest_consecutive_awards()
+
+
+@pytest.mark.parametrize("rows", [ROWS, ROWS[:3] + ROWS[9:11]], ids=["ties", "max-equals-min"])
+def test_stream_matches_query(application, monkeypatch, tmp_path, rows):
+    """
+    Test that the streaming answer equals the SQL answer over the same rows.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        monkeypatch: pytest fixture for patching the environment
+        tmp_path: Pytest temporary directory fixture
+        rows (list): Rows of the dataset, sorted by year
+    """
+    dataset = str(tmp_path / "dataset.csv")
+    write_csv(rows, dataset)
+
+    result, count = stream_consecutive_awards(dataset)
+    assert count == len(rows)
+    assert result == query(application, dataset, monkeypatch)
+
+
+def test_unsorted_file_falls_back_to_sort(application, monkeypatch, tmp_path):
+    """
+    Test that a file with wins out of year order is answered through the sorted fallback.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        monkeypatch: pytest fixture for patching the environment
+        tmp_path: Pytest temporary directory fixture
+    """
+    rows = list(read_rows(DATASET)) + ROWS
+    random.Random(7).shuffle(rows)
+    dataset = str(tmp_path / "shuffled.csv")
+    write_csv(rows, dataset)
+
+    result, count = stream_consecutive_awards(dataset)
+    assert count > len(rows)  # The file was read a second time for the sort
+    assert result == query(application, dataset, monkeypatch)
+
+
+def test_tracker_rejects_wins_out_of_order():
+    """
+    Test that the tracker detects a win earlier than a previous win of the same producer.
+    """
+    tracker = IntervalTracker()
+    tracker.add(1, 2000, "Producer X")
+    tracker.add(2, 1999, "Producer Y")
+    with pytest.raises(UnsortedInput):
+        tracker.add(3, 1999, "Producer X")
+
+
+def test_intervals_command_prints_endpoint_body(client, application, monkeypatch):
+    """
+    Test that the intervals command prints the body of the consecutive awards endpoint.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+        monkeypatch: pytest fixture for patching the environment
+    """
+    query(application, DATASET, monkeypatch)
+    output = subprocess.run([sys.executable, "cli.py", "intervals", DATASET], cwd=ROOT, capture_output=True, check=True).stdout
+
+    assert output == client.get("/awards/longest-fastest-consecutive-awards").data
@@ -0,0 +1,96 @@
+"""
+Admission control tests for the Golden Raspberry Awards application.
+
+This module verifies the bounded concurrency and wait queue of the
+AdmissionController, and the 503 rejection of the awards endpoints.
+"""
+from src.service.admission import AdmissionController, Rejected, awards_admission
+from src.service.metrics import Metrics
+
+from threading import Thread
+import pytest
+import time
+
+
+def test_requests_wait_for_a_free_slot():
+    """
+    Test that a queued request is admitted as soon as a slot is released.
+    """
+    registry = Metrics()
+    controller = AdmissionController("test", max_concurrent=1, max_queue=1, queue_timeout=5, registry=registry)
+    controller.acquire()
+
+    waiter = Thread(target=controller.acquire)
+    waiter.start()
+    while controller.report()["waiting"] < 1:
+        time.sleep(0.001)
+    controller.release()
+    waiter.join(timeout=5)
+
+    assert controller.report()["active"] == 1
+    assert controller.report()["waiting"] == 0
+    assert registry.counter("test.admitted") == 2
+    assert registry.snapshot()["timings"]["test.queue_time"]["count"] == 2
+
+
+def test_full_queue_rejects_immediately():
+    """
+    Test that requests beyond the queue bound are rejected without waiting.
+    """
+    registry = Metrics()
+    controller = AdmissionController("test", max_concurrent=1, max_queue=0, queue_timeout=5, registry=registry)
+    controller.acquire()
+
+    started = time.perf_counter()
+    with pytest.raises(Rejected) as rejected:
+        controller.acquire()
+    assert rejected.value.reason == "queue_full"
+    assert time.perf_counter() - started < 1
+    assert registry.counter("test.rejected.queue_full") == 1
+
+
+def test_queue_deadline_rejects():
+    """
+    Test that a queued request is rejected once its deadline passes.
+    """
+    registry = Metrics()
+    controller = AdmissionController("test", max_concurrent=1, max_queue=1, queue_timeout=0.05, registry=registry)
+    controller.acquire()
+
+    with pytest.raises(Rejected) as rejected:
+        controller.acquire()
+    assert rejected.value.reason == "timeout"
+    assert controller.report()["waiting"] == 0
+    assert registry.counter("test.rejected.timeout") == 1
+
+
+def test_awards_endpoints_reject_with_retry_after(client, monkeypatch):
+    """
+    Test that the awards endpoints answer 503 with Retry-After when overloaded.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        monkeypatch: Pytest fixture used to shrink the admission limits
+    """
+    monkeypatch.setattr(awards_admission, "max_concurrent", 0)
+    monkeypatch.setattr(awards_admission, "max_queue", 0)
+
+    response = client.get("/awards/longest-fastest-consecutive-awards")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(awards_admission.retry_after)
+    assert response.json["reason"] == "queue_full"
+
+    # Operational endpoints are not subject to admission control
+    assert client.get("/health/live").status_code == 200
+
+
+def test_awards_endpoints_release_slots(client):
+    """
+    Test that served requests give their slot back.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+    """
+    for _ in range(awards_admission.max_concurrent + 1):
+        assert client.get("/awards/stats").status_code == 200
+    assert awards_admission.report()["active"] == 0
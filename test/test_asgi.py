@@ -0,0 +1,279 @@
+"""
+ASGI serving mode tests for the Golden Raspberry Awards application.
+
+This module drives the ASGI application in process and verifies that it
+answers with the Flask application's responses, admission control and admin
+checks included, that it loads the dataset in the background once started,
+and that it awaits the consecutive awards query on the async engine of a file
+database.
+"""
+from src.asgi import create_asgi_app
+from src.model.awards import Awards
+from src.service.admission import awards_admission
+from src.service.cache import response_cache
+from src.service.health import readiness
+from src.service.metrics import metrics
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import Engine
+from threading import Event
+import asyncio
+import gzip
+import pytest
+import time
+
+
+async def call(app, path, query=b"", headers=(), method="GET", body=b""):
+    """
+    Send one request to an ASGI application.
+
+    Args:
+        app (Starlette): The application
+        path (str): Request path
+        query (bytes): Query string
+        headers (iterable): Header name and value pairs, as bytes
+        method (str): Request method
+        body (bytes): Request body
+
+    Returns:
+        tuple: Status code, lowercase header dictionary and body
+    """
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode(), "root_path": "", "query_string": query, "headers": list(headers),
+        "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 8000),
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start, content = messages[0], b"".join(message.get("body", b"") for message in messages[1:])
+    return start["status"], {name.decode(): value.decode() for name, value in start["headers"]}, content
+
+
+def request(app, path, query=b"", headers=(), method="GET", body=b""):
+    """Send one request to an ASGI application from synchronous code, see call."""
+    return asyncio.run(call(app, path, query, headers, method, body))
+
+
+@pytest.fixture()
+def database_file(application, tmp_path):
+    """
+    Copy the loaded awards into a SQLite file, for the async engine.
+
+    The Flask application keeps its in-memory database; both hold the same rows,
+    so answers computed over either are the same.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        tmp_path: Pytest temporary directory fixture
+
+    Returns:
+        str: SQLAlchemy URL of the file
+    """
+    with application.app_context():
+        rows = [record._asdict() for record in Awards.get_records()]
+    url = f"sqlite:///{tmp_path / 'awards.db'}"
+    engine = create_engine(url)
+    Awards.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Awards.__table__), rows)
+    engine.dispose()
+    response_cache.clear()  # Answers cached by earlier tests would skip the query
+    return url
+
+
+def test_asgi_matches_flask(client, application):
+    """
+    Test that the ASGI application answers as the Flask application does.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    app = create_asgi_app(application)
+    requests = (
+        ("/awards/longest-fastest-consecutive-awards", b""),
+        ("/awards/longest-fastest-consecutive-awards", b"from=1990&to=2010"),
+        ("/awards/longest-fastest-consecutive-awards", b"dimension=studios"),
+        ("/awards/producers", b"q=al&limit=5"),
+        ("/awards/producers/Allan Carr", b""),
+        ("/awards/producers/Nobody", b""),
+        ("/awards/stats", b"group_by=producers&order=wins&top=5"),
+        ("/awards/stats", b"top=x"),
+        ("/awards/longest-fastest-consecutive-awards", b"dataset=missing"),
+        ("/awards/", b""),
+        ("/awards/export", b""),
+        ("/awards/unknown", b""),
+    )
+
+    for path, query in requests:
+        status, headers, body = request(app, path, query)
+        expected = client.get(path, query_string=query.decode())
+        assert (status, body) == (expected.status_code, expected.data), (path, query)
+        assert headers["content-type"] == expected.content_type
+
+
+def test_asgi_sends_compressed_bodies(application):
+    """
+    Test that cached answers are sent with the content coding accepted by the client.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    app = create_asgi_app(application)
+    plain = request(app, "/awards/")
+    compressed = request(app, "/awards/", headers=[(b"accept-encoding", b"gzip")])
+
+    assert compressed[1]["content-encoding"] == "gzip"
+    assert compressed[1]["vary"] == "Accept-Encoding"
+    assert gzip.decompress(compressed[2]) == plain[2]
+
+
+def test_asgi_applies_admission_and_admin_checks(application, monkeypatch):
+    """
+    Test that the awards admission control and the admin token checks apply to ASGI requests.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        monkeypatch: Pytest fixture used to shrink the admission limits and set the admin token
+    """
+    app = create_asgi_app(application)
+
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert request(app, "/admin/memory")[0] == 403
+    assert request(app, "/ingestions", method="POST", body=b"year;title;studios;producers;winner\n")[0] == 403
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    assert request(app, "/admin/memory", headers=[(b"x-admin-token", b"wrong")])[0] == 401
+    assert request(app, "/admin/memory", headers=[(b"x-admin-token", b"secret")])[0] == 200
+
+    monkeypatch.setattr(awards_admission, "max_concurrent", 0)
+    monkeypatch.setattr(awards_admission, "max_queue", 0)
+    status, headers, _ = request(app, "/awards/longest-fastest-consecutive-awards")
+    assert status == 503
+    assert headers["retry-after"] == str(awards_admission.retry_after)
+
+
+def test_lifespan_startup_loads_in_background(application, monkeypatch):
+    """
+    Test that the server may listen once the lifespan startup completes, reporting ready after the load and warm-up.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        monkeypatch: Pytest fixture used to hold the dataset load
+    """
+    loading, release = Event(), Event()
+    load = Awards.load_dataset
+
+    def held_load():
+        loading.set()
+        release.wait(timeout=10)
+        load()
+
+    monkeypatch.setattr(Awards, "load_dataset", held_load)
+    app = create_asgi_app(application)
+
+    async def run():
+        events = asyncio.Queue()
+        events.put_nowait({"type": "lifespan.startup"})
+        sent = []
+
+        async def send(message):
+            sent.append(message["type"])
+
+        lifespan = asyncio.ensure_future(app({"type": "lifespan", "asgi": {"version": "3.0"}}, events.get, send))
+        while "lifespan.startup.complete" not in sent:
+            await asyncio.sleep(0.01)
+        assert await asyncio.to_thread(loading.wait, 10)
+        during = (await call(app, "/health/live"))[0], (await call(app, "/health/ready"))[0]
+
+        release.set()
+        deadline = time.monotonic() + 10
+        while not readiness.ready and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        after = (await call(app, "/health/ready"))[0]
+
+        events.put_nowait({"type": "lifespan.shutdown"})
+        await lifespan
+        return during, after, sent
+
+    during, after, sent = asyncio.run(run())
+    assert during == (200, 503)
+    assert after == 200
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert "warmup" in readiness.details
+
+
+def test_asgi_awaits_the_query_on_the_async_engine(client, database_file):
+    """
+    Test that a consecutive awards request missing the cache runs its query on the async engine only.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        database_file: SQLite file fixture holding the same awards
+    """
+    expected = client.get("/awards/longest-fastest-consecutive-awards")
+    response_cache.clear()
+    app = create_asgi_app(client.application, database_url=database_file)
+    databases = []
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        databases.append(connection.engine.url.database)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        status, _, body = request(app, "/awards/longest-fastest-consecutive-awards")
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+    assert (status, body) == (200, expected.data)
+    assert databases and set(databases) == {database_file.removeprefix("sqlite:///")}
+
+    _, headers, compressed = request(app, "/awards/longest-fastest-consecutive-awards", headers=[(b"accept-encoding", b"gzip")])
+    assert headers["content-type"] == expected.content_type
+    assert headers["vary"] == "Accept-Encoding"
+    if "content-encoding" in headers:  # Small bodies are only stored uncompressed
+        assert gzip.decompress(compressed) == body
+
+
+def test_slow_query_holds_no_thread(application, database_file, monkeypatch):
+    """
+    Test that requests awaiting a slow query leave the only worker thread free, and share one query.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        database_file: SQLite file fixture holding the same awards
+        monkeypatch: Pytest fixture used to slow the async query down
+    """
+    query = Awards.get_longest_fastest_consecutive_awards_async
+
+    async def slow_query(session):
+        await asyncio.sleep(0.5)
+        return await query(session)
+
+    monkeypatch.setattr(Awards, "get_longest_fastest_consecutive_awards_async", slow_query)
+    app = create_asgi_app(application, threads=1, database_url=database_file)
+    executed, coalesced = metrics.counter("awards.longest_fastest.executed"), metrics.counter("awards.longest_fastest.coalesced")
+
+    async def run():
+        finished = []
+
+        async def get(name, path):
+            status = (await call(app, path))[0]
+            finished.append((name, status))
+
+        awards = [asyncio.ensure_future(get("awards", "/awards/longest-fastest-consecutive-awards")) for _ in range(4)]
+        await asyncio.sleep(0.1)
+        await get("live", "/health/live")
+        await asyncio.gather(*awards)
+        return finished
+
+    finished = asyncio.run(run())
+    assert finished == [("live", 200)] + [("awards", 200)] * 4
+    assert metrics.counter("awards.longest_fastest.executed") - executed == 1
+    assert metrics.counter("awards.longest_fastest.coalesced") - coalesced == 3
@@ -0,0 +1,123 @@
+"""
+Health endpoint tests for the Golden Raspberry Awards application.
+
+This module verifies the liveness and readiness endpoints, the startup loading
+the dataset in the background and the warm-up phase that precomputes the
+common award answers.
+"""
+from src.core.awards import AwardsCore
+from src.core.startup import start_in_background
+from src.model.awards import Awards
+from src.service.cache import response_cache
+from src.service.health import readiness
+from src.service.version import data_version
+
+from threading import Event
+
+
+def test_liveness(client):
+    """
+    Test that the liveness endpoint always answers 200.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+    """
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json["status"] == "alive"
+
+
+def test_readiness_follows_warm_up(client, application):
+    """
+    Test that the instance reports ready only after the warm-up phase.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    readiness.mark_not_ready(reason="loading")
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json == {"status": "not ready", "reason": "loading"}
+
+    with application.app_context():
+        readiness.mark_ready(warmup=AwardsCore().warm_up())
+
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert {"snapshot", "longest-fastest-consecutive-awards"} <= set(response.json["warmup"])
+
+
+def test_warm_up_pre_encodes_answer(client, application):
+    """
+    Test that warm-up leaves the encoded consecutive awards answer in the cache.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+    """
+    with application.app_context():
+        AwardsCore().warm_up()
+
+    cached = response_cache.get("longest-fastest-consecutive-awards", data_version.value)
+    assert cached is not None
+
+    response = client.get("/awards/longest-fastest-consecutive-awards")
+    assert response.status_code == 200
+    assert response.get_data() == cached.body
+
+
+def test_startup_in_background(client, application, monkeypatch):
+    """
+    Test that the health endpoints answer while the dataset loads, ready only once the warm-up ends.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+        monkeypatch: Pytest fixture used to hold the dataset load
+    """
+    loading, release = Event(), Event()
+    load = Awards.load_dataset
+
+    def held_load():
+        loading.set()
+        release.wait(timeout=10)
+        load()
+
+    monkeypatch.setattr(Awards, "load_dataset", held_load)
+    startup = start_in_background(application)
+    try:
+        assert loading.wait(timeout=10)
+        assert client.get("/health/live").status_code == 200
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json == {"status": "not ready", "reason": "loading"}
+    finally:
+        release.set()
+        startup.join(timeout=10)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert "snapshot" in response.json["warmup"]
+
+
+def test_failed_startup_stays_not_ready(client, application, monkeypatch):
+    """
+    Test that a startup failure is reported by the readiness endpoint.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+        monkeypatch: Pytest fixture used to make the dataset load fail
+    """
+    def failing_load():
+        raise ValueError("INITIAL_DATASET_PATH environment variable is not set")
+
+    monkeypatch.setattr(Awards, "load_dataset", failing_load)
+    start_in_background(application).join(timeout=10)
+
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json["reason"] == "startup failed"
+    assert "INITIAL_DATASET_PATH" in response.json["error"]
+
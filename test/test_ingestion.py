@@ -0,0 +1,277 @@
+"""
+Tests for the dataset ingestion endpoints.
+
+This module verifies that an uploaded dataset replaces the award data through a
+background job, that the job reports its progress and warms up the answers of
+the new data, that a failed job leaves the previous data in place, that the
+worker survives a job raising and that the endpoints require the admin token.
+"""
+from src.core.awards import AwardsCore
+from src.core.ingestion import IngestionManager, UploadTooLarge, ingestion_manager
+from src.model.awards import Awards
+from src.service.db import db
+from src.service.health import readiness
+from src.service.metrics import Metrics
+from src.service.readers import write_csv
+import src.core.ingestion
+
+from sqlalchemy import event
+import io
+import pytest
+import time
+
+TOKEN = "secret"
+
+ROWS = [
+    (2000, "Film A", "Studio A", "Producer X", True),
+    (2001, "Film B", "Studio B", "Producer Y", False),
+    (2003, "Film C", "Studio A", "Producer X", True),
+]
+
+
+@pytest.fixture()
+def admin(monkeypatch):
+    """
+    Enable the admin endpoints.
+
+    Returns:
+        dict: Headers carrying the admin token
+    """
+    monkeypatch.setenv("ADMIN_TOKEN", TOKEN)
+    return {"X-Admin-Token": TOKEN}
+
+
+def upload(client, headers, body, **args):
+    """
+    Upload a dataset and wait for its job to finish.
+
+    Returns:
+        dict: The final report of the job
+    """
+    response = client.post("/ingestions", data=body, headers=headers, query_string=args)
+    assert response.status_code == 202
+    assert response.headers["Location"].endswith(response.json["id"])
+    assert ingestion_manager.wait(timeout=30)
+
+    report = client.get(f"/ingestions/{response.json['id']}", headers=headers)
+    assert report.status_code == 200
+    return report.json
+
+
+def dataset(tmp_path, rows=ROWS):
+    """Return the bytes of a CSV dataset."""
+    path = tmp_path / "upload.csv"
+    write_csv(rows, str(path))
+    return path.read_bytes()
+
+
+def test_upload_replaces_data(client, admin, tmp_path):
+    """
+    Test that a completed job replaces the award data and the cached answers.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        admin: Admin headers fixture
+        tmp_path: Pytest temporary directory fixture
+    """
+    before = client.get("/awards/longest-fastest-consecutive-awards").json
+
+    report = upload(client, admin, dataset(tmp_path))
+    assert report["status"] == "completed"
+    assert report["rows"] == len(ROWS)
+    assert report["errors"] == []
+    assert report["rows_per_second"] > 0
+
+    assert [award["title"] for award in client.get("/awards/").json] == ["Film A", "Film B", "Film C"]
+    after = client.get("/awards/longest-fastest-consecutive-awards").json
+    assert after != before
+    assert after["min"] == [{"producer": "Producer X", "interval": 3, "previousWin": 2000, "followingWin": 2003}]
+    assert report in client.get("/ingestions", headers=admin).json
+
+
+def test_failed_upload_keeps_data(client, admin, tmp_path):
+    """
+    Test that an upload with an invalid row fails with its row index and leaves the previous data in place.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        admin: Admin headers fixture
+        tmp_path: Pytest temporary directory fixture
+    """
+    before = client.get("/awards/").json
+    body = dataset(tmp_path) + b"someday;Film D;Studio C;Producer Z;yes\n"
+
+    report = upload(client, admin, body)
+    assert report["status"] == "failed"
+    assert report["errors"][0].startswith("Row 4:")
+    assert client.get("/awards/").json == before
+
+    assert upload(client, admin, b"year;title;studios;producers;winner\n")["status"] == "failed"
+    assert client.get("/awards/").json == before
+
+
+def test_reads_during_slow_ingestion_see_previous_data(client, admin, tmp_path, monkeypatch):
+    """
+    Test that requests served while a slow job runs on the shared in-memory connection see the previous data.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        admin: Admin headers fixture
+        tmp_path: Pytest temporary directory fixture
+        monkeypatch: pytest fixture for slowing the ingestion down
+    """
+    def slow_insert(conn, cursor, statement, parameters, context, executemany):
+        if "awards_staging" in statement:
+            time.sleep(0.01)  # Keep each batch transaction open, its rows written but not committed, while requests arrive
+
+    monkeypatch.setattr(src.core.ingestion, "LOAD_BATCH_SIZE", 2)  # One transaction every other row
+    rows = [(2000 + i, f"New film {i}", "Studio N", f"Producer {i % 3}", i % 2 == 0) for i in range(40)]
+    before = client.get("/awards/").json
+    count = client.get("/admin/memory", headers=admin).json["rows"]  # The memory report counts the rows with SQL on every call
+
+    with client.application.app_context():
+        engine = db.engine
+    event.listen(engine, "after_cursor_execute", slow_insert)
+    try:
+        response = client.post("/ingestions", data=dataset(tmp_path, rows), headers=admin)
+        job = ingestion_manager.get(response.json["id"])
+        reads = 0
+        while job.finished_at is None:
+            listing = client.get("/awards/")
+            report = client.get("/admin/memory", headers=admin)
+            assert listing.status_code == report.status_code == 200
+            if job.status in ("queued", "parsing"):  # Still before the swap once both were served
+                assert listing.json == before
+                assert report.json["rows"] == count
+                reads += 1
+        assert ingestion_manager.wait(timeout=30)
+    finally:
+        event.remove(engine, "after_cursor_execute", slow_insert)
+
+    assert reads > 0
+    assert job.status == "completed" and job.rows == len(rows)
+    assert [award["title"] for award in client.get("/awards/").json] == [row[1] for row in rows]  # No batch was lost
+
+
+def test_completed_upload_warms_up_answers(client, admin, tmp_path, monkeypatch):
+    """
+    Test that the answers of the new data are built by the worker, so the next requests run no SQL.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        admin: Admin headers fixture
+        tmp_path: Pytest temporary directory fixture
+        monkeypatch: pytest fixture for observing the readiness during the warm-up
+    """
+    states = []
+    warm_up = AwardsCore.warm_up
+
+    def observed_warm_up(self):
+        states.append(readiness.ready)  # Not ready while the answers are rebuilt
+        return warm_up(self)
+
+    monkeypatch.setattr(AwardsCore, "warm_up", observed_warm_up)
+    assert upload(client, admin, dataset(tmp_path))["status"] == "completed"
+    assert states == [False] and readiness.ready
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with client.application.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        answer = client.get("/awards/longest-fastest-consecutive-awards").json
+        windowed = client.get("/awards/longest-fastest-consecutive-awards?from=2000&to=2003").json
+        stats = client.get("/awards/stats?group_by=studios").status_code
+        producers = client.get("/awards/producers?q=producer").json
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert statements == []
+    assert answer["min"] == windowed["min"] == [{"producer": "Producer X", "interval": 3, "previousWin": 2000, "followingWin": 2003}]
+    assert stats == 200 and len(producers) == 2
+
+
+def test_worker_survives_a_job_raising(application, tmp_path, monkeypatch):
+    """
+    Test that an exception escaping a job fails that job only and the worker runs the next one.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        tmp_path: Pytest temporary directory fixture
+        monkeypatch: pytest fixture for making the first job raise
+    """
+    manager = IngestionManager(spool_dir=str(tmp_path), registry=Metrics())
+    manager.init_app(application)
+    ingest, calls = manager._ingest, []
+
+    def failing_cleanup(job):
+        calls.append(job)
+        if len(calls) == 1:
+            raise RuntimeError("Could not drop the staging table")
+        ingest(job)
+
+    monkeypatch.setattr(manager, "_ingest", failing_cleanup)
+    first = manager.submit(io.BytesIO(dataset(tmp_path)))
+    second = manager.submit(io.BytesIO(dataset(tmp_path)))
+    assert manager.wait(timeout=30)
+
+    assert first.status == "failed" and first.errors == ["Could not drop the staging table"]
+    assert first.finished_at is not None
+    assert second.status == "completed" and second.rows == len(ROWS)
+    assert manager.metrics.counter("ingestion.failed") == 1
+
+
+def test_upload_delimiter(client, admin, tmp_path):
+    """
+    Test that the delimiter query parameter selects the CSV delimiter of the upload.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        admin: Admin headers fixture
+        tmp_path: Pytest temporary directory fixture
+    """
+    path = tmp_path / "upload.csv"
+    write_csv(ROWS, str(path), delimiter=",")
+
+    assert upload(client, admin, path.read_bytes(), delimiter=",")["status"] == "completed"
+    assert len(client.get("/awards/").json) == len(ROWS)
+
+
+def test_ingestion_requires_admin_token(client, monkeypatch):
+    """
+    Test that the ingestion endpoints are disabled without ADMIN_TOKEN and reject a wrong token.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        monkeypatch: pytest fixture for patching the environment
+    """
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert client.post("/ingestions", data=b"").status_code == 403
+
+    monkeypatch.setenv("ADMIN_TOKEN", TOKEN)
+    assert client.post("/ingestions", data=b"", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert client.get("/ingestions/unknown", headers={"X-Admin-Token": TOKEN}).status_code == 404
+
+
+def test_upload_size_limit(application, tmp_path):
+    """
+    Test that an upload larger than the limit is rejected before it is queued.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        tmp_path: Pytest temporary directory fixture
+    """
+    manager = IngestionManager(spool_dir=str(tmp_path), max_bytes=10, registry=Metrics())
+    manager.init_app(application)
+
+    with pytest.raises(UploadTooLarge, match="larger than 10 bytes"):
+        manager.submit(io.BytesIO(b"x" * 100))
+    assert manager.jobs() == []
+    assert list(tmp_path.iterdir()) == []  # The partial spool was removed
+
+    with application.app_context():
+        assert db.session.query(Awards).count() > 0
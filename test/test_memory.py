@@ -0,0 +1,68 @@
+"""
+Memory report tests for the Golden Raspberry Awards application.
+
+This module verifies the deep size estimate, the /admin/memory endpoint and
+the memory-report command of cli.py.
+"""
+from src.core.memory import deep_sizeof
+from src.core.awards import AwardsCore
+
+from os import path
+import json
+import subprocess
+import sys
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    """
+    Test that objects reachable from several roots are counted once per seen set.
+    """
+    shared = ["x" * 1000]
+    first = {"values": shared}
+    second = {"values": shared}
+
+    seen = set()
+    assert deep_sizeof(first, seen) > 1000
+    assert deep_sizeof(second, seen) < 1000
+    assert deep_sizeof(second) > 1000
+
+
+def test_memory_endpoint(client, application, monkeypatch):
+    """
+    Test that the memory endpoint requires the admin token and reports the database and the structures built by warm-up.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        application: Flask application fixture from conftest.py
+        monkeypatch: pytest fixture for patching the environment
+    """
+    with application.app_context():
+        AwardsCore().warm_up()
+
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert client.get("/admin/memory").status_code == 403
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    assert client.get("/admin/memory", headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+    response = client.get("/admin/memory", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    report = response.json
+    assert report["rows"] > 0
+    assert report["database"]["bytes"] == report["database"]["page_size"] * report["database"]["page_count"]
+    assert {"snapshot", "interval-indexes", "producer-index", "rollups", "response-cache"} <= set(report["structures"])
+    assert all(size > 0 for size in report["structures"].values())
+    assert report["bytes_per_row"] == report["bytes"] / report["rows"]
+
+
+def test_memory_report_cli():
+    """
+    Test that the memory-report command prints the report of the given dataset as JSON.
+    """
+    root = path.dirname(path.dirname(path.abspath(__file__)))
+    dataset = path.join(root, "test", "Movielist.csv")
+    output = subprocess.run([sys.executable, "cli.py", "memory-report", "--dataset", dataset], cwd=root, capture_output=True, text=True, check=True).stdout
+
+    report = json.loads(output)
+    with open(dataset, encoding="utf-8") as file:
+        assert report["rows"] == sum(1 for _ in file) - 1  # Every line but the header
+    assert report["tracemalloc"]["peak"] >= report["tracemalloc"]["current"] > 0
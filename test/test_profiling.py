@@ -0,0 +1,180 @@
+"""
+Profiling tests for the Golden Raspberry Awards application.
+
+This module verifies the admin gating of the profiling endpoints, cProfile
+over the next requests, the sampling profiler and the slow query log.
+"""
+from src.service.profiling import request_profiler, sample_stacks, slow_query_log
+from src.service.serving import shared_connection_lock
+
+from threading import Event, Semaphore, Thread
+import marshal
+import pytest
+
+TOKEN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture()
+def admin(monkeypatch):
+    """
+    Fixture enabling the admin endpoints and resetting the profiling tools afterwards.
+
+    Args:
+        monkeypatch: Pytest fixture used to set ADMIN_TOKEN
+    """
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    yield
+    request_profiler.disarm()
+    slow_query_log.disable()
+    slow_query_log.entries.clear()
+
+
+def test_profiling_requires_admin_token(client, monkeypatch):
+    """
+    Test that profiling is disabled without ADMIN_TOKEN and requires the matching header.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        monkeypatch: Pytest fixture used to set ADMIN_TOKEN
+    """
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert client.post("/admin/profiling/requests").status_code == 403
+
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    assert client.post("/admin/profiling/requests").status_code == 401
+    assert client.post("/admin/profiling/requests", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    assert request_profiler.remaining == 0
+
+
+def test_profile_next_requests(client, admin):
+    """
+    Test that the next requests are profiled and reported as text or pstats data.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        admin: Fixture enabling the admin endpoints
+    """
+    assert client.get("/admin/profiling/requests", headers=TOKEN).status_code == 404
+
+    response = client.post("/admin/profiling/requests?count=2&path=/awards", headers=TOKEN)
+    assert response.status_code == 202
+
+    client.get("/health/live")  # Not under the profiled path
+    for _ in range(3):
+        client.get("/awards/longest-fastest-consecutive-awards")
+    assert request_profiler.profiled == 2
+    assert request_profiler.remaining == 0
+
+    response = client.get("/admin/profiling/requests", headers=TOKEN)
+    assert response.status_code == 200
+    assert "_longest_fastest_consecutive_awards" in response.get_data(as_text=True)
+
+    response = client.get("/admin/profiling/requests?output=pstats", headers=TOKEN)
+    stats = marshal.loads(response.get_data())
+    assert any(function[2] == "_longest_fastest_consecutive_awards" for function in stats)
+
+
+def test_concurrent_requests_profiled_one_at_a_time(application, admin, monkeypatch):
+    """
+    Test that a request arriving while another is profiled is served without profiling.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        admin: Fixture enabling the admin endpoints
+        monkeypatch: Pytest fixture used to hold the first request inside the endpoint
+    """
+    # The liveness endpoint does not use the database, so both requests may hold the shared connection
+    monkeypatch.setattr(shared_connection_lock, "_lock", Semaphore(2))
+    entered, release = Event(), Event()
+
+    class HeldReadiness:
+        """Readiness whose first read of started_at waits for the test."""
+        calls = 0
+
+        @property
+        def started_at(self):
+            HeldReadiness.calls += 1
+            if HeldReadiness.calls == 1:
+                entered.set()
+                release.wait(10)
+            return 0.0
+
+    monkeypatch.setattr("src.resource.health.readiness", HeldReadiness())
+    request_profiler.arm(2, path_prefix="/health/live")
+
+    responses = []
+    first = Thread(target=lambda: responses.append(application.test_client().get("/health/live")))
+    first.start()
+    assert entered.wait(10)
+    try:
+        second = application.test_client().get("/health/live")
+        assert second.status_code == 200
+        assert request_profiler.remaining == 1  # The second request did not use up a profile
+    finally:
+        release.set()
+        first.join(10)
+
+    assert responses[0].status_code == 200
+    assert request_profiler.profiled == 1
+
+
+def test_sample_stacks_collapses_busy_thread():
+    """
+    Test that the sampling profiler reports the stack of a busy thread.
+    """
+    stop = Event()
+
+    def busy_loop():
+        while not stop.is_set():
+            sum(range(1000))
+
+    thread = Thread(target=busy_loop)
+    thread.start()
+    try:
+        collapsed = sample_stacks(0.1, 0.001)
+    finally:
+        stop.set()
+        thread.join()
+
+    lines = collapsed.splitlines()
+    assert any("busy_loop" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_sample_endpoint_validates_window(client, admin):
+    """
+    Test the bounds of the sampling window.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        admin: Fixture enabling the admin endpoints
+    """
+    assert client.post("/admin/profiling/sample?seconds=600", headers=TOKEN).status_code == 400
+    response = client.post("/admin/profiling/sample?seconds=0.05&interval_ms=1", headers=TOKEN)
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+
+
+def test_slow_query_log(client, admin):
+    """
+    Test that queries over the threshold are logged with their plan, and nothing after disabling.
+
+    Args:
+        client: Flask test client fixture from conftest.py
+        admin: Fixture enabling the admin endpoints
+    """
+    response = client.post("/admin/profiling/slow-queries?threshold_ms=0", headers=TOKEN)
+    assert response.json == {"enabled": True, "threshold_ms": 0}
+
+    client.get("/awards/")
+
+    response = client.get("/admin/profiling/slow-queries", headers=TOKEN)
+    queries = response.json["queries"]
+    assert any("FROM awards" in query["statement"] for query in queries)
+    assert all(query["plan"] and not query["plan"].startswith("Explain failed") for query in queries)
+
+    client.delete("/admin/profiling/slow-queries", headers=TOKEN)
+    logged = len(slow_query_log.entries)
+    client.get("/awards/")
+    assert len(slow_query_log.entries) == logged
+    assert client.get("/admin/profiling/slow-queries", headers=TOKEN).json["enabled"] is False
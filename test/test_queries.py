@@ -0,0 +1,77 @@
+"""
+Tests for the query registry.
+
+This module verifies that registered statements are built once, that repeated
+executions hit SQLAlchemy's compiled cache, that compile and execute timings
+are recorded, and that the consecutive awards answer takes one round trip.
+"""
+from src.model.awards import Awards, award_queries
+from src.service.db import db
+from src.service.metrics import Metrics
+from src.service.queries import QueryRegistry
+
+from sqlalchemy import bindparam, event, select
+
+
+def test_statement_built_once(application):
+    """
+    Test that a registered statement is built on first use and then reused.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    calls = []
+    registry = QueryRegistry(Metrics())
+    registry.register("records", lambda: calls.append(1) or Awards.records_statement())
+
+    assert registry.statement("records") is registry.statement("records")
+    assert calls == [1]
+    assert Awards.select_records() is award_queries.statement("records")
+
+
+def test_execute_records_timings_and_cache_hits(application):
+    """
+    Test that executions record compile and execute timings and hit the compiled cache after the first.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    registry = QueryRegistry(Metrics())
+    registry.register("by-year", lambda: select(Awards.title).where(Awards.year == bindparam("year")).order_by(Awards.id))
+
+    with application.app_context():
+        titles = [registry.execute(db.session, "by-year", {"year": year}) for year in (1980, 1980, 1981)]
+        expected = db.session.execute(select(Awards.title).where(Awards.year == 1981).order_by(Awards.id)).all()
+
+    assert titles[0] == titles[1] and titles[2] == expected
+    snapshot = registry.metrics.snapshot()
+    assert snapshot["timings"]["query.by-year.compile"]["count"] == 3
+    assert snapshot["timings"]["query.by-year.execute"]["count"] == 3
+    assert snapshot["counters"].get("query.by-year.cache_hit", 0) >= 2
+
+
+def test_consecutive_awards_single_round_trip(application):
+    """
+    Test that the shortest and longest intervals are read with one statement.
+
+    Args:
+        application: Flask application fixture from conftest.py
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with application.app_context():
+        db.session.query(Awards).delete()
+        db.session.commit()
+        Awards.load_dataset()
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            result = Awards.get_longest_fastest_consecutive_awards()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1 and "UNION ALL" in statements[0]
+    assert result == {"min": [{"producer": "Bo Derek", "interval": 6, "previousWin": 1984, "followingWin": 1990}], "max": []}
@@ -0,0 +1,111 @@
+"""
+Dataset reader tests for the Golden Raspberry Awards application.
+
+This module verifies format detection, the compressed CSV readers, the binary
+columnar format, and loading every format through load_dataset and the
+named dataset snapshots.
+"""
+from src.core.snapshot import AwardsSnapshot
+from src.model.awards import Awards
+from src.service.db import db
+from src.service.readers import detect_format, read_columnar, read_rows, write_columnar, write_csv
+
+from os import path
+import pytest
+
+DATASET = path.join(path.dirname(path.abspath(__file__)), "Movielist.csv")
+
+
+@pytest.fixture(params=["csv", "gzip", "bz2", "xz", "columnar"])
+def dataset_file(request, tmp_path):
+    """
+    Fixture providing the test dataset converted to each supported format.
+
+    Args:
+        request: Pytest request, whose param is the format
+        tmp_path: Pytest temporary directory fixture
+
+    Returns:
+        tuple: The format and the path of the converted file
+    """
+    destination = str(tmp_path / f"dataset.{request.param}")
+    if request.param == "columnar":
+        write_columnar(read_rows(DATASET), destination)
+    else:
+        write_csv(read_rows(DATASET), destination, compression=None if request.param == "csv" else request.param)
+    return request.param, destination
+
+
+def test_formats_round_trip(dataset_file):
+    """
+    Test that every format is detected and reads back the rows of the original CSV.
+
+    Args:
+        dataset_file: Fixture with the format and path of a converted dataset
+    """
+    file_format, destination = dataset_file
+    assert detect_format(destination) == file_format
+    assert list(read_rows(destination)) == list(read_rows(DATASET))
+
+
+def test_columnar_encodes_repeated_strings(tmp_path):
+    """
+    Test that the columnar file stores each distinct studio and producer once.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture
+    """
+    rows = [
+        (1980, "Film A", "Paramount Pictures", "Producer X", True),
+        (1981, "Film B", "Paramount Pictures", None, False),
+        (1982, "Fílm C", "Columbia Pictures", "Producer X", False),
+    ]
+    destination = str(tmp_path / "dataset.grac")
+    assert write_columnar(rows, destination) == 3
+
+    columns = read_columnar(destination)
+    assert list(columns["years"]) == [1980, 1981, 1982]
+    assert columns["winners"] == b"\x01\x00\x00"
+    assert columns["titles"] == ["Film A", "Film B", "Fílm C"]
+    assert (list(columns["studios"][0]), columns["studios"][1]) == ([0, 0, 1], ["Paramount Pictures", "Columbia Pictures"])
+    assert columns["producers"][1] == ["Producer X", ""]  # None is written as an empty string
+
+
+def test_columnar_rejects_other_files():
+    """
+    Test that reading a non-columnar file as columnar fails clearly.
+    """
+    with pytest.raises(ValueError):
+        read_columnar(DATASET)
+
+
+def test_snapshot_from_file(dataset_file):
+    """
+    Test that snapshots built from any format hold the same rows.
+
+    Args:
+        dataset_file: Fixture with the format and path of a converted dataset
+    """
+    _, destination = dataset_file
+    expected = list(AwardsSnapshot.from_records(Awards.read_dataset(DATASET)).records())
+    assert list(AwardsSnapshot.from_file(destination).records()) == expected
+
+
+def test_load_dataset_from_any_format(application, dataset_file, monkeypatch):
+    """
+    Test that load_dataset detects the format of INITIAL_DATASET_PATH.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        dataset_file: Fixture with the format and path of a converted dataset
+        monkeypatch: Pytest fixture used to point INITIAL_DATASET_PATH at the converted file
+    """
+    _, destination = dataset_file
+    monkeypatch.setenv("INITIAL_DATASET_PATH", destination)
+    with application.app_context():
+        db.session.query(Awards).delete()
+        db.session.commit()
+        Awards.load_dataset()
+
+        loaded = [record[1:] for record in Awards.get_records()]
+        assert loaded == list(read_rows(DATASET))
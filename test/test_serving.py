@@ -0,0 +1,252 @@
+"""
+Threaded serving tests for the Golden Raspberry Awards application.
+
+This module verifies the database settings used when serving from several
+threads, the thread pool server and its rejection of overload with 503, and
+that concurrent readers share a single rebuild of the in-memory snapshot.
+"""
+from src.core import snapshot as snapshot_module
+from src.core.awards import AwardsCore
+from src.core.snapshot import AwardsSnapshot, current_snapshot
+from src.service.admission import awards_admission
+from src.service.metrics import metrics
+from src.service.serving import ThreadPoolWSGIServer, configure_engine, database_settings, is_memory_database, shared_connection_lock
+from src.service.version import data_version
+
+from sqlalchemy import create_engine, text
+from threading import Barrier, Event, Semaphore, Thread
+from urllib.error import HTTPError
+from urllib.request import urlopen
+import time
+
+
+def test_single_thread_keeps_database_url():
+    """
+    Test that single-threaded serving uses the configured database as is.
+    """
+    assert database_settings("sqlite:///:memory:", 1) == ("sqlite:///:memory:", {})
+
+
+def test_threads_move_memory_database_to_file(tmp_path):
+    """
+    Test that threaded serving replaces an in-memory database by a file with a connection per thread.
+    """
+    url, options = database_settings("sqlite:///:memory:", 4)
+    assert not is_memory_database(url)
+    assert url.endswith("/awards.db")
+    assert options["pool_size"] == 4
+    assert options["connect_args"]["check_same_thread"] is False
+
+    file_url = f"sqlite:///{tmp_path / 'awards.db'}"
+    assert database_settings(file_url, 4)[0] == file_url
+
+
+def test_threads_read_concurrently(tmp_path):
+    """
+    Test that every thread reads through its own connection while a writer holds a transaction.
+    """
+    url, options = database_settings(f"sqlite:///{tmp_path / 'awards.db'}", 4)
+    engine = create_engine(url, **options)
+    configure_engine(engine)
+
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE awards (id INTEGER PRIMARY KEY, year INTEGER)"))
+        connection.execute(text("INSERT INTO awards (year) VALUES (1980), (1981)"))
+
+    writer = engine.connect()
+    writer.execute(text("INSERT INTO awards (year) VALUES (1982)"))  # Uncommitted, holds the write lock
+
+    counts = []
+    barrier = Barrier(4)
+
+    def read():
+        with engine.connect() as connection:
+            barrier.wait()  # Four connections open at the same time
+            counts.append(connection.execute(text("SELECT count(*) FROM awards")).scalar())
+
+    readers = [Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join(timeout=5)
+
+    writer.rollback()
+    writer.close()
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    engine.dispose()
+
+    assert counts == [2, 2, 2, 2]  # Readers see the committed rows without waiting for the writer
+
+
+def test_thread_pool_server_handles_requests_concurrently():
+    """
+    Test that the server handles as many slow requests at a time as it has threads.
+    """
+    def slow_app(environ, start_response):
+        time.sleep(0.2)
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    server = ThreadPoolWSGIServer("127.0.0.1", 0, slow_app, threads=4)
+    serving = Thread(target=server.serve_forever)
+    serving.start()
+    try:
+        bodies = []
+
+        def fetch():
+            with urlopen(f"http://127.0.0.1:{server.port}/") as response:
+                bodies.append(response.read())
+
+        clients = [Thread(target=fetch) for _ in range(4)]
+        started = time.perf_counter()
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join(timeout=5)
+        elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+        serving.join(timeout=5)
+
+    assert bodies == [b"ok"] * 4
+    assert elapsed < 0.6  # Four sequential requests would take at least 0.8 seconds
+
+
+def test_thread_pool_server_stops_accepting_while_busy():
+    """
+    Test that connections beyond the busy threads are left in the listen backlog rather than queued in memory.
+    """
+    release = Event()
+    accepted = []
+
+    class CountingServer(ThreadPoolWSGIServer):
+        def process_request(self, request, client_address):
+            accepted.append(client_address)
+            super().process_request(request, client_address)
+
+    def blocking_app(environ, start_response):
+        release.wait(timeout=10)
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    server = CountingServer("127.0.0.1", 0, blocking_app, threads=2)
+    serving = Thread(target=server.serve_forever)
+    serving.start()
+    bodies = []
+
+    def fetch():
+        with urlopen(f"http://127.0.0.1:{server.port}/", timeout=10) as response:
+            bodies.append(response.read())
+
+    clients = [Thread(target=fetch) for _ in range(6)]
+    try:
+        for client in clients:
+            client.start()
+        time.sleep(0.3)
+        # Two connections are being handled and one waits in the accept loop for a free thread
+        assert len(accepted) == 3
+    finally:
+        release.set()
+        for client in clients:
+            client.join(timeout=10)
+        server.shutdown()
+        server.server_close()
+        serving.join(timeout=5)
+
+    assert bodies == [b"ok"] * 6
+
+
+def test_concurrent_readers_share_snapshot_rebuild(application, monkeypatch):
+    """
+    Test that threads seeing a stale snapshot wait on a single rebuild.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        monkeypatch: pytest fixture for patching attributes
+    """
+    build = AwardsSnapshot.from_database
+
+    def slow_build():
+        time.sleep(0.1)  # Keep the rebuild in flight while the other threads arrive
+        return build()
+
+    monkeypatch.setattr(AwardsSnapshot, "from_database", staticmethod(slow_build))
+    data_version.bump()
+    executed = metrics.counter("snapshot.rebuild.executed")
+
+    snapshots = []
+
+    def read():
+        with application.app_context():
+            snapshots.append(current_snapshot())
+
+    readers = [Thread(target=read) for _ in range(8)]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join(timeout=5)
+
+    assert len(snapshots) == 8
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert snapshots[0] is snapshot_module._current
+    assert metrics.counter("snapshot.rebuild.executed") == executed + 1
+
+
+def test_thread_pool_server_rejects_overload(application, monkeypatch):
+    """
+    Test that requests beyond the computing and queued ones are answered 503 with Retry-After.
+
+    The server has threads of its own for the computing and queued requests, so the
+    requests beyond them reach the admission controller instead of waiting for a thread.
+
+    Args:
+        application: Flask application fixture from conftest.py
+        monkeypatch: Pytest fixture used to shrink the admission limits and hold a request
+    """
+    release = Event()
+
+    def held_stats(self, *args):
+        release.wait(timeout=10)
+        return {}, 200
+
+    monkeypatch.setattr(AwardsCore, "get_stats", held_stats)
+    monkeypatch.setattr(awards_admission, "max_concurrent", 1)
+    monkeypatch.setattr(awards_admission, "max_queue", 1)
+    monkeypatch.setattr(awards_admission, "queue_timeout", 10)
+    # The held requests do not use the database, so they need not wait for the shared in-memory connection
+    monkeypatch.setattr(shared_connection_lock, "_lock", Semaphore(10))
+
+    server = ThreadPoolWSGIServer("127.0.0.1", 0, application, threads=1,
+                                  admission=awards_admission.max_concurrent + awards_admission.max_queue)
+    serving = Thread(target=server.serve_forever)
+    serving.start()
+    statuses = []
+
+    def fetch():
+        try:
+            with urlopen(f"http://127.0.0.1:{server.port}/awards/stats", timeout=10) as response:
+                statuses.append(response.status)
+        except HTTPError as e:
+            statuses.append((e.code, e.headers["Retry-After"]))
+
+    clients = [Thread(target=fetch) for _ in range(2)]
+    try:
+        for client in clients:
+            client.start()
+        deadline = time.monotonic() + 5
+        while awards_admission.report()["waiting"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        fetch()  # One request computes and one waits, so the queue is full
+        assert statuses == [(503, str(awards_admission.retry_after))]
+    finally:
+        release.set()
+        for client in clients:
+            client.join(timeout=10)
+        server.shutdown()
+        server.server_close()
+        serving.join(timeout=5)
+
+    assert statuses[1:] == [200, 200]
+